@@ -0,0 +1,63 @@
+"""Benchmark exported inference backends against PyTorch on a real scene."""
+
+import argparse
+import time
+from pathlib import Path
+
+from pontos.backends import parity
+from pontos.config import config
+from pontos.detector import VesselDetector
+
+
+def time_tiled(detector: VesselDetector, image: Path, repeats: int) -> tuple:
+    """Return the best wall time of tiled detection and its detections."""
+    detections = detector.detect_tiled(image)  # warmup, excluded from timing
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        detections = detector.detect_tiled(image)
+        best = min(best, time.perf_counter() - start)
+    return best, detections
+
+
+def main():
+    """Compare speed and detections of each backend with the torch baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "image", nargs="?", type=Path, default=Path("tests/test_data/toulon_test.png")
+    )
+    parser.add_argument(
+        "--backends", nargs="+", default=["onnx", "openvino"], help="Backends to test"
+    )
+    parser.add_argument("--precision", default="fp32", help="fp32, fp16 or int8")
+    parser.add_argument(
+        "--calibration-data", help="Dataset YAML calibrating int8 exports"
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--conf", type=float, default=config.confidence_threshold)
+    args = parser.parse_args()
+
+    reference = VesselDetector(device="cpu", confidence_threshold=args.conf)
+    base_time, base_detections = time_tiled(reference, args.image, args.repeats)
+    print(f"torch    : {base_time * 1000:7.1f} ms, {len(base_detections)} vessels")
+
+    for backend in args.backends:
+        detector = VesselDetector(
+            device="cpu",
+            confidence_threshold=args.conf,
+            backend=backend,
+            precision=args.precision,
+            calibration_data=args.calibration_data,
+        )
+        elapsed, detections = time_tiled(detector, args.image, args.repeats)
+        scores = parity(base_detections, detections)
+        print(
+            f"{backend:9s}: {elapsed * 1000:7.1f} ms, {len(detections)} vessels, "
+            f"speedup {base_time / elapsed:.2f}x, recall {scores['recall']:.3f}, "
+            f"precision {scores['precision']:.3f}, "
+            f"max conf diff {scores['max_conf_diff']:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Report model cold-start versus warm latency through the model registry."""
+
+import argparse
+import time
+
+from pontos.detector import VesselDetector
+
+
+def main():
+    """Load, warm up and reuse a model, printing each stage's cost."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--device", default=None)
+    parser.add_argument("--backend", default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    detector = VesselDetector(device=args.device, backend=args.backend)
+    stats = detector.warmup(batch_size=args.batch_size)
+    print(f"Device        : {detector.get_device_name()} ({detector.backend})")
+    print(f"Weight load   : {stats.load_seconds * 1000:8.1f} ms")
+    print(f"Cold inference: {stats.cold_latency * 1000:8.1f} ms")
+    print(f"Warm inference: {stats.warm_latency * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    second = VesselDetector(device=args.device, backend=args.backend)
+    model = second.model
+    if model is not detector.model:
+        raise RuntimeError("Second detector did not reuse the shared model")
+    print(f"Shared reuse  : {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark grid-hash deduplication against pairwise comparison."""
+
+import argparse
+import time
+
+import numpy as np
+
+from pontos.dedup import deduplicate
+from pontos.geo import _METERS_PER_DEGREE
+
+
+def fleet(count: int, repeats: int, rng: np.random.Generator):
+    """Vessels spread over the Mediterranean, each reported ``repeats`` times."""
+    vessels = np.column_stack(
+        [rng.uniform(-5.0, 35.0, count), rng.uniform(31.0, 45.0, count)]
+    )
+    # Repeated reports scatter by up to ~10 m around the vessel
+    coords = np.repeat(vessels, repeats, axis=0)
+    coords += rng.normal(scale=5.0 / _METERS_PER_DEGREE, size=coords.shape)
+    confidence = rng.random(len(coords))
+    return coords, confidence
+
+
+def pairwise(coords: np.ndarray, confidence: np.ndarray, distance: float):
+    """Greedy merge comparing each detection with every one kept so far."""
+    scale = np.column_stack([np.cos(np.radians(coords[:, 1])), np.ones(len(coords))])
+    metres = coords * scale * _METERS_PER_DEGREE
+    kept = []
+    for idx in np.argsort(-confidence, kind="stable"):
+        if not kept or np.hypot(*(metres[kept] - metres[idx]).T).min() > distance:
+            kept.append(idx)
+    return np.sort(kept)
+
+
+def main():
+    """Time both approaches on growing synthetic fleets."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", default="10000,100000,1000000,5000000", help="Detection counts"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Reports per vessel")
+    parser.add_argument("--distance", type=float, default=50.0)
+    parser.add_argument(
+        "--pairwise-limit", type=int, default=10_000, help="Largest pairwise run"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'detections':>12} {'kept':>10} {'grid s':>8} {'pairwise s':>11}")
+    for size in map(int, args.sizes.split(",")):
+        coords, confidence = fleet(size // args.repeats, args.repeats, rng)
+
+        start = time.perf_counter()
+        keep = deduplicate(coords, confidence, distance=args.distance)
+        grid = time.perf_counter() - start
+
+        reference = "-"
+        if len(coords) <= args.pairwise_limit:
+            start = time.perf_counter()
+            expected = pairwise(coords, confidence, args.distance)
+            reference = f"{time.perf_counter() - start:.2f}"
+            assert np.array_equal(keep, expected), "grid and pairwise disagree"
+
+        print(f"{len(coords):>12,} {len(keep):>10,} {grid:>8.2f} {reference:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark VesselDetector.detect_batch against a loop over detect()."""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from pontos.detector import VesselDetector
+
+
+def make_scenes(directory: Path, count: int, size: int) -> list:
+    """Write random RGB scenes to disk and return their paths."""
+    paths = []
+    for idx in range(count):
+        path = directory / f"scene_{idx}.png"
+        pixels = np.random.randint(0, 255, (size, size, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(path)
+        paths.append(path)
+    return paths
+
+
+def main():
+    """Time both code paths on the same images and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("images", nargs="*", type=Path, help="Images to score")
+    parser.add_argument("--count", type=int, default=32, help="Synthetic scenes")
+    parser.add_argument("--size", type=int, default=1024, help="Synthetic size")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args()
+
+    detector = VesselDetector(device=args.device)
+    print(f"Device: {detector.get_device_name()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        images = args.images or make_scenes(Path(tmp), args.count, args.size)
+
+        # Warm up kernels so neither path pays one-time setup costs
+        detector.detect_batch(images[: args.batch_size], batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        looped = [detector.detect(image) for image in images]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = detector.detect_batch(images, batch_size=args.batch_size)
+        batch_time = time.perf_counter() - start
+
+    n = len(images)
+    print(f"detect() loop : {loop_time:.2f}s ({n / loop_time:.1f} img/s)")
+    print(f"detect_batch(): {batch_time:.2f}s ({n / batch_time:.1f} img/s)")
+    print(f"Speedup       : {loop_time / batch_time:.2f}x")
+    print(
+        "Detections    : "
+        f"{sum(map(len, looped))} (loop) vs {sum(map(len, batched))} (batch)"
+    )
+
+
+if __name__ == "__main__":
+    main()
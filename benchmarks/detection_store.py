@@ -0,0 +1,89 @@
+"""Benchmark DetectionStore bulk inserts and bbox/time queries."""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from pontos.detections import Detections
+from pontos.store import DetectionStore
+
+# One year of passes over the western Mediterranean, 4 per day
+AREA = (2.0, 40.0, 10.0, 44.0)
+SIZE = (20000, 10000)
+START = datetime(2025, 1, 1)
+
+QUERIES = {
+    "harbour, 1 week": dict(
+        bbox=(5.85, 43.08, 6.05, 43.18), time_range=("2025-06-01", "2025-06-07")
+    ),
+    "harbour, all time": dict(bbox=(5.85, 43.08, 6.05, 43.18)),
+    "whole area, 1 day": dict(bbox=AREA, time_range=("2025-06-01", "2025-06-01")),
+    "gulf, 1 month, conf>=0.8": dict(
+        bbox=(3.0, 42.0, 6.0, 43.5),
+        time_range=("2025-03-01", "2025-03-31"),
+        min_confidence=0.8,
+    ),
+}
+
+
+def fill(store: DetectionStore, rows: int, batch: int) -> float:
+    """Insert random detections scene by scene; return rows per second."""
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for index in range(rows // batch):
+        corners = rng.uniform(0, SIZE[1] - 40, size=(batch, 2)) * (2, 1)
+        detections = Detections(
+            np.hstack([corners, corners + 30]),
+            rng.uniform(0.05, 1.0, batch),
+            np.zeros(batch),
+        )
+        acquired = START + timedelta(hours=6 * (index % 1460))
+        store.add(detections, AREA, SIZE, acquired, "west-med")
+    return rows / (time.perf_counter() - start)
+
+
+def timed(func, repeats: int, **kwargs):
+    """Median wall time of func(**kwargs) in seconds, and its last result."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(**kwargs)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)), result
+
+
+def main():
+    """Fill a store (or reuse one) and time representative queries."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000, help="Rows per scene")
+    parser.add_argument(
+        "--path", type=Path, default=None, help="Store to fill, or reuse if present"
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path or Path(tmp) / "detections.gpkg"
+        with DetectionStore(path) as store:
+            if store.count() == 0:
+                rate = fill(store, args.rows, args.batch)
+                print(f"Inserted {args.rows:,} rows at {rate:,.0f} rows/s")
+            print(f"{store.count():,} rows, {path.stat().st_size / 2**20:.0f} MiB")
+
+            print(f"{'query':>26} {'rows':>8} {'count ms':>9} {'query ms':>9}")
+            for name, filters in QUERIES.items():
+                count_time, count = timed(store.count, args.repeats, **filters)
+                query_time, _ = timed(store.query, args.repeats, **filters)
+                print(
+                    f"{name:>26} {count:>8} {count_time * 1000:9.1f} "
+                    f"{query_time * 1000:9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
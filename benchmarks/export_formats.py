@@ -0,0 +1,125 @@
+"""Benchmark detection exporters: write time, file size and peak memory."""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from pontos.detections import Detections
+from pontos.geo import EXPORT_FORMATS, GeoExporter
+
+BBOX = (5.85, 43.08, 6.05, 43.18)
+SIZE = (10240, 10240)
+
+# (format, gzip) pairs; "indented" is the former json.dump(indent=2) writer
+CASES = [
+    ("indented", False),
+    ("geojson", False),
+    ("geojson", True),
+    ("geojsonseq", False),
+    ("geojsonseq", True),
+    ("flatgeobuf", False),
+    ("geoparquet", False),
+]
+
+
+def synthetic_detections(count: int) -> Detections:
+    """Random vessel boxes over a large mosaic."""
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, SIZE[0] - 40, size=(count, 2))
+    return Detections(
+        np.hstack([corners, corners + 30]),
+        rng.uniform(0.05, 1.0, count),
+        np.zeros(count, dtype=np.int64),
+    )
+
+
+def write_indented(detections: Detections, path: Path) -> None:
+    """Build the whole FeatureCollection in memory and dump it indented."""
+    features = []
+    for idx, det in enumerate(detections):
+        lon, lat = GeoExporter._pixel_to_geo(*det["center"], BBOX, SIZE)
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {
+                    "id": idx,
+                    "confidence": det["confidence"],
+                    "class": det["class"],
+                },
+            }
+        )
+    with open(path, "w") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f, indent=2)
+
+
+def run_case(name: str, compress: bool, count: int, directory: Path) -> dict:
+    """Write one export in this process and measure it."""
+    detections = synthetic_detections(count)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    suffix = EXPORT_FORMATS.get(name, ".geojson") + (".gz" if compress else "")
+    path = directory / f"vessels{suffix}"
+    start = time.perf_counter()
+    if name == "indented":
+        write_indented(detections, path)
+    else:
+        GeoExporter.export(detections, BBOX, SIZE, path, name)
+    seconds = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "seconds": seconds,
+        "bytes": path.stat().st_size,
+        "peak_mib": (peak - baseline) / 1024,
+    }
+
+
+def main():
+    """Run each exporter in a fresh process so peak memory is its own."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--detections", type=int, default=1_000_000)
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.case:
+            name, compress = args.case.split(":")
+            result = run_case(name, compress == "gz", args.detections, Path(tmp))
+            print(json.dumps(result))
+            return
+
+        print(f"{'format':>16} {'write s':>8} {'MiB':>8} {'peak MiB':>9}")
+        for name, compress in CASES:
+            case = f"{name}:{'gz' if compress else ''}"
+            try:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--case", case]
+                    + ["--detections", str(args.detections)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+            except subprocess.CalledProcessError as error:
+                # pyogrio and pyarrow are optional
+                print(
+                    f"{case.rstrip(':'):>16} failed: {error.stderr.strip().splitlines()[-1]}"
+                )
+                continue
+
+            result = json.loads(output)
+            print(
+                f"{case.rstrip(':'):>16} {result['seconds']:8.2f} "
+                f"{result['bytes'] / 2**20:8.1f} {result['peak_mib']:9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
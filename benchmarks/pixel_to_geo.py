@@ -0,0 +1,61 @@
+"""Benchmark the per-point pixel-to-geo loop against the array transform."""
+
+import argparse
+import time
+
+import numpy as np
+from pyproj import Transformer
+
+from pontos.geo import GeoExporter, utm_crs
+
+
+def timed(func, repeats: int) -> float:
+    """Median wall time of func() in seconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def main():
+    """Transform the same pixel coordinates with each path and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bbox", default="5.85,43.08,6.05,43.18")
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    bbox = tuple(map(float, args.bbox.split(",")))
+    size = (args.size, args.size)
+    points = np.random.default_rng(0).uniform(0, args.size, size=(args.points, 2))
+
+    crs = utm_crs(bbox)
+    to_utm = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    utm_bbox = (
+        *to_utm.transform(bbox[0], bbox[1]),
+        *to_utm.transform(bbox[2], bbox[3]),
+    )
+
+    paths = {
+        "loop": lambda: [
+            GeoExporter._pixel_to_geo(x, y, bbox, size) for x, y in points.tolist()
+        ],
+        "array": lambda: GeoExporter.pixels_to_geo(points, bbox, size),
+        f"array {crs}": lambda: GeoExporter.pixels_to_geo(points, utm_bbox, size, crs),
+    }
+
+    print(f"{'path':>16} {'ms':>9} {'Mpoints/s':>10}")
+    for name, func in paths.items():
+        seconds = timed(func, args.repeats)
+        print(f"{name:>16} {seconds * 1000:9.1f} {args.points / seconds / 1e6:10.2f}")
+
+    loop = np.asarray(paths["loop"]())
+    array = paths["array"]()
+    print(f"max |loop - array| = {np.abs(loop - array).max():.2e} deg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare PNG and raw TIFF Sentinel Hub responses: wall time and bytes per scene."""
+
+import argparse
+import time
+
+import numpy as np
+
+from pontos.sentinel import RESPONSE_FORMATS, SentinelDataSource
+
+
+def main():
+    """Download the same scene in each format, timing transfer and decoding."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bbox", default="5.85,43.08,6.05,43.18")
+    parser.add_argument("--date-start", default="2026-01-01")
+    parser.add_argument("--date-end", default="2026-01-31")
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    bbox = tuple(map(float, args.bbox.split(",")))
+    time_range = (args.date_start, args.date_end)
+    sentinel = SentinelDataSource()
+
+    scenes = {}
+    print(f"{'format':>6} {'KiB':>9} {'download ms':>12} {'decode ms':>10}")
+    for name in RESPONSE_FORMATS:
+        transfer, decode = [], []
+        for _ in range(args.repeats):
+            request = sentinel._scene_request(
+                bbox, time_range, (args.size, args.size), 0.2, name
+            )
+            start = time.perf_counter()
+            response = request.get_data(decode_data=False)[0]
+            transfer.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            scenes[name] = np.asarray(response.decode())
+            decode.append(time.perf_counter() - start)
+
+        print(
+            f"{name:>6} {len(response.content) / 1024:9.1f} "
+            f"{np.median(transfer) * 1000:12.1f} {np.median(decode) * 1000:10.1f}"
+        )
+
+    png, tiff = scenes["png"].astype(np.int16), scenes["tiff"].astype(np.int16)
+    print(f"max |png - tiff| = {np.abs(png - tiff).max()} (uint8 levels)")
+
+
+if __name__ == "__main__":
+    main()
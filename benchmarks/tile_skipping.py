@@ -0,0 +1,83 @@
+"""Benchmark VesselDetector.detect_incremental against full tiled detection."""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+from PIL import Image
+from torchvision.ops import box_iou
+
+from pontos.detector import VesselDetector
+
+
+def synthetic_passes(base: np.ndarray, count: int, noise: float, seed: int) -> list:
+    """Derive later passes from one scene: sensor noise plus one new bright patch."""
+    rng = np.random.default_rng(seed)
+    height, width = base.shape[:2]
+    passes = [base]
+    for _ in range(count - 1):
+        scene = base.astype(np.float32) + rng.normal(0, noise, base.shape)
+        y, x = rng.integers(0, height - 12), rng.integers(0, width - 20)
+        scene[y : y + 12, x : x + 20] = 255
+        passes.append(np.clip(scene, 0, 255).astype(np.uint8))
+    return passes
+
+
+def matched(full, incremental, iou: float = 0.5) -> int:
+    """Number of full-run boxes also found by the incremental run."""
+    if not len(full) or not len(incremental):
+        return 0
+    overlaps = box_iou(torch.from_numpy(full.xyxy), torch.from_numpy(incremental.xyxy))
+    return int((overlaps.max(dim=1).values >= iou).sum())
+
+
+def main():
+    """Run both modes over consecutive passes and report skipped tiles."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "images", nargs="*", type=Path, help="Consecutive passes of one area"
+    )
+    parser.add_argument("--base", type=Path, default=Path("data/toulon_sentinel2.tiff"))
+    parser.add_argument("--passes", type=int, default=5, help="Synthetic passes")
+    parser.add_argument("--noise", type=float, default=1.0, help="Synthetic noise")
+    parser.add_argument("--tolerance", type=float, default=8.0)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args()
+
+    if args.images:
+        passes = [VesselDetector._load_image(path) for path in args.images]
+    else:
+        with Image.open(args.base) as img:
+            base = np.asarray(img.convert("RGB"))
+        passes = synthetic_passes(base, args.passes, args.noise, seed=0)
+
+    detector = VesselDetector(device=args.device)
+    detector.warmup()
+
+    memory = None
+    print(
+        f"{'pass':>4} {'skipped':>8} {'full s':>7} {'incr s':>7} {'full':>5} "
+        f"{'incr':>5} {'matched':>7}"
+    )
+    for index, scene in enumerate(passes):
+        start = time.perf_counter()
+        full = detector.detect_tiled(scene)
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        incremental, memory = detector.detect_incremental(
+            scene, memory, tolerance=args.tolerance
+        )
+        incremental_time = time.perf_counter() - start
+
+        print(
+            f"{index:>4} {memory.skip_ratio:>8.0%} {full_time:>7.2f} "
+            f"{incremental_time:>7.2f} {len(full):>5} {len(incremental):>5} "
+            f"{matched(full, incremental):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
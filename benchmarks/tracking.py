@@ -0,0 +1,80 @@
+"""Benchmark track linking throughput on synthetic fleets."""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from pontos.geo import _METERS_PER_DEGREE
+from pontos.tracking import TrackLinker
+
+
+def main():
+    """Link synthetic acquisitions of a moving fleet and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vessels", type=int, default=100_000)
+    parser.add_argument("--epochs", type=int, default=6)
+    parser.add_argument(
+        "--interval", type=float, default=10.0, help="Minutes between epochs"
+    )
+    parser.add_argument(
+        "--bbox", default="-5.0,31.0,35.0,45.0", help="Area the fleet sails in"
+    )
+    parser.add_argument("--speed", type=float, default=8.0, help="Top speed (m/s)")
+    parser.add_argument("--noise", type=float, default=10.0, help="Position noise (m)")
+    parser.add_argument(
+        "--missed", type=float, default=0.05, help="Share of vessels not detected"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    min_lon, min_lat, max_lon, max_lat = map(float, args.bbox.split(","))
+    positions = np.column_stack(
+        [
+            rng.uniform(min_lon, max_lon, args.vessels),
+            rng.uniform(min_lat, max_lat, args.vessels),
+        ]
+    )
+    heading = rng.uniform(0, 2 * np.pi, args.vessels)
+    speed = rng.uniform(0, args.speed, args.vessels)
+
+    linker = TrackLinker(max_speed=args.speed, min_points=1)
+    start, step = datetime(2026, 1, 5, 10, 27), timedelta(minutes=args.interval)
+    owner = {}
+    tracks = []
+
+    print(f"{'epoch':>5} {'detections':>10} {'ms':>8} {'det/s':>10} {'active':>8}")
+    for epoch in range(args.epochs):
+        seen = rng.random(args.vessels) >= args.missed
+        coords = positions[seen] + rng.normal(
+            scale=args.noise / _METERS_PER_DEGREE, size=(seen.sum(), 2)
+        )
+        owner.update(zip(map(tuple, coords.tolist()), np.flatnonzero(seen).tolist()))
+
+        begin = time.perf_counter()
+        tracks += linker.update(coords, rng.random(len(coords)), start + epoch * step)
+        seconds = time.perf_counter() - begin
+        print(
+            f"{epoch:>5} {len(coords):>10,} {seconds * 1000:>8.0f} "
+            f"{len(coords) / seconds:>10,.0f} {linker.active:>8,}"
+        )
+
+        # Sail on; degrees of longitude shrink with latitude
+        metres = speed * args.interval * 60
+        positions[:, 0] += (
+            metres * np.sin(heading) / np.cos(np.radians(positions[:, 1]))
+        ) / _METERS_PER_DEGREE
+        positions[:, 1] += metres * np.cos(heading) / _METERS_PER_DEGREE
+
+    tracks += linker.finish()
+    links = correct = 0
+    for track in tracks:
+        vessels = [owner[point] for point in track.coords]
+        links += len(vessels) - 1
+        correct += sum(a == b for a, b in zip(vessels, vessels[1:]))
+    print(f"{len(tracks):,} tracks, {correct / max(links, 1):.1%} of links correct")
+
+
+if __name__ == "__main__":
+    main()
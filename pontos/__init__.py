@@ -1,16 +1,63 @@
 """Pontos: Global naval surveillance using Sentinel-2 and YOLO11s."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
+# Config is light and must stay bound to the instance, not the submodule
 from pontos.config import config, PontosConfig
-from pontos.detector import VesselDetector
-from pontos.sentinel import SentinelDataSource
-from pontos.geo import GeoExporter
+
+# Heavy modules (torch, ultralytics, sentinelhub) load on first attribute access
+_LAZY_ATTRIBUTES = {
+    "Detections": "pontos.detections",
+    "VesselDetector": "pontos.detector",
+    "DetectorPool": "pontos.pool",
+    "SentinelDataSource": "pontos.sentinel",
+    "GeoExporter": "pontos.geo",
+    "MonitorState": "pontos.state",
+    "LandMask": "pontos.landmask",
+    "DetectionStore": "pontos.store",
+    "TrackLinker": "pontos.tracking",
+}
+
+if TYPE_CHECKING:
+    from pontos.detections import Detections
+    from pontos.detector import VesselDetector
+    from pontos.geo import GeoExporter
+    from pontos.landmask import LandMask
+    from pontos.pool import DetectorPool
+    from pontos.sentinel import SentinelDataSource
+    from pontos.state import MonitorState
+    from pontos.store import DetectionStore
+    from pontos.tracking import TrackLinker
 
 __all__ = [
     "config",
     "PontosConfig",
+    "Detections",
     "VesselDetector",
+    "DetectorPool",
     "SentinelDataSource",
     "GeoExporter",
+    "MonitorState",
+    "LandMask",
+    "DetectionStore",
+    "TrackLinker",
 ]
+
+
+def __getattr__(name: str):
+    """Import public classes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'pontos' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazy attributes alongside loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,241 @@
+"""Exported inference backends (ONNX Runtime, OpenVINO) for the vessel model."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import torch
+from torchvision.ops import box_iou
+from ultralytics import YOLO
+
+from pontos.detections import Detections
+
+BACKENDS = ("torch", "onnx", "openvino")
+PRECISIONS = ("fp32", "fp16", "int8")
+
+
+@lru_cache(maxsize=None)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file; mtime and size are part of the cache key only."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def weights_hash(model_path: Path) -> str:
+    """
+    Compute the SHA-256 of a weights file, cached per process.
+
+    Args:
+        model_path: Path to the weights file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    stat = Path(model_path).stat()
+    return _hash_file(str(Path(model_path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def artifact_path(
+    model_path: Path, backend: str, imgsz: int, batch: int, precision: str = "fp32"
+) -> Path:
+    """
+    Location of the cached export of a weights file.
+
+    The name embeds the weights hash, so retrained weights never pick up a
+    stale export.
+
+    Args:
+        model_path: Path to the PyTorch weights
+        backend: Export backend ('onnx' or 'openvino')
+        imgsz: Static input size in pixels
+        batch: Static batch size
+        precision: 'fp32', 'fp16' or 'int8'
+
+    Returns:
+        Path of the ONNX file or OpenVINO model directory next to the weights
+    """
+    model_path = Path(model_path)
+    stem = f"{model_path.stem}-{weights_hash(model_path)[:12]}-{imgsz}-b{batch}-{precision}"
+    suffix = ".onnx" if backend == "onnx" else "_openvino_model"
+    return model_path.with_name(stem + suffix)
+
+
+def export_model(
+    model_path: Path,
+    backend: str,
+    imgsz: int,
+    batch: int,
+    precision: str = "fp32",
+    data: Optional[str] = None,
+) -> Path:
+    """
+    Export weights to an inference backend once and return the cached artifact.
+
+    The export runs in a scratch directory next to the weights and is moved
+    into place with an atomic rename, so concurrent workers exporting the
+    same weights never see a partial artifact.
+
+    Args:
+        model_path: Path to the PyTorch weights
+        backend: 'torch', 'onnx' or 'openvino'
+        imgsz: Static input size in pixels (should match config.patch_size)
+        batch: Static batch size (should match config.batch_size)
+        precision: 'fp32', 'fp16' or 'int8'
+        data: Calibration dataset YAML, required for int8
+
+    Returns:
+        Path to load with ultralytics.YOLO (the weights themselves for 'torch')
+
+    Raises:
+        ValueError: If the backend or precision is unknown, or int8 is
+            requested without calibration data
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if precision not in PRECISIONS:
+        raise ValueError(
+            f"Unknown precision '{precision}', expected one of {PRECISIONS}"
+        )
+
+    model_path = Path(model_path)
+    if backend == "torch":
+        return model_path
+
+    # Ultralytics falls back to downloading a sample dataset when data is unset
+    if precision == "int8" and not data:
+        raise ValueError(
+            "int8 export needs calibration data, set data or CALIBRATION_DATA"
+        )
+
+    target = artifact_path(model_path, backend, imgsz, batch, precision)
+    if target.exists():
+        return target
+
+    with tempfile.TemporaryDirectory(dir=model_path.parent) as tmp:
+        # Ultralytics writes exports next to the weights, so stage a private copy
+        staged = Path(tmp) / model_path.name
+        shutil.copy2(model_path, staged)
+
+        exported = YOLO(str(staged)).export(
+            format=backend,
+            imgsz=imgsz,
+            batch=batch,
+            dynamic=False,
+            # half/int8 are deprecated, and older releases left fp16 ONNX
+            # exports on CPU as fp32
+            quantize=precision,
+            data=data,
+            verbose=False,
+        )
+
+        try:
+            os.replace(exported, target)
+        except OSError:
+            # Another process won the race for an OpenVINO directory
+            if not target.exists():
+                raise
+
+    return target
+
+
+def limit_threads(num_threads: int) -> None:
+    """
+    Cap intra-op threads of every inference runtime in this process.
+
+    Ultralytics creates ONNX Runtime sessions and compiles OpenVINO models
+    itself, with each runtime's default of one thread per core. Pool workers
+    split the cores between them, so this sets torch's thread count and
+    makes sessions created afterwards use ``num_threads`` as well, unless
+    they ask for a count of their own. Meant for dedicated worker processes.
+
+    Args:
+        num_threads: Intra-op threads per inference call
+    """
+    torch.set_num_threads(num_threads)
+
+    try:
+        import onnxruntime
+    except ImportError:
+        pass
+    else:
+        session = getattr(onnxruntime.InferenceSession, "_base", None)
+        session = session or onnxruntime.InferenceSession
+
+        class LimitedSession(session):
+            _base = session
+
+            def __init__(self, path_or_bytes, sess_options=None, *args, **kwargs):
+                sess_options = sess_options or onnxruntime.SessionOptions()
+                if not sess_options.intra_op_num_threads:
+                    sess_options.intra_op_num_threads = num_threads
+                super().__init__(path_or_bytes, sess_options, *args, **kwargs)
+
+        onnxruntime.InferenceSession = LimitedSession
+
+    try:
+        import openvino
+    except ImportError:
+        pass
+    else:
+        core = getattr(openvino.Core, "_base", None) or openvino.Core
+
+        class LimitedCore(core):
+            _base = core
+
+            def compile_model(self, model, device_name=None, config=None, **kwargs):
+                if device_name is None or device_name.startswith("CPU"):
+                    config = {"INFERENCE_NUM_THREADS": num_threads, **(config or {})}
+                return super().compile_model(model, device_name, config, **kwargs)
+
+        openvino.Core = LimitedCore
+
+
+def parity(
+    reference: Detections, candidate: Detections, iou_threshold: float = 0.5
+) -> Dict[str, float]:
+    """
+    Compare detections of an exported backend against the PyTorch reference.
+
+    Each reference box is matched to its best-overlapping candidate box.
+
+    Args:
+        reference: Detections from the 'torch' backend
+        candidate: Detections from the exported backend on the same image
+        iou_threshold: Minimum IoU for two boxes to count as the same vessel
+
+    Returns:
+        Dict with 'recall' (share of reference boxes recovered), 'precision'
+        (share of candidate boxes matched), 'mean_iou' and 'max_conf_diff'
+        over matched pairs
+    """
+    if len(reference) == 0 or len(candidate) == 0:
+        matched = float(len(reference) == len(candidate))
+        return {
+            "recall": matched,
+            "precision": matched,
+            "mean_iou": matched,
+            "max_conf_diff": 0.0,
+        }
+
+    iou = box_iou(torch.from_numpy(reference.xyxy), torch.from_numpy(candidate.xyxy))
+    best_iou, best_idx = iou.max(dim=1)
+    hits = (best_iou >= iou_threshold).numpy()
+    pairs = best_idx.numpy()[hits]
+    conf_diff = np.abs(reference.conf[hits] - candidate.conf[pairs])
+
+    return {
+        "recall": float(hits.mean()),
+        "precision": float(len(np.unique(pairs)) / len(candidate)),
+        "mean_iou": (
+            float(best_iou[torch.from_numpy(hits)].mean()) if hits.any() else 0.0
+        ),
+        "max_conf_diff": float(conf_diff.max()) if hits.any() else 0.0,
+    }
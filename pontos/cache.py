@@ -0,0 +1,300 @@
+"""Content-addressed caches for scenes and detection results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from pontos.detections import Detections
+
+# A cache entry is one array (.npy) or a dict of named arrays (.npz)
+Entry = Union[np.ndarray, Dict[str, np.ndarray]]
+
+
+def cache_key(**params: Any) -> str:
+    """
+    Hash request parameters into a stable cache key.
+
+    Args:
+        **params: JSON-serializable parameters identifying the content
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def image_fingerprint(image: Union[Path, np.ndarray]) -> str:
+    """
+    Hash image content for use in cache keys.
+
+    Arrays are hashed over their raw pixel buffer together with shape and
+    dtype; paths are hashed over the encoded file bytes, without decoding.
+
+    Args:
+        image: Image path or array
+
+    Returns:
+        Hex BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(image, np.ndarray):
+        digest.update(f"{image.shape}{image.dtype.str}".encode())
+        digest.update(np.ascontiguousarray(image).data)
+    else:
+        with open(image, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskCache:
+    """
+    Size-bounded LRU cache of numpy arrays stored as .npy or .npz files.
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent workers sharing the directory never read a partial entry.
+    File modification times record last access and drive LRU eviction,
+    which keeps the policy consistent across processes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, suffix: str = ".npy"):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            directory: Directory holding the cache entries
+            max_bytes: Total size above which least recently used entries
+                are evicted
+            suffix: '.npy' for single-array entries or '.npz' for dicts of
+                named arrays
+        """
+        if suffix not in (".npy", ".npz"):
+            raise ValueError(f"Unknown cache suffix '{suffix}'")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.stats = CacheStats()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached array (or dict of arrays), or None on a miss
+        """
+        path = self._path(key)
+        try:
+            if self.suffix == ".npz":
+                with np.load(path) as data:
+                    entry = {name: data[name] for name in data.files}
+            else:
+                entry = np.load(path)
+            os.utime(path)
+        except (FileNotFoundError, ValueError, EOFError, zipfile.BadZipFile):
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Entry) -> Path:
+        """
+        Store an entry atomically, then evict down to the size bound.
+
+        Args:
+            key: Cache key from cache_key()
+            entry: Array, or dict of named arrays for '.npz' caches
+
+        Returns:
+            Path of the stored entry
+        """
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if self.suffix == ".npz":
+                    np.savez(f, **entry)
+                else:
+                    np.save(f, entry)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries evicted
+        """
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another worker
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        self.stats.evictions += evicted
+        return evicted
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored entries."""
+        return sum(
+            path.stat().st_size for path in self.directory.glob(f"*{self.suffix}")
+        )
+
+    def __contains__(self, key: str) -> bool:
+        """Whether an entry exists, without counting a lookup."""
+        return self._path(key).exists()
+
+    def _path(self, key: str) -> Path:
+        """File holding one entry."""
+        return self.directory / f"{key}{self.suffix}"
+
+
+class ResultCache:
+    """
+    Memory and disk cache of raw detector predictions.
+
+    Entries hold every box scoring at least ``floor``, so a lookup at any
+    confidence threshold at or above the floor is answered by filtering the
+    cached boxes instead of running the model. NMS keeps a box only when no
+    higher-scoring box overlaps it, so filtering after NMS gives the same
+    boxes as running the model at the higher threshold.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entries: int = 1024,
+        floor: float = 0.01,
+    ):
+        """
+        Create the cache tiers.
+
+        Args:
+            directory: Directory of the disk tier (memory only if None)
+            max_bytes: Size bound of the disk tier
+            max_entries: Number of entries kept in the memory tier
+            floor: Confidence threshold the model is run at on a miss
+        """
+        self.floor = floor
+        self.max_entries = max_entries
+        self.disk = (
+            DiskCache(directory, max_bytes, suffix=".npz") if directory else None
+        )
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, Detections]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Detections]:
+        """
+        Look up predictions, promoting disk hits to the memory tier.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached detections down to the floor, or None on a miss
+        """
+        with self._lock:
+            detections = self._memory.get(key)
+            if detections is not None:
+                self._memory.move_to_end(key)
+
+        if detections is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                names = json.loads(str(entry["names"]))
+                detections = Detections(
+                    entry["xyxy"],
+                    entry["conf"],
+                    entry["class_id"],
+                    {int(idx): name for idx, name in names.items()},
+                )
+                self._remember(key, detections)
+
+        if detections is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return detections
+
+    def put(self, key: str, detections: Detections) -> None:
+        """
+        Store predictions in both tiers.
+
+        Args:
+            key: Cache key from cache_key()
+            detections: Detections computed at the cache floor
+        """
+        self._remember(key, detections)
+        if self.disk is not None:
+            self.disk.put(
+                key,
+                {
+                    "xyxy": detections.xyxy,
+                    "conf": detections.conf,
+                    "class_id": detections.class_id,
+                    "names": np.array(json.dumps(detections.names)),
+                },
+            )
+
+    def __len__(self) -> int:
+        """Number of entries in the memory tier."""
+        return len(self._memory)
+
+    def _remember(self, key: str, detections: Detections) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        with self._lock:
+            self._memory[key] = detections
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self.stats.evictions += 1
@@ -2,9 +2,39 @@
 
 import click
 from pathlib import Path
-from pontos.detector import VesselDetector
-from pontos.sentinel import SentinelDataSource
-from pontos.geo import GeoExporter
+
+# Detector, Sentinel Hub and export modules are imported inside commands so
+# that `pontos --help` does not pay for torch, ultralytics and sentinelhub.
+
+
+# Mirrors pontos.geo.EXPORT_FORMATS, kept here so `--help` skips numpy
+EXPORT_FORMATS = {
+    "geojson": ".geojson",
+    "geojsonseq": ".geojsons",
+    "flatgeobuf": ".fgb",
+    "geoparquet": ".parquet",
+}
+
+
+def _output_path(path: Path, export_format: str, compress: bool) -> Path:
+    """
+    Resolve the export path for a format.
+
+    Args:
+        path: Requested path; without a suffix, the format's one is added
+        export_format: Key of EXPORT_FORMATS
+        compress: Append '.gz' (GeoJSON formats only)
+
+    Returns:
+        Output path
+    """
+    if compress and export_format not in ("geojson", "geojsonseq"):
+        raise click.UsageError("--gzip only applies to geojson and geojsonseq")
+    if not path.suffix:
+        path = path.with_suffix(EXPORT_FORMATS[export_format])
+    if compress and path.suffix != ".gz":
+        path = path.with_name(path.name + ".gz")
+    return path
 
 
 @click.group()
@@ -19,30 +49,408 @@ def cli():
 )
 @click.option("--date-start", required=True, help="Start date: YYYY-MM-DD")
 @click.option("--date-end", required=True, help="End date: YYYY-MM-DD")
-@click.option("--output", "-o", default="vessels.geojson", help="Output GeoJSON path")
+@click.option(
+    "--output", "-o", default=None, help="Output path (default: vessels.<format>)"
+)
 @click.option("--conf", default=0.05, help="Confidence threshold")
-def scan(bbox, date_start, date_end, output, conf):
+@click.option(
+    "--save-scene",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Also write the downloaded scene to this PNG path",
+)
+@click.option(
+    "--resolution",
+    type=float,
+    default=None,
+    help="Download at this ground resolution in meters (e.g. 10) instead of a "
+    "fixed 1024 px scene; large areas are split and stitched",
+)
+@click.option(
+    "--cloud-mask",
+    is_flag=True,
+    help="Also fetch cloud probability and skip cloudy tiles before inference",
+)
+@click.option(
+    "--max-tile-cloud",
+    default=0.5,
+    help="Largest cloudy share of a tile still inferred with --cloud-mask",
+)
+@click.option(
+    "--land-mask",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Land polygon dataset (GeoJSON, or any format geopandas reads); "
+    "tiles entirely on land are skipped before inference",
+)
+@click.option(
+    "--coast-buffer",
+    default=200.0,
+    help="Meters of land along the coast still treated as water with "
+    "--land-mask, so harbour berths are kept",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(EXPORT_FORMATS),
+    default="geojson",
+    help="Detection export format",
+)
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    help="Gzip GeoJSON and GeoJSONSeq output",
+)
+@click.option(
+    "--merge-distance",
+    type=float,
+    default=None,
+    help="Merge detections closer than this many meters into the most "
+    "confident one before export",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also append the detections to this GeoPackage detection store",
+)
+def scan(
+    bbox,
+    date_start,
+    date_end,
+    output,
+    conf,
+    save_scene,
+    resolution,
+    cloud_mask,
+    max_tile_cloud,
+    land_mask,
+    coast_buffer,
+    export_format,
+    compress,
+    merge_distance,
+    store_path,
+):
     """Scan area of interest for vessels."""
+    from pontos.detector import VesselDetector
+    from pontos.geo import GeoExporter
+    from pontos.sentinel import SentinelDataSource
+
+    if cloud_mask and resolution is not None:
+        raise click.UsageError("--cloud-mask cannot be combined with --resolution")
+    output = _output_path(Path(output or "vessels"), export_format, compress)
+
     bbox_coords = tuple(map(float, bbox.split(",")))
 
     click.echo(f"Scanning {bbox_coords}...")
 
-    # Download scene
+    # Download scene straight into memory, persisting it in the background
     sentinel = SentinelDataSource()
-    scene = sentinel.get_scene(bbox_coords, (date_start, date_end))
-
-    # Detect
     detector = VesselDetector(confidence_threshold=conf)
-    detections = detector.detect(scene)
+    masks = {}
+    if cloud_mask:
+        scene, clouds = sentinel.get_scene_with_clouds(
+            bbox_coords, (date_start, date_end)
+        )
+        if save_scene:
+            sentinel.save_scene_async(scene, save_scene)
+        masks = {"cloud_mask": clouds, "max_cloud_fraction": max_tile_cloud}
+    elif resolution is None:
+        scene = sentinel.get_scene_array(
+            bbox_coords, (date_start, date_end), output_path=save_scene
+        )
+    else:
+        # Native-resolution mosaics are far larger than the model input
+        scene = sentinel.get_scene_mosaic(
+            bbox_coords,
+            (date_start, date_end),
+            resolution=resolution,
+            output_path=save_scene,
+        )
+        click.echo(f"Mosaic: {scene.shape[1]}x{scene.shape[0]} px")
+
+    if land_mask is not None:
+        from pontos.landmask import LandMask
+
+        height, width = scene.shape[:2]
+        masks["land_mask"] = LandMask.from_file(land_mask).rasterize(
+            bbox_coords, (width, height), buffer_m=coast_buffer
+        )
+
+    if resolution is None and not masks:
+        detections = detector.detect(scene)
+    else:
+        detections = detector.detect_tiled(scene, **masks)
+        stats = detector.tile_stats
+        if masks and stats is not None:
+            click.echo(
+                f"Skipped {stats.skipped}/{stats.tiles} tiles ({stats.cloudy} "
+                f"cloudy, {stats.land} land; {stats.saved:.0%} of inference)"
+            )
+
+    height, width = scene.shape[:2]
+    if merge_distance is not None:
+        found = len(detections)
+        detections = GeoExporter.merge_duplicates(
+            detections, bbox_coords, (width, height), merge_distance
+        )
+        click.echo(f"Merged {found - len(detections)} duplicate detections")
 
     click.echo(f"Found {len(detections)} vessels")
 
     # Export
-    GeoExporter.detections_to_geojson(
-        detections, bbox_coords, (1024, 1024), Path(output)
-    )
+    GeoExporter.export(detections, bbox_coords, (width, height), output, export_format)
     click.echo(f"Saved: {output}")
 
+    if store_path is not None:
+        from datetime import datetime
+
+        from pontos.state import aoi_key
+        from pontos.store import DetectionStore
+
+        # A scene mixes the passes of its date range; file it under the end
+        with DetectionStore(store_path) as store:
+            store.add(
+                detections,
+                bbox_coords,
+                (width, height),
+                datetime.fromisoformat(date_end),
+                aoi_key(bbox_coords),
+            )
+        click.echo(f"Stored: {store_path}")
+
+    if save_scene:
+        sentinel.wait_for_writes()
+        click.echo(f"Scene: {save_scene}")
+
+
+@cli.command()
+@click.option(
+    "--bbox", required=True, help="Bounding box: min_lon,min_lat,max_lon,max_lat"
+)
+@click.option(
+    "--since",
+    default=None,
+    help="Start date of the first run: YYYY-MM-DD (default: 30 days ago); "
+    "later runs continue from the last processed acquisition",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=Path("monitor"),
+    help="Directory receiving one GeoJSON per new acquisition",
+)
+@click.option("--conf", default=0.05, help="Confidence threshold")
+@click.option("--max-cloud", default=0.2, help="Maximum cloud coverage (0.0-1.0)")
+@click.option(
+    "--state",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="State database (default: DATA_DIR/monitor.sqlite)",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(EXPORT_FORMATS),
+    default="geojson",
+    help="Detection export format",
+)
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    help="Gzip GeoJSON and GeoJSONSeq output",
+)
+@click.option(
+    "--merge-distance",
+    type=float,
+    default=None,
+    help="Merge detections closer than this many meters into the most "
+    "confident one before export",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also append the detections to this GeoPackage detection store",
+)
+def monitor(
+    bbox,
+    since,
+    output_dir,
+    conf,
+    max_cloud,
+    state,
+    export_format,
+    compress,
+    merge_distance,
+    store_path,
+):
+    """Detect vessels in acquisitions not processed by a previous run."""
+    from contextlib import nullcontext
+    from datetime import datetime, timedelta, timezone
+
+    from pontos.config import config
+    from pontos.detector import VesselDetector
+    from pontos.geo import GeoExporter
+    from pontos.sentinel import SentinelDataSource
+    from pontos.state import MonitorState, aoi_key
+    from pontos.store import DetectionStore
+
+    bbox_coords = tuple(map(float, bbox.split(",")))
+    aoi = aoi_key(bbox_coords)
+    today = datetime.now(timezone.utc).date()
+
+    with MonitorState(state or config.data_dir / "monitor.sqlite") as store:
+        # Restart the search on the day of the last processed acquisition;
+        # anything already recorded is skipped below
+        last = store.last_processed(aoi)
+        if last is not None:
+            start = last.date().isoformat()
+        else:
+            start = since or (today - timedelta(days=30)).isoformat()
+        click.echo(f"Monitoring {bbox_coords} from {start}...")
+
+        sentinel = SentinelDataSource()
+        done = store.processed(aoi)
+        plan = {
+            scene: acquisition
+            for acquisition, scene in sentinel.plan_scenes(
+                bbox_coords, (start, today.isoformat()), max_cloud_coverage=max_cloud
+            )
+            if acquisition.datetime not in done
+        }
+        if not plan:
+            click.echo("No new acquisitions")
+            return
+        click.echo(f"{len(plan)} new acquisitions")
+
+        detector = VesselDetector(confidence_threshold=conf)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        detection_store = DetectionStore(store_path) if store_path else nullcontext()
+        with detection_store:
+            for scene, image in sentinel.get_scenes(plan):
+                acquisition = plan[scene]
+                detections = detector.detect(image)
+                height, width = image.shape[:2]
+                if merge_distance is not None:
+                    detections = GeoExporter.merge_duplicates(
+                        detections, bbox_coords, (width, height), merge_distance
+                    )
+
+                output = _output_path(
+                    output_dir / f"vessels_{acquisition.datetime:%Y%m%dT%H%M%S}",
+                    export_format,
+                    compress,
+                )
+                GeoExporter.export(
+                    detections, bbox_coords, (width, height), output, export_format
+                )
+                if store_path:
+                    detection_store.add(
+                        detections,
+                        bbox_coords,
+                        (width, height),
+                        acquisition.datetime,
+                        aoi,
+                    )
+                store.record(aoi, acquisition, len(detections), output)
+                click.echo(
+                    f"{acquisition.datetime:%Y-%m-%d %H:%M}: "
+                    f"{len(detections)} vessels -> {output}"
+                )
+
+
+@cli.command()
+@click.option(
+    "--store",
+    "store_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Detection store filled by scan or monitor --store",
+)
+@click.option(
+    "--bbox",
+    default=None,
+    help="Bounding box: min_lon,min_lat,max_lon,max_lat (default: all stored)",
+)
+@click.option("--date-start", default=None, help="Start date: YYYY-MM-DD")
+@click.option("--date-end", default=None, help="End date: YYYY-MM-DD")
+@click.option(
+    "--output", "-o", default=None, help="Output path (default: tracks.<format>)"
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["geojson", "geojsonseq"]),
+    default="geojson",
+    help="Track export format",
+)
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    help="Gzip the output",
+)
+@click.option("--conf", default=0.05, help="Confidence threshold")
+@click.option(
+    "--gate", default=100.0, help="Gate radius for simultaneous positions (m)"
+)
+@click.option("--max-speed", default=10.0, help="Fastest ground speed linked (m/s)")
+@click.option(
+    "--max-gap", default=6.0, help="Days a track may go unseen before it ends"
+)
+def tracks(
+    store_path,
+    bbox,
+    date_start,
+    date_end,
+    output,
+    export_format,
+    compress,
+    conf,
+    gate,
+    max_speed,
+    max_gap,
+):
+    """Link stored detections of successive acquisitions into tracks."""
+    from datetime import timedelta
+    from itertools import groupby
+
+    from pontos.geo import FeatureWriter
+    from pontos.store import DetectionStore
+    from pontos.tracking import TrackLinker
+
+    if (date_start is None) != (date_end is None):
+        raise click.UsageError("--date-start and --date-end must be given together")
+    output = _output_path(Path(output or "tracks"), export_format, compress)
+    bbox_coords = tuple(map(float, bbox.split(","))) if bbox else None
+    time_range = (date_start, date_end) if date_start else None
+
+    linker = TrackLinker(gate, max_speed, timedelta(days=max_gap))
+    with DetectionStore(store_path) as store, FeatureWriter(
+        output, sequence=export_format == "geojsonseq"
+    ) as writer:
+        count = store.count(bbox_coords, time_range, min_confidence=conf)
+        click.echo(f"Linking {count} detections...")
+
+        # Detections stream in acquisition order, one acquisition in memory
+        found = store.iter_query(bbox_coords, time_range, min_confidence=conf)
+        for acquired, group in groupby(found, key=lambda detection: detection.acquired):
+            group = list(group)
+            finished = linker.update(
+                [(detection.lon, detection.lat) for detection in group],
+                [detection.confidence for detection in group],
+                acquired,
+            )
+            writer.write_tracks(finished)
+        writer.write_tracks(linker.finish())
+    click.echo(f"Saved {writer.count} tracks: {output}")
+
 
 if __name__ == "__main__":
     cli()
@@ -30,9 +30,29 @@ class PontosConfig:
     patch_overlap: float = 0.5
     device: str = "0"
 
+    # Inference backend ('torch', 'onnx', 'openvino') and export precision
+    backend: str = "torch"
+    precision: str = "fp32"
+
+    # Dataset YAML that calibrates int8 exports
+    calibration_data: Optional[str] = None
+
     # Processing
     max_workers: int = 4
     batch_size: int = 8
+    download_threads: int = 4
+
+    # Sentinel Hub response format ('png' or raw 'tiff')
+    response_format: str = "png"
+
+    # Sentinel Hub processing unit quota per minute (0 disables rate limiting)
+    processing_units_per_minute: float = 0.0
+
+    # On-disk scene cache size in megabytes (0 disables the cache)
+    scene_cache_mb: int = 0
+
+    # On-disk detection result cache size in megabytes (0 disables the cache)
+    result_cache_mb: int = 0
 
     def __post_init__(self):
         """Load values from environment after initialization."""
@@ -43,8 +63,18 @@ class PontosConfig:
         self.device = os.getenv("DEVICE", "0")
         self.patch_size = int(os.getenv("PATCH_SIZE", "320"))
         self.patch_overlap = float(os.getenv("PATCH_OVERLAP", "0.5"))
+        self.backend = os.getenv("BACKEND", "torch")
+        self.precision = os.getenv("PRECISION", "fp32")
+        self.calibration_data = os.getenv("CALIBRATION_DATA")
         self.max_workers = int(os.getenv("MAX_WORKERS", "4"))
         self.batch_size = int(os.getenv("BATCH_SIZE", "8"))
+        self.download_threads = int(os.getenv("DOWNLOAD_THREADS", "4"))
+        self.response_format = os.getenv("RESPONSE_FORMAT", "png")
+        self.processing_units_per_minute = float(
+            os.getenv("PROCESSING_UNITS_PER_MINUTE", "0")
+        )
+        self.scene_cache_mb = int(os.getenv("SCENE_CACHE_MB", "0"))
+        self.result_cache_mb = int(os.getenv("RESULT_CACHE_MB", "0"))
 
     def validate(self) -> None:
         """Validate configuration."""
@@ -0,0 +1,208 @@
+"""Merge repeated detections of the same vessel across scenes and tiles."""
+
+from datetime import timedelta
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from pontos.geo import _METERS_PER_DEGREE
+
+
+def _distance(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    Distances in metres between WGS84 positions.
+
+    Equirectangular approximation, exact enough up to tens of kilometres
+    and taking the short way across the antimeridian.
+
+    Args:
+        start: Positions (N, 2) as [longitude, latitude]
+        end: Positions (N, 2) as [longitude, latitude]
+
+    Returns:
+        Distances (N,) in metres
+    """
+    d_lon = (end[:, 0] - start[:, 0] + 180.0) % 360.0 - 180.0
+    d_lon *= np.cos(np.radians((start[:, 1] + end[:, 1]) / 2))
+    return np.hypot(d_lon, end[:, 1] - start[:, 1]) * _METERS_PER_DEGREE
+
+
+def deduplicate(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    times: Optional[Sequence] = None,
+    distance: float = 30.0,
+    time_tolerance: Optional[timedelta] = None,
+) -> np.ndarray:
+    """
+    Indices of the detections left after merging duplicates.
+
+    Overlapping AOIs and repeated scans report the same vessel more than
+    once. Detections closer than ``distance`` metres (and, with times,
+    no more than ``time_tolerance`` apart) are duplicates; as in NMS, the
+    most confident detection is kept and its duplicates are dropped, then
+    the next most confident remaining one, and so on.
+
+    Detections are hashed into grid cells one ``distance`` wide, so each is
+    only compared with the few detections of its neighbouring cells rather
+    than with every other detection.
+
+    Args:
+        coords: WGS84 positions (N, 2) as [longitude, latitude]
+        confidence: Confidence scores (N,)
+        times: Acquisition times (N,) as datetimes, ISO strings or
+            datetime64; omit to merge regardless of time
+        distance: Merge distance in metres
+        time_tolerance: Largest time difference merged when ``times`` is
+            given; None merges regardless of time
+
+    Returns:
+        Ascending indices of the detections kept
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    confidence = np.asarray(confidence, dtype=np.float64).reshape(-1)
+    if len(confidence) != len(coords):
+        raise ValueError(
+            f"coords and confidence must have the same length, got "
+            f"{len(coords)} and {len(confidence)}"
+        )
+    if distance <= 0:
+        raise ValueError(f"distance must be positive, got {distance}")
+
+    ticks = None
+    if times is not None and time_tolerance is not None:
+        ticks = np.asarray(times, dtype="datetime64[us]").astype(np.int64)
+        if len(ticks) != len(coords):
+            raise ValueError(
+                f"coords and times must have the same length, got "
+                f"{len(coords)} and {len(ticks)}"
+            )
+        window = time_tolerance // timedelta(microseconds=1)
+        if window < 0:
+            raise ValueError(
+                f"time_tolerance must not be negative, got {time_tolerance}"
+            )
+
+    if len(coords) < 2:
+        return np.arange(len(coords))
+
+    first, second = _candidate_pairs(coords, distance)
+    if ticks is not None:
+        close = np.abs(ticks[first] - ticks[second]) <= window
+        first, second = first[close], second[close]
+    return np.flatnonzero(_suppress(confidence, first, second))
+
+
+def _candidate_pairs(
+    coords: np.ndarray, distance: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All pairs of detections within ``distance`` metres of each other.
+
+    Args:
+        coords: WGS84 positions (N, 2) as [longitude, latitude]
+        distance: Pair distance in metres
+
+    Returns:
+        (first, second) index arrays, each pair listed once
+    """
+    lon, lat = coords[:, 0], coords[:, 1]
+
+    # Cells are at least `distance` wide, so pairs only span adjacent cells.
+    # Columns are sized for the highest latitude present, where a degree of
+    # longitude is shortest, and wrap around the antimeridian.
+    cell_lat = distance / _METERS_PER_DEGREE
+    shortest = np.cos(np.radians(min(np.abs(lat).max(), 90.0)))
+    columns = int(360 // (cell_lat / shortest)) if shortest > 0 else 1
+    if columns < 3:
+        # Left and right neighbours would be the same column
+        columns = 1
+    column = (np.floor((lon + 180.0) * (columns / 360.0)).astype(np.int64)) % columns
+    row = np.floor((lat + 90.0) / cell_lat).astype(np.int64)
+    row -= row.min() - 1
+    if (int(row.max()) + 2) * columns >= 2**62:
+        raise ValueError(f"distance {distance} m is too small for a global grid")
+    keys = row * columns + column
+
+    order = np.argsort(keys, kind="stable")
+    cells, starts, sizes = np.unique(keys[order], return_index=True, return_counts=True)
+    cell_rows, cell_columns = cells // columns, cells % columns
+
+    # Each pair of neighbouring cells is visited once: the cell itself plus
+    # the four neighbours after it in (row, column) order
+    offsets = [(0, 0), (0, 1), (1, -1), (1, 0), (1, 1)]
+    if columns == 1:
+        offsets = [(0, 0), (1, 0)]
+
+    first, second = [], []
+    for d_row, d_column in offsets:
+        neighbours = (cell_rows + d_row) * columns + (
+            (cell_columns + d_column) % columns
+        )
+        found = np.minimum(np.searchsorted(cells, neighbours), len(cells) - 1)
+        here = np.flatnonzero(cells[found] == neighbours)
+        there = found[here]
+
+        # Every detection of one cell against every detection of the other
+        counts = sizes[here] * sizes[there]
+        pair = np.repeat(np.arange(len(here)), counts)
+        step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        width = sizes[there][pair]
+        i = order[starts[here][pair] + step // width]
+        j = order[starts[there][pair] + step % width]
+        if d_row == d_column == 0:
+            i, j = i[i < j], j[i < j]
+        first.append(i)
+        second.append(j)
+
+    first, second = np.concatenate(first), np.concatenate(second)
+
+    close = _distance(coords[first], coords[second]) <= distance
+    return first[close], second[close]
+
+
+def _suppress(
+    confidence: np.ndarray, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """
+    Greedy NMS over duplicate pairs, decided a round at a time.
+
+    Each round keeps every undecided detection without an undecided, more
+    confident duplicate, then drops the duplicates of those kept. Only
+    detections with duplicates take part, and chains of duplicates are
+    short, so a handful of rounds settles them all.
+
+    Args:
+        confidence: Confidence scores (N,)
+        first: First detection of each duplicate pair
+        second: Second detection of each duplicate pair
+
+    Returns:
+        Boolean mask (N,) of the detections kept
+    """
+    # Ties in confidence go to the earlier detection
+    better = (confidence[first] > confidence[second]) | (
+        (confidence[first] == confidence[second]) & (first < second)
+    )
+    winner = np.where(better, first, second)
+    loser = np.where(better, second, first)
+
+    kept = np.ones(len(confidence), dtype=bool)
+    undecided = np.zeros(len(confidence), dtype=bool)
+    undecided[winner] = undecided[loser] = True
+    blocked = np.zeros(len(confidence), dtype=bool)
+
+    while len(winner):
+        blocked[loser] = True
+        free = winner[~blocked[winner]]
+        blocked[loser] = False
+        undecided[free] = False
+
+        dropped = loser[~undecided[winner]]
+        kept[dropped] = False
+        undecided[dropped] = False
+
+        pending = undecided[winner] & undecided[loser]
+        winner, loser = winner[pending], loser[pending]
+
+    return kept
@@ -0,0 +1,154 @@
+"""Columnar container for vessel detections."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_NAMES = {0: "vessel"}
+
+
+@dataclass(eq=False)
+class Detections:
+    """
+    Detections of one image stored as contiguous numpy arrays.
+
+    Indexing with an integer returns the classic detection dictionary
+    (built on demand), while slices, boolean masks and index arrays return a
+    new Detections, so both existing dict-based callers and vectorized code
+    can use the same object.
+
+    Attributes:
+        xyxy: Bounding boxes (N, 4) as [x1, y1, x2, y2] in pixels
+        conf: Confidence scores (N,)
+        class_id: Class indices (N,)
+        names: Mapping from class index to class name
+        centers: Box centers (N, 2) as [x, y] in pixels
+    """
+
+    xyxy: np.ndarray
+    conf: np.ndarray
+    class_id: np.ndarray
+    names: Dict[int, str] = field(default_factory=lambda: dict(DEFAULT_NAMES))
+    centers: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Normalize array layout and derive box centers."""
+        self.xyxy = np.ascontiguousarray(self.xyxy, dtype=np.float32).reshape(-1, 4)
+        self.conf = np.ascontiguousarray(self.conf, dtype=np.float32).reshape(-1)
+        self.class_id = np.ascontiguousarray(self.class_id, dtype=np.int64).reshape(-1)
+        self.centers = (self.xyxy[:, :2] + self.xyxy[:, 2:]) / 2
+
+        if not len(self.xyxy) == len(self.conf) == len(self.class_id):
+            raise ValueError(
+                "xyxy, conf and class_id must have the same length, got "
+                f"{len(self.xyxy)}, {len(self.conf)} and {len(self.class_id)}"
+            )
+
+    @classmethod
+    def from_data(
+        cls, data: np.ndarray, names: Optional[Dict[int, str]] = None
+    ) -> "Detections":
+        """
+        Build detections from raw model rows.
+
+        Args:
+            data: Array (N, 6) of rows [x1, y1, x2, y2, confidence, class_id],
+                e.g. ``result.boxes.data.cpu().numpy()``
+            names: Mapping from class index to class name
+
+        Returns:
+            Detections holding the rows
+        """
+        data = np.asarray(data).reshape(-1, 6)
+        return cls(data[:, :4], data[:, 4], data[:, 5], dict(names or DEFAULT_NAMES))
+
+    @classmethod
+    def empty(cls, names: Optional[Dict[int, str]] = None) -> "Detections":
+        """Create an empty detection set."""
+        return cls.from_data(np.empty((0, 6), dtype=np.float32), names)
+
+    @classmethod
+    def from_dicts(
+        cls, detections: Sequence[dict], names: Optional[Dict[int, str]] = None
+    ) -> "Detections":
+        """
+        Build detections from a list of detection dictionaries.
+
+        Args:
+            detections: Dicts with 'bbox', 'confidence' and optional 'class'
+            names: Mapping from class index to class name
+
+        Returns:
+            Detections holding the same boxes
+        """
+        if isinstance(detections, Detections):
+            return detections
+
+        names = dict(names or DEFAULT_NAMES)
+        ids = {name: idx for idx, name in names.items()}
+        for det in detections:
+            ids.setdefault(det.get("class", "vessel"), len(ids))
+
+        return cls(
+            np.array([det["bbox"] for det in detections], dtype=np.float32),
+            np.array([det["confidence"] for det in detections], dtype=np.float32),
+            np.array([ids[det.get("class", "vessel")] for det in detections]),
+            {idx: name for name, idx in ids.items()},
+        )
+
+    def __len__(self) -> int:
+        """Number of detections."""
+        return len(self.conf)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over detection dictionaries, built lazily."""
+        for idx in range(len(self)):
+            yield self._record(idx)
+
+    def __getitem__(
+        self, index: Union[int, slice, np.ndarray, List[int]]
+    ) -> Union[dict, "Detections"]:
+        """
+        Index the detections.
+
+        Args:
+            index: Integer for a single detection dictionary, or slice,
+                boolean mask or index array for a subset
+
+        Returns:
+            Detection dictionary or Detections subset
+        """
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError(f"Detection index {index} out of range")
+            return self._record(int(index))
+
+        return Detections(
+            self.xyxy[index], self.conf[index], self.class_id[index], self.names
+        )
+
+    def __repr__(self) -> str:
+        """Compact representation without dumping arrays."""
+        return f"Detections(n={len(self)}, names={self.names})"
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Materialize all detections as dictionaries.
+
+        Returns:
+            List of dicts with 'bbox', 'confidence', 'class' and 'center'
+        """
+        return list(self)
+
+    def _record(self, idx: int) -> dict:
+        """Build the detection dictionary for one row."""
+        x1, y1, x2, y2 = self.xyxy[idx].tolist()
+        cx, cy = self.centers[idx].tolist()
+
+        return {
+            "bbox": [x1, y1, x2, y2],
+            "confidence": float(self.conf[idx]),
+            "class": self.names.get(int(self.class_id[idx]), "vessel"),
+            "center": [cx, cy],
+        }
@@ -1,12 +1,325 @@
 """Ship detection using YOLO11s marine vessel model."""
 
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import torch
+from PIL import Image
+from torchvision.ops import batched_nms
 from ultralytics import YOLO
 
+from pontos.backends import export_model, weights_hash
+from pontos.cache import ResultCache, cache_key, image_fingerprint
 from pontos.config import config
+from pontos.detections import Detections
+from pontos.registry import ModelStats, registry
+
+# Boxes this close to an interior tile edge are treated as cut by the seam
+_SEAM_MARGIN = 2.0
+
+# Side in pixels of the blocks averaged into tile change signatures
+_SIGNATURE_BLOCK = 4
+
+
+def _tile_origins(
+    height: int, width: int, tile_size: int, stride: int
+) -> List[Tuple[int, int]]:
+    """
+    Compute top-left corners of a sliding window grid covering an image.
+
+    The last tile along each axis is snapped to the image border so the
+    whole scene is covered without padding.
+
+    Args:
+        height: Image height in pixels
+        width: Image width in pixels
+        tile_size: Size of each tile in pixels
+        stride: Step between consecutive tiles in pixels
+
+    Returns:
+        List of (x, y) tile origins in row-major order
+    """
+
+    def axis_starts(length: int) -> List[int]:
+        if length <= tile_size:
+            return [0]
+        starts = list(range(0, length - tile_size + 1, stride))
+        if starts[-1] != length - tile_size:
+            starts.append(length - tile_size)
+        return starts
+
+    return [(x, y) for y in axis_starts(height) for x in axis_starts(width)]
+
+
+def _tile_grid(
+    shape: Tuple[int, int], tile_size: int, overlap: float
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Plan the sliding window grid for a scene.
+
+    Args:
+        shape: (height, width) of the scene
+        tile_size: Size of each tile in pixels
+        overlap: Overlap ratio between tiles, 0.0 to 1.0 exclusive
+
+    Returns:
+        Tile origins and the stride between tiles
+    """
+    if not 0.0 <= overlap < 1.0:
+        raise ValueError(f"Overlap must be in [0.0, 1.0), got {overlap}")
+
+    stride = max(1, int(tile_size * (1 - overlap)))
+    return _tile_origins(shape[0], shape[1], tile_size, stride), stride
+
+
+def _merge_tile_boxes(
+    boxes: List[torch.Tensor], iou_threshold: float, names: Dict[int, str]
+) -> Detections:
+    """
+    Merge scene-coordinate tile boxes with a single class-aware NMS pass.
+
+    Args:
+        boxes: Tensors (M, 6) of [x1, y1, x2, y2, confidence, class_id]
+        iou_threshold: IoU above which overlapping detections are merged
+        names: Mapping from class index to class name
+
+    Returns:
+        Merged detections sorted by decreasing confidence
+    """
+    merged = torch.cat(boxes) if boxes else torch.zeros((0, 6))
+    if len(merged) == 0:
+        return Detections.empty(names)
+
+    keep = batched_nms(merged[:, :4], merged[:, 4], merged[:, 5], iou_threshold)
+    return Detections.from_data(merged[keep].cpu().numpy(), names)
+
+
+def _cut_by_seam(
+    boxes: torch.Tensor,
+    origin: Tuple[int, int],
+    tile_shape: Tuple[int, int],
+    image_shape: Tuple[int, int],
+    seam: int,
+    kept: Optional[AbstractSet[Tuple[int, int]]] = None,
+) -> torch.Tensor:
+    """
+    Flag tile-local boxes truncated by an interior tile edge.
+
+    A box touching an edge shared with a neighbouring tile and smaller than
+    the overlap along that axis is fully visible in the neighbour, so the
+    truncated copy can be dropped instead of surviving NMS as a fragment.
+    When tiles are skipped before inference, only edges shared with a tile
+    that is still run count; elsewhere the fragment is the only copy.
+
+    Args:
+        boxes: Tile-local boxes (N, 4) as [x1, y1, x2, y2]
+        origin: (x, y) tile origin in the scene
+        tile_shape: (height, width) of the tile
+        image_shape: (height, width) of the scene
+        seam: Overlap between neighbouring tiles in pixels
+        kept: Origins of the tiles being inferred (None when all are)
+
+    Returns:
+        Boolean mask (N,) of boxes to drop
+    """
+    x, y = origin
+    tile_h, tile_w = tile_shape
+    height, width = image_shape
+    x1, y1, x2, y2 = boxes.unbind(dim=1)
+
+    left, right = x > 0, x + tile_w < width
+    top, bottom = y > 0, y + tile_h < height
+    if kept is not None:
+        # Grid starts are multiples of the stride, except the last one, which
+        # is snapped to the scene border (see _tile_origins)
+        stride_x, stride_y = tile_w - seam, tile_h - seam
+        left = left and ((x - 1) // stride_x * stride_x, y) in kept
+        right = right and (min(x + stride_x, width - tile_w), y) in kept
+        top = top and (x, (y - 1) // stride_y * stride_y) in kept
+        bottom = bottom and (x, min(y + stride_y, height - tile_h)) in kept
+
+    cut_x = ((x1 <= _SEAM_MARGIN) & left) | ((x2 >= tile_w - _SEAM_MARGIN) & right)
+    cut_y = ((y1 <= _SEAM_MARGIN) & top) | ((y2 >= tile_h - _SEAM_MARGIN) & bottom)
+
+    return (cut_x & (x2 - x1 < seam)) | (cut_y & (y2 - y1 < seam))
+
+
+def _tile_signature(tile: np.ndarray, block: int = _SIGNATURE_BLOCK) -> np.ndarray:
+    """
+    Downsample a tile to block means, a cheap fingerprint for change detection.
+
+    Args:
+        tile: RGB tile (H, W, 3)
+        block: Side of the averaged pixel blocks
+
+    Returns:
+        Float array (H // block, W // block, 3) of block means
+    """
+    h, w = tile.shape[0] // block * block, tile.shape[1] // block * block
+    blocks = tile[:h, :w].reshape(h // block, block, w // block, block, -1)
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+def _clear_tiles(
+    cloud_mask: np.ndarray,
+    shape: Tuple[int, int],
+    origins: List[Tuple[int, int]],
+    tile_size: int,
+    max_cloud_fraction: float,
+) -> List[Tuple[int, int]]:
+    """
+    Keep the tiles whose share of cloudy pixels is at most max_cloud_fraction.
+
+    Args:
+        cloud_mask: Cloud probability in [0, 1] or boolean mask (H, W)
+        shape: (height, width) of the scene
+        origins: (x, y) tile origins
+        tile_size: Size of each tile in pixels
+        max_cloud_fraction: Largest tolerated share of cloudy pixels
+
+    Returns:
+        Origins of the tiles to infer, in input order
+    """
+    cloudy = np.asarray(cloud_mask) >= 0.5
+    if cloudy.shape != tuple(shape):
+        raise ValueError(
+            f"Cloud mask shape {cloudy.shape} does not match image shape {shape}"
+        )
+
+    return [
+        (x, y)
+        for x, y in origins
+        if cloudy[y : y + tile_size, x : x + tile_size].mean() <= max_cloud_fraction
+    ]
+
+
+def _sea_tiles(
+    land_mask: np.ndarray,
+    shape: Tuple[int, int],
+    origins: List[Tuple[int, int]],
+    tile_size: int,
+) -> List[Tuple[int, int]]:
+    """
+    Keep the tiles holding at least one water pixel.
+
+    Args:
+        land_mask: Boolean mask (H, W), True on land
+        shape: (height, width) of the scene
+        origins: (x, y) tile origins
+        tile_size: Size of each tile in pixels
+
+    Returns:
+        Origins of the tiles to infer, in input order
+    """
+    land = np.asarray(land_mask, dtype=bool)
+    if land.shape != tuple(shape):
+        raise ValueError(
+            f"Land mask shape {land.shape} does not match image shape {shape}"
+        )
+
+    return [
+        (x, y)
+        for x, y in origins
+        if not land[y : y + tile_size, x : x + tile_size].all()
+    ]
+
+
+def _skip_masked_tiles(
+    origins: List[Tuple[int, int]],
+    shape: Tuple[int, int],
+    tile_size: int,
+    cloud_mask: Optional[np.ndarray],
+    max_cloud_fraction: float,
+    land_mask: Optional[np.ndarray],
+) -> Tuple[List[Tuple[int, int]], "TileStats"]:
+    """Drop cloudy and land tiles, counting each kind."""
+    stats = TileStats(len(origins))
+    if cloud_mask is not None:
+        clear = _clear_tiles(cloud_mask, shape, origins, tile_size, max_cloud_fraction)
+        stats.cloudy = len(origins) - len(clear)
+        origins = clear
+    if land_mask is not None:
+        sea = _sea_tiles(land_mask, shape, origins, tile_size)
+        stats.land = len(origins) - len(sea)
+        origins = sea
+    return origins, stats
+
+
+@dataclass
+class TileStats:
+    """
+    Tile counts of the last tiled inference.
+
+    Attributes:
+        tiles: Tiles covering the scene
+        cloudy: Tiles dropped as cloudy before inference
+        land: Tiles dropped as entirely land before inference
+    """
+
+    tiles: int
+    cloudy: int = 0
+    land: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Tiles dropped before inference."""
+        return self.cloudy + self.land
+
+    @property
+    def inferred(self) -> int:
+        """Tiles sent to the model."""
+        return self.tiles - self.skipped
+
+    @property
+    def saved(self) -> float:
+        """Share of tiles, and so of model compute, skipped."""
+        return self.skipped / self.tiles if self.tiles else 0.0
+
+
+@dataclass
+class TileMemory:
+    """
+    Tile signatures and boxes of the previous acquisition of an area.
+
+    Returned by VesselDetector.detect_incremental() and passed back in with
+    the next acquisition of the same area. A reused tile keeps the signature
+    its boxes were computed on, so slow drift below the tolerance still
+    triggers inference once it adds up.
+
+    Attributes:
+        params: Scene shape and inference settings the tiles belong to
+        signatures: Block-mean signature per (x, y) tile origin
+        boxes: Seam-filtered scene-coordinate boxes (M, 6) per tile origin
+        skipped: Number of tiles answered from the previous memory
+    """
+
+    params: Tuple
+    signatures: Dict[Tuple[int, int], np.ndarray]
+    boxes: Dict[Tuple[int, int], np.ndarray]
+    skipped: int = 0
+
+    @property
+    def tiles(self) -> int:
+        """Number of tiles in the scene."""
+        return len(self.signatures)
+
+    @property
+    def skip_ratio(self) -> float:
+        """Share of tiles that were not re-inferred."""
+        return self.skipped / self.tiles if self.tiles else 0.0
 
 
 class VesselDetector:
@@ -17,6 +330,10 @@ class VesselDetector:
         model_path: Optional[Path] = None,
         device: Optional[str] = None,
         confidence_threshold: float = 0.05,
+        backend: Optional[str] = None,
+        precision: Optional[str] = None,
+        result_cache: Optional[ResultCache] = None,
+        calibration_data: Optional[str] = None,
     ):
         """
         Initialize vessel detector.
@@ -25,9 +342,22 @@ class VesselDetector:
             model_path: Path to YOLO model weights
             device: Device to run inference on ('0' for GPU, 'cpu' for CPU)
             confidence_threshold: Minimum confidence for detections
+            backend: 'torch', 'onnx' or 'openvino' (defaults to config.backend).
+                Exported backends use a static config.patch_size x
+                config.batch_size input and are cached next to the weights.
+            precision: Export precision 'fp32', 'fp16' or 'int8'
+                (defaults to config.precision)
+            result_cache: Cache of raw predictions for repeated images
+                (defaults to one under config.data_dir when
+                config.result_cache_mb is set, otherwise no caching)
+            calibration_data: Dataset YAML calibrating int8 exports
+                (defaults to config.calibration_data)
         """
         self.model_path = model_path or config.model_path
         self.confidence_threshold = confidence_threshold
+        self.backend = backend or config.backend
+        self.precision = precision or config.precision
+        self.calibration_data = calibration_data or config.calibration_data
 
         # Smart device selection with fallback
         requested_device = device or config.device
@@ -37,68 +367,471 @@ class VesselDetector:
         else:
             self.device = requested_device
 
-        # Load model
-        self.model = YOLO(str(self.model_path))
+        if not Path(self.model_path).exists():
+            raise FileNotFoundError(f"Model not found: {self.model_path}")
+
+        # Detectors with the same weights, device and backend share one model,
+        # loaded from the registry on first use
+        self._registry_key = (
+            str(Path(self.model_path).resolve()),
+            self.device,
+            self.backend,
+            self.precision,
+        )
+
+        if result_cache is None and config.result_cache_mb > 0:
+            result_cache = ResultCache(
+                config.data_dir / "cache" / "results",
+                max_bytes=config.result_cache_mb * 1024 * 1024,
+            )
+        self.result_cache = result_cache
+
+        # Tile counts of the last detect_tiled() call that ran the model
+        self.tile_stats: Optional[TileStats] = None
+
+    @property
+    def model(self):
+        """YOLO model, loaded lazily and shared through the model registry."""
+        return registry.get(self._registry_key, self._load_model)
+
+    @property
+    def model_stats(self) -> Optional[ModelStats]:
+        """Load time and warmup latencies of the model, None until loaded."""
+        return registry.stats(self._registry_key)
+
+    def warmup(self, batch_size: Optional[int] = None) -> ModelStats:
+        """
+        Pay one-time inference setup costs before real work arrives.
+
+        Runs a dummy batch of blank tiles twice; later calls on any detector
+        sharing the same model return the recorded stats without rerunning.
+
+        Args:
+            batch_size: Number of dummy tiles (defaults to config.batch_size)
+
+        Returns:
+            Stats with load time, cold (first pass) and warm latency in seconds
+        """
+        size = config.patch_size
+        dummy = [np.zeros((size, size, 3), dtype=np.uint8)] * (
+            batch_size or config.batch_size
+        )
+
+        def run(model):
+            model(dummy, imgsz=size, device=self.device, verbose=False)
+
+        return registry.warmup(self._registry_key, self._load_model, run)
+
+    def _predict(self, source: Any, **kwargs: Any) -> list:
+        """
+        Run the shared model, one call at a time.
+
+        Detectors in several threads may share a model through the registry,
+        and a YOLO predictor is not safe to call concurrently.
+        """
+        model = self.model
+        with registry.inference_lock(self._registry_key):
+            return model(source, **kwargs)
+
+    def _load_model(self):
+        """Load the model, exporting it to the requested backend if needed."""
+        if self.backend == "torch":
+            return YOLO(str(self.model_path))
+
+        weights = export_model(
+            self.model_path,
+            self.backend,
+            imgsz=config.patch_size,
+            batch=config.batch_size,
+            precision=self.precision,
+            data=self.calibration_data,
+        )
+        return YOLO(str(weights), task="detect")
 
     def detect(
         self,
-        image_path: Path,
+        image_path: Union[Path, np.ndarray],
         save_visualization: bool = False,
         output_dir: Optional[Path] = None,
-    ) -> List[dict]:
+    ) -> Detections:
         """
         Detect vessels in a single image.
 
         Args:
-            image_path: Path to input image
+            image_path: Path to input image or RGB uint8 array (H, W, 3),
+                e.g. from SentinelDataSource.get_scene_array()
             save_visualization: Whether to save annotated image
             output_dir: Directory to save results
 
         Returns:
-            List of detection dictionaries with bbox coordinates and confidence
+            Detections with bbox coordinates and confidence; iterating or
+            indexing yields the classic detection dictionaries
         """
-        results = self.model(
-            str(image_path),
-            conf=self.confidence_threshold,
-            device=self.device,
-            save=save_visualization,
-            project=str(output_dir) if output_dir else None,
-            verbose=False,
-        )
 
-        detections = []
-        for box in results[0].boxes:
-            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-            confidence = float(box.conf[0])
-            class_id = int(box.cls[0])
-
-            detections.append(
-                {
-                    "bbox": [float(x1), float(y1), float(x2), float(y2)],
-                    "confidence": confidence,
-                    "class": self.model.names[class_id],
-                    "center": [float((x1 + x2) / 2), float((y1 + y2) / 2)],
-                }
+        def run(conf: float) -> Detections:
+            results = self._predict(
+                self._as_source(image_path),
+                conf=conf,
+                device=self.device,
+                save=save_visualization,
+                project=str(output_dir) if output_dir else None,
+                verbose=False,
+            )
+            return self._to_detections(results[0])
+
+        if save_visualization:
+            return run(self.confidence_threshold)
+        return self._cached(image_path, run, mode="detect")
+
+    def detect_batch(
+        self,
+        images: Iterable[Union[Path, np.ndarray]],
+        batch_size: Optional[int] = None,
+    ) -> List[Detections]:
+        """
+        Detect vessels in many images, batching them through the model.
+
+        Args:
+            images: Iterable of image paths or RGB uint8 arrays (H, W, 3);
+                consumed lazily so generators of large scenes are fine. A
+                (T, H, W, 3) stack from SentinelDataSource.get_scene_stack()
+                iterates as T images
+            batch_size: Number of images per model call (defaults to config.batch_size)
+
+        Returns:
+            One Detections per input image, in input order
+        """
+        batch_size = batch_size or config.batch_size
+        iterator = iter(images)
+
+        all_detections = []
+        while chunk := list(islice(iterator, batch_size)):
+            results = self._predict(
+                [self._as_source(image) for image in chunk],
+                conf=self.confidence_threshold,
+                device=self.device,
+                verbose=False,
             )
+            all_detections.extend(self._to_detections(result) for result in results)
 
-        return detections
+        return all_detections
 
     def detect_tiled(
-        self, image_path: Path, tile_size: int = 320, overlap: float = 0.5
-    ) -> List[dict]:
+        self,
+        image_path: Union[Path, np.ndarray],
+        tile_size: Optional[int] = None,
+        overlap: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        iou_threshold: float = 0.5,
+        cloud_mask: Optional[np.ndarray] = None,
+        max_cloud_fraction: float = 0.5,
+        land_mask: Optional[np.ndarray] = None,
+    ) -> Detections:
         """
         Detect vessels using sliding window tiling strategy.
 
+        Tiles are sent to the model ``batch_size`` at a time. Boxes truncated
+        by a seam are dropped in favour of the neighbouring tile that sees the
+        whole vessel, the rest are shifted back to scene coordinates and
+        merged with a single class-aware NMS pass so vessels seen in several
+        overlapping tiles are reported once.
+
+        With a cloud mask, tiles whose share of cloudy pixels exceeds
+        ``max_cloud_fraction`` are dropped before inference, and with a land
+        mask so are tiles without a water pixel; the counts are reported in
+        ``tile_stats``.
+
         Args:
-            image_path: Path to input image
+            image_path: Path to input image or RGB uint8 array (H, W, 3)
+            tile_size: Size of each tile in pixels (defaults to config.patch_size)
+            overlap: Overlap ratio between tiles, 0.0 to 1.0 exclusive
+                (defaults to config.patch_overlap)
+            batch_size: Number of tiles per model call (defaults to config.batch_size)
+            iou_threshold: IoU above which overlapping detections are merged
+            cloud_mask: Cloud probability in [0, 1] or boolean mask (H, W),
+                e.g. from SentinelDataSource.get_scene_with_clouds(); pixels
+                at 0.5 or above count as cloudy
+            max_cloud_fraction: Largest share of cloudy pixels a tile may
+                have and still be inferred
+            land_mask: Boolean mask (H, W), True on land, e.g. from
+                LandMask.rasterize()
+
+        Returns:
+            Detections with global coordinates
+        """
+        tile_size = tile_size or config.patch_size
+        overlap = config.patch_overlap if overlap is None else overlap
+        batch_size = batch_size or config.batch_size
+
+        def run(conf: float) -> Detections:
+            image = self._load_image(image_path)
+            origins, stride = _tile_grid(image.shape[:2], tile_size, overlap)
+            origins, self.tile_stats = _skip_masked_tiles(
+                origins,
+                image.shape[:2],
+                tile_size,
+                cloud_mask,
+                max_cloud_fraction,
+                land_mask,
+            )
+
+            # Seams next to skipped tiles keep their fragments
+            kept = set(origins) if self.tile_stats.skipped else None
+            boxes = [
+                self._detect_tiles(
+                    image,
+                    origins[start : start + batch_size],
+                    tile_size,
+                    stride,
+                    conf,
+                    kept,
+                )
+                for start in range(0, len(origins), batch_size)
+            ]
+            return _merge_tile_boxes(boxes, iou_threshold, self.model.names)
+
+        # Masks only enter the key when given, keeping earlier entries valid
+        masks = {}
+        if cloud_mask is not None:
+            masks["clouds"] = image_fingerprint(np.asarray(cloud_mask))
+            masks["max_cloud_fraction"] = max_cloud_fraction
+        if land_mask is not None:
+            masks["land"] = image_fingerprint(np.asarray(land_mask, dtype=bool))
+
+        self.tile_stats = None
+        return self._cached(
+            image_path,
+            run,
+            mode="tiled",
+            tile_size=tile_size,
+            overlap=overlap,
+            iou_threshold=iou_threshold,
+            **masks,
+        )
+
+    def detect_incremental(
+        self,
+        image_path: Union[Path, np.ndarray],
+        previous: Optional[TileMemory] = None,
+        tolerance: float = 8.0,
+        tile_size: Optional[int] = None,
+        overlap: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        iou_threshold: float = 0.5,
+    ) -> Tuple[Detections, TileMemory]:
+        """
+        Tiled detection that reuses the boxes of tiles unchanged since the
+        previous acquisition of the same area.
+
+        Each tile is summarised by the means of its 4x4 pixel blocks. Tiles
+        whose block means all stay within ``tolerance`` of the previous
+        memory keep their previous boxes; only the others go through the
+        model. The merged result is the same as detect_tiled() whenever
+        reused tiles would have produced the same boxes.
+
+        Args:
+            image_path: Path to input image or RGB uint8 array (H, W, 3)
+            previous: Memory returned for the previous acquisition; ignored
+                if it was computed for another scene shape or settings
+            tolerance: Largest block-mean change, in uint8 levels, for which
+                a tile counts as unchanged
+            tile_size: Size of each tile in pixels (defaults to config.patch_size)
+            overlap: Overlap ratio between tiles, 0.0 to 1.0 exclusive
+                (defaults to config.patch_overlap)
+            batch_size: Number of tiles per model call (defaults to config.batch_size)
+            iou_threshold: IoU above which overlapping detections are merged
+
+        Returns:
+            Detections with global coordinates, and the memory to pass with
+            the next acquisition (its skipped/skip_ratio report this run)
+        """
+        tile_size = tile_size or config.patch_size
+        overlap = config.patch_overlap if overlap is None else overlap
+        batch_size = batch_size or config.batch_size
+
+        image = self._load_image(image_path)
+        origins, stride = _tile_grid(image.shape[:2], tile_size, overlap)
+        params = (
+            image.shape[:2],
+            tile_size,
+            overlap,
+            self.confidence_threshold,
+            self._registry_key,
+        )
+        if previous is not None and previous.params != params:
+            previous = None
+
+        signatures, boxes, changed = {}, {}, []
+        for x, y in origins:
+            signature = _tile_signature(image[y : y + tile_size, x : x + tile_size])
+            if previous is not None and (
+                np.abs(signature - previous.signatures[(x, y)]).max() <= tolerance
+            ):
+                signatures[(x, y)] = previous.signatures[(x, y)]
+                boxes[(x, y)] = previous.boxes[(x, y)]
+            else:
+                signatures[(x, y)] = signature
+                changed.append((x, y))
+
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start : start + batch_size]
+            tile_boxes = self._detect_tile_boxes(image, batch, tile_size, stride)
+            for origin, data in zip(batch, tile_boxes):
+                boxes[origin] = data.cpu().numpy()
+
+        detections = _merge_tile_boxes(
+            [torch.from_numpy(boxes[origin]) for origin in origins],
+            iou_threshold,
+            self.model.names,
+        )
+        memory = TileMemory(params, signatures, boxes, len(origins) - len(changed))
+        return detections, memory
+
+    def _cached(
+        self,
+        image: Union[Path, np.ndarray],
+        run: Callable[[float], Detections],
+        **params,
+    ) -> Detections:
+        """
+        Answer a prediction from the result cache when possible.
+
+        On a miss the model runs at the cache floor and the unfiltered boxes
+        are stored, so later calls at any threshold above the floor are
+        served without the model.
+
+        Args:
+            image: Image path or array being predicted
+            run: Callable running the model at a given confidence threshold
+            **params: Inference parameters that change the raw predictions
+
+        Returns:
+            Detections at self.confidence_threshold
+        """
+        cache = self.result_cache
+        if cache is None or self.confidence_threshold < cache.floor:
+            return run(self.confidence_threshold)
+
+        key = cache_key(
+            image=image_fingerprint(image),
+            weights=weights_hash(self.model_path),
+            backend=self.backend,
+            precision=self.precision,
+            floor=cache.floor,
+            **params,
+        )
+        detections = cache.get(key)
+        if detections is None:
+            detections = run(cache.floor)
+            cache.put(key, detections)
+
+        return detections[detections.conf >= self.confidence_threshold]
+
+    def _detect_tiles(
+        self,
+        image: np.ndarray,
+        origins: List[Tuple[int, int]],
+        tile_size: int,
+        stride: int,
+        conf: Optional[float] = None,
+        kept: Optional[AbstractSet[Tuple[int, int]]] = None,
+    ) -> torch.Tensor:
+        """
+        Run one model call over a batch of tiles.
+
+        Args:
+            image: RGB scene array (H, W, 3)
+            origins: (x, y) origins of the tiles in this batch
+            tile_size: Size of each tile in pixels
+            stride: Step between tiles, used to derive the seam width
+            conf: Confidence threshold (defaults to self.confidence_threshold)
+            kept: Origins of all tiles inferred for the scene, when some
+                were skipped
+
+        Returns:
+            Tensor (M, 6) of seam-filtered boxes in scene coordinates
+        """
+        return torch.cat(
+            self._detect_tile_boxes(image, origins, tile_size, stride, conf, kept)
+        )
+
+    def _detect_tile_boxes(
+        self,
+        image: np.ndarray,
+        origins: List[Tuple[int, int]],
+        tile_size: int,
+        stride: int,
+        conf: Optional[float] = None,
+        kept: Optional[AbstractSet[Tuple[int, int]]] = None,
+    ) -> List[torch.Tensor]:
+        """
+        Run one model call over a batch of tiles, keeping boxes per tile.
+
+        Args:
+            image: RGB scene array (H, W, 3)
+            origins: (x, y) origins of the tiles in this batch
             tile_size: Size of each tile in pixels
-            overlap: Overlap ratio between tiles (0.0 to 1.0)
+            stride: Step between tiles, used to derive the seam width
+            conf: Confidence threshold (defaults to self.confidence_threshold)
+            kept: Origins of all tiles inferred for the scene, when some
+                were skipped; seams are only cut towards kept tiles
 
         Returns:
-            List of detections with global coordinates
+            One tensor (M, 6) of seam-filtered scene-coordinate boxes per tile
         """
-        # TODO: Implement tiled detection with NMS
-        raise NotImplementedError("Tiled detection coming in v2.1")
+        height, width = image.shape[:2]
+
+        # Ultralytics expects BGR arrays; reversed channel views avoid copies
+        tiles = [image[y : y + tile_size, x : x + tile_size, ::-1] for x, y in origins]
+        results = self._predict(
+            tiles,
+            imgsz=tile_size,
+            conf=self.confidence_threshold if conf is None else conf,
+            device=self.device,
+            verbose=False,
+        )
+
+        shifted = []
+        for (x, y), result in zip(origins, results):
+            data = result.boxes.data
+            data = data[
+                ~_cut_by_seam(
+                    data[:, :4],
+                    (x, y),
+                    result.orig_shape,
+                    (height, width),
+                    tile_size - stride,
+                    kept,
+                )
+            ]
+            offset = data.new_tensor([x, y, x, y])
+            shifted.append(torch.cat([data[:, :4] + offset, data[:, 4:]], dim=1))
+
+        return shifted
+
+    @staticmethod
+    def _as_source(image: Union[Path, np.ndarray]) -> Union[str, np.ndarray]:
+        """
+        Convert an image argument to an Ultralytics source.
+
+        Ultralytics reads arrays as BGR, so RGB arrays are handed over as a
+        reversed channel view rather than a copy.
+        """
+        if isinstance(image, np.ndarray):
+            return image[..., ::-1]
+        return str(image)
+
+    @staticmethod
+    def _load_image(image: Union[Path, np.ndarray]) -> np.ndarray:
+        """Load an image as an RGB uint8 array, passing arrays through."""
+        if isinstance(image, np.ndarray):
+            return image
+        with Image.open(image) as img:
+            return np.asarray(img.convert("RGB"))
+
+    def _to_detections(self, result) -> Detections:
+        """Extract boxes of one Ultralytics result with a single device transfer."""
+        return Detections.from_data(result.boxes.data.cpu().numpy(), self.model.names)
 
     @property
     def is_gpu_available(self) -> bool:
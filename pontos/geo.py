@@ -1,57 +1,549 @@
 """Geospatial utilities for coordinate transformations and exports."""
 
+import gzip
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pyproj import Transformer
+
+    from pontos.detections import Detections
+    from pontos.tracking import Track
+
+WGS84 = "EPSG:4326"
+
+# Metres per degree of latitude on the mean Earth sphere
+_METERS_PER_DEGREE = np.pi * 6_371_008.8 / 180
+
+# Export formats and the file extension each is written with by default
+EXPORT_FORMATS = {
+    "geojson": ".geojson",
+    "geojsonseq": ".geojsons",
+    "flatgeobuf": ".fgb",
+    "geoparquet": ".parquet",
+}
+
+# Little-endian WKB Point: byte order, geometry type, x, y (21 bytes, packed)
+_WKB_POINT = np.dtype(
+    [("byte_order", "u1"), ("type", "<u4"), ("x", "<f8"), ("y", "<f8")]
+)
+
+# One compact GeoJSON Point feature; floats use repr for round-trip precision
+_FEATURE = (
+    '{"type":"Feature","geometry":{"type":"Point","coordinates":[%r,%r]},'
+    '"properties":{"id":%d,"confidence":%r,"class":%s%s}}'
+)
+
+
+@lru_cache(maxsize=None)
+def _transformer(crs: str) -> "Transformer":
+    """
+    Transformer from a scene CRS to WGS84, built once per process.
+
+    Building a Transformer looks the operation up in the PROJ database, which
+    costs far more than transforming a batch of points, so they are shared.
+
+    Args:
+        crs: Source CRS, anything pyproj accepts (e.g. 'EPSG:32631')
+
+    Returns:
+        Transformer taking (x, y) and returning (lon, lat)
+    """
+    # pyproj loads the PROJ database, so only pay for it on projected scenes
+    from pyproj import Transformer
+
+    return Transformer.from_crs(crs, WGS84, always_xy=True)
+
+
+def utm_crs(bbox: Tuple[float, float, float, float]) -> str:
+    """
+    UTM zone holding the center of a WGS84 bounding box.
+
+    Args:
+        bbox: (min_lon, min_lat, max_lon, max_lat)
+
+    Returns:
+        CRS code, e.g. 'EPSG:32631' (north) or 'EPSG:32731' (south)
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    lon, lat = (min_lon + max_lon) / 2, (min_lat + max_lat) / 2
+    zone = min(int((lon + 180) // 6) + 1, 60)
+    return f"EPSG:{32600 + zone if lat >= 0 else 32700 + zone}"
+
+
+def _columns(
+    detections: Union[List[dict], "Detections"],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Centers, confidences and class names of detections as arrays.
+
+    Args:
+        detections: Detections, or list of detection dicts with 'center'
+            and 'confidence'
+
+    Returns:
+        (centers (N, 2), confidences (N,) float32, class names (N,) object)
+    """
+    if hasattr(detections, "centers"):
+        # Look each class up once rather than once per detection
+        ids, inverse = np.unique(detections.class_id, return_inverse=True)
+        names = [detections.names.get(idx, str(idx)) for idx in ids.tolist()]
+        classes = np.array(names, dtype=object)[inverse.reshape(-1)]
+        return detections.centers, detections.conf, classes
+
+    return (
+        np.array([det["center"] for det in detections], dtype=np.float64),
+        np.array([det["confidence"] for det in detections], dtype=np.float32),
+        np.array([det.get("class", "vessel") for det in detections], dtype=object),
+    )
+
+
+class FeatureWriter:
+    """
+    Stream detections to a GeoJSON FeatureCollection or GeoJSONSeq file.
+
+    Features are formatted and written in chunks as each batch of detections
+    arrives, so memory stays flat however many scenes are exported and the
+    output is compact rather than indented. Feature ids run on across
+    write() calls. Vessel tracks are streamed the same way as LineStrings
+    with write_tracks().
+
+    Example:
+        >>> with FeatureWriter("vessels.geojsons.gz", sequence=True) as writer:
+        ...     for scene, detections in results:
+        ...         writer.write(detections, scene.bbox, scene.size)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sequence: bool = False,
+        compress: Optional[bool] = None,
+        chunk_size: int = 65536,
+    ):
+        """
+        Open the output file.
+
+        Args:
+            path: Output path; parent directories are created
+            sequence: Write newline-delimited GeoJSONSeq instead of a
+                FeatureCollection
+            compress: Gzip the output (defaults to a '.gz' suffix on path)
+            chunk_size: Features formatted per write to the file
+        """
+        self.path = Path(path)
+        self.sequence = sequence
+        self.chunk_size = chunk_size
+        self.count = 0
+
+        if compress is None:
+            compress = self.path.suffix == ".gz"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if compress:
+            self._file = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
+
+        if not sequence:
+            self._file.write('{"type":"FeatureCollection","features":[')
+
+    def write(
+        self,
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        crs: str = WGS84,
+        properties: Optional[dict] = None,
+    ) -> int:
+        """
+        Append the detections of one scene.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+            properties: Extra properties added to every feature, e.g. the
+                acquisition time
+
+        Returns:
+            Number of features written
+        """
+        centers, confidences, classes = _columns(detections)
+        coords = GeoExporter.pixels_to_geo(centers, bbox, image_size, crs)
+        # float32 scores carry noise digits once widened; 6 decimals is exact
+        confidences = np.round(confidences.astype(np.float64), 6)
+        extra = "," + json.dumps(properties)[1:-1] if properties else ""
+        quoted = {name: json.dumps(name) for name in set(classes.tolist())}
+
+        separator = "\n" if self.sequence else ","
+        for start in range(0, len(coords), self.chunk_size):
+            stop = start + self.chunk_size
+            rows = zip(
+                coords[start:stop, 0].tolist(),
+                coords[start:stop, 1].tolist(),
+                range(self.count + start, self.count + min(stop, len(coords))),
+                confidences[start:stop].tolist(),
+                classes[start:stop].tolist(),
+            )
+            features = [
+                _FEATURE % (lon, lat, idx, conf, quoted[name], extra)
+                for lon, lat, idx, conf, name in rows
+            ]
+            if self.sequence:
+                self._file.write("\n".join(features) + "\n")
+            else:
+                prefix = "" if self.count + start == 0 else separator
+                self._file.write(prefix + separator.join(features))
+
+        self.count += len(coords)
+        return len(coords)
+
+    def write_tracks(self, tracks: Iterable["Track"]) -> int:
+        """
+        Append vessel tracks as LineString features.
+
+        Each feature carries the track id, its first and last acquisition
+        times, the time of every vertex and the mean confidence.
+
+        Args:
+            tracks: Tracks of at least two positions, e.g. as returned by
+                TrackLinker.update()
+
+        Returns:
+            Number of features written
+        """
+        separator = "\n" if self.sequence else ","
+        written = 0
+        for track in tracks:
+            times = [time.isoformat() for time in track.times]
+            feature = json.dumps(
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [list(point) for point in track.coords],
+                    },
+                    "properties": {
+                        "id": track.id,
+                        "start": times[0],
+                        "end": times[-1],
+                        "times": times,
+                        "confidence": round(float(np.mean(track.confidence)), 6),
+                    },
+                },
+                separators=(",", ":"),
+            )
+            if self.sequence:
+                self._file.write(feature + "\n")
+            else:
+                self._file.write(("" if self.count == 0 else separator) + feature)
+            self.count += 1
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Finish the FeatureCollection and close the file."""
+        if self._file.closed:
+            return
+        if not self.sequence:
+            self._file.write("]}\n")
+        self._file.close()
+
+    def __enter__(self) -> "FeatureWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class GeoExporter:
     """Export detections to geospatial formats."""
 
+    @staticmethod
+    def export(
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        output_path: Path,
+        format: str = "geojson",
+        crs: str = WGS84,
+        merge_distance: Optional[float] = None,
+    ) -> Path:
+        """
+        Export detections in one of EXPORT_FORMATS.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            output_path: Output path; a '.gz' suffix gzips GeoJSON formats
+            format: 'geojson', 'geojsonseq', 'flatgeobuf' or 'geoparquet'
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+            merge_distance: Merge detections closer than this many metres
+                first, see merge_duplicates() (default: no merging)
+
+        Returns:
+            Path to the saved file
+        """
+        output_path = Path(output_path)
+        if merge_distance is not None:
+            detections = GeoExporter.merge_duplicates(
+                detections, bbox, image_size, merge_distance, crs
+            )
+        if format in ("geojson", "geojsonseq"):
+            with FeatureWriter(output_path, sequence=format == "geojsonseq") as writer:
+                writer.write(detections, bbox, image_size, crs)
+            return output_path
+        if format == "flatgeobuf":
+            return GeoExporter.to_flatgeobuf(
+                detections, bbox, image_size, output_path, crs
+            )
+        if format == "geoparquet":
+            return GeoExporter.to_geoparquet(
+                detections, bbox, image_size, output_path, crs
+            )
+        raise ValueError(
+            f"Unknown export format '{format}', expected one of "
+            f"{', '.join(EXPORT_FORMATS)}"
+        )
+
+    @staticmethod
+    def merge_duplicates(
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        distance: float,
+        crs: str = WGS84,
+    ) -> Union[List[dict], "Detections"]:
+        """
+        Drop repeated detections of the same vessel.
+
+        Mosaic sub-requests and overlapping tiles can report one vessel more
+        than once. Detections closer than ``distance`` metres on the ground
+        are merged onto the most confident one, as in pontos.dedup.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            distance: Merge distance in metres
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+
+        Returns:
+            The detections kept, of the same type as ``detections``
+        """
+        from pontos.dedup import deduplicate
+
+        centers, confidences, _ = _columns(detections)
+        coords = GeoExporter.pixels_to_geo(centers, bbox, image_size, crs)
+        keep = deduplicate(coords, confidences, distance=distance)
+        if hasattr(detections, "centers"):
+            return detections[keep]
+        return [detections[idx] for idx in keep.tolist()]
+
+    @staticmethod
+    def to_geoparquet(
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        output_path: Path,
+        crs: str = WGS84,
+    ) -> Path:
+        """
+        Write detections as GeoParquet 1.0 points (requires pyarrow).
+
+        Columns are built straight from the detection arrays, including the
+        WKB point geometries, without a Python object per detection.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            output_path: Output .parquet path
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+
+        Returns:
+            Path to the saved file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        coords, confidences, classes = GeoExporter._point_columns(
+            detections, bbox, image_size, crs
+        )
+
+        # WKB points are fixed-size records, so the binary column is built
+        # from two numpy buffers rather than a million bytes objects
+        wkb = np.empty(len(coords), dtype=_WKB_POINT)
+        wkb["byte_order"], wkb["type"] = 1, 1
+        wkb["x"], wkb["y"] = coords[:, 0], coords[:, 1]
+        offsets = np.arange(len(coords) + 1, dtype=np.int64) * _WKB_POINT.itemsize
+        geometry = pa.Array.from_buffers(
+            pa.large_binary(),
+            len(coords),
+            [None, pa.py_buffer(offsets), pa.py_buffer(wkb)],
+        )
+
+        # Without a "crs" entry, GeoParquet readers assume OGC:CRS84 lon/lat
+        geo = {
+            "version": "1.0.0",
+            "primary_column": "geometry",
+            "columns": {
+                "geometry": {
+                    "encoding": "WKB",
+                    "geometry_types": ["Point"],
+                    "bbox": (
+                        [*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist()]
+                        if len(coords)
+                        else []
+                    ),
+                }
+            },
+        }
+        table = pa.table(
+            {
+                "id": pa.array(np.arange(len(coords), dtype=np.int64)),
+                "confidence": pa.array(confidences),
+                "class": pa.array(classes, pa.string()).dictionary_encode(),
+                "geometry": geometry,
+            },
+            metadata={"geo": json.dumps(geo)},
+        )
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, output_path, compression="zstd")
+        return output_path
+
+    @staticmethod
+    def to_flatgeobuf(
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        output_path: Path,
+        crs: str = WGS84,
+    ) -> Path:
+        """
+        Write detections as FlatGeobuf points (requires pyogrio).
+
+        The file carries a packed R-tree, so GIS tools can read just the
+        features of a window without scanning the whole file.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            output_path: Output .fgb path
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+
+        Returns:
+            Path to the saved file
+        """
+        import shapely
+        from pyogrio.raw import write
+
+        coords, confidences, classes = GeoExporter._point_columns(
+            detections, bbox, image_size, crs
+        )
+        geometry = shapely.to_wkb(shapely.points(coords))
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write(
+            str(output_path),
+            geometry=geometry,
+            field_data=[np.arange(len(coords), dtype=np.int64), confidences, classes],
+            fields=["id", "confidence", "class"],
+            driver="FlatGeobuf",
+            geometry_type="Point",
+            crs=WGS84,
+        )
+        return output_path
+
+    @staticmethod
+    def _point_columns(
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        crs: str,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """WGS84 coordinates, confidences and class names of detections."""
+        centers, confidences, classes = _columns(detections)
+        coords = GeoExporter.pixels_to_geo(centers, bbox, image_size, crs)
+        return coords, confidences.astype(np.float32), classes
+
     @staticmethod
     def detections_to_geojson(
-        detections: List[dict],
+        detections: Union[List[dict], "Detections"],
         bbox: Tuple[float, float, float, float],
         image_size: Tuple[int, int],
         output_path: Path,
+        crs: str = WGS84,
     ) -> Path:
         """
         Convert pixel-based detections to GeoJSON with geographic coordinates.
 
         Args:
-            detections: List of detection dicts with 'bbox' and 'confidence'
-            bbox: Geographic bounding box (min_lon, min_lat, max_lon, max_lat)
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
             image_size: Image dimensions (width, height) in pixels
             output_path: Path to save GeoJSON file
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
 
         Returns:
             Path to saved GeoJSON file
         """
-        features = []
+        return GeoExporter.export(
+            detections, bbox, image_size, output_path, "geojson", crs
+        )
 
-        for idx, detection in enumerate(detections):
-            # Convert pixel coordinates to geographic coordinates
-            cx_px, cy_px = detection["center"]
-            lon, lat = GeoExporter._pixel_to_geo(cx_px, cy_px, bbox, image_size)
+    @staticmethod
+    def pixels_to_geo(
+        points: np.ndarray,
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        crs: str = WGS84,
+    ) -> np.ndarray:
+        """
+        Convert many pixel coordinates to geographic coordinates at once.
 
-            feature = {
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [lon, lat]},
-                "properties": {
-                    "id": idx,
-                    "confidence": detection["confidence"],
-                    "class": detection.get("class", "vessel"),
-                },
-            }
-            features.append(feature)
+        Pixels map linearly onto the scene grid in its own CRS, which is
+        where the scene is actually sampled, and are then reprojected to
+        WGS84. For scenes requested on a WGS84 grid this is the plain
+        linear mapping of _pixel_to_geo().
 
-        geojson = {"type": "FeatureCollection", "features": features}
+        Args:
+            points: Pixel coordinates (N, 2) as [x, y], e.g. box centers or
+                ``xyxy.reshape(-1, 2)`` for box corners
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            crs: CRS of the scene grid, e.g. utm_crs(wgs84_bbox)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(geojson, f, indent=2)
+        Returns:
+            Array (N, 2) of [longitude, latitude] in WGS84
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        min_x, min_y, max_x, max_y = bbox
+        width, height = image_size
 
-        return output_path
+        x = min_x + points[:, 0] * ((max_x - min_x) / width)
+        y = max_y - points[:, 1] * ((max_y - min_y) / height)
+
+        if crs != WGS84:
+            x, y = _transformer(crs).transform(x, y)
+
+        return np.column_stack([x, y])
 
     @staticmethod
     def _pixel_to_geo(
@@ -0,0 +1,193 @@
+"""Land masks rasterized from coastline polygons to skip inland tiles."""
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import shapely
+from PIL import Image, ImageDraw
+from shapely import affinity
+from shapely.geometry import Polygon, box, shape
+from shapely.geometry.base import BaseGeometry
+
+from pontos.cache import DiskCache, cache_key, image_fingerprint
+from pontos.config import config
+from pontos.geo import _METERS_PER_DEGREE
+
+# Part of raster cache keys; bumped when rasterization changes so masks
+# cached by an older version are not reused
+_RASTER_VERSION = 2
+
+
+class LandMask:
+    """
+    Land polygons rasterized onto scene grids.
+
+    Rasters follow the same linear bbox-to-pixel mapping as GeoExporter, so
+    mask pixels line up with scene pixels. They are cached on disk per
+    dataset, bbox, size and buffer, since a monitored area is rasterized
+    again on every pass.
+    """
+
+    def __init__(
+        self,
+        polygons: Iterable[BaseGeometry],
+        cache: Optional[DiskCache] = None,
+        source: Optional[str] = None,
+    ):
+        """
+        Index land polygons.
+
+        Args:
+            polygons: Land (Multi)Polygons in WGS84 lon/lat
+            cache: Raster cache (defaults to one under config.data_dir)
+            source: Identifier of the dataset for cache keys (defaults to a
+                hash of the polygons)
+        """
+        self.polygons = [
+            polygon
+            for geometry in polygons
+            for polygon in getattr(geometry, "geoms", [geometry])
+            if isinstance(polygon, Polygon) and not polygon.is_empty
+        ]
+        self._tree = shapely.STRtree(self.polygons)
+        self.source = (
+            source
+            or hashlib.blake2b(
+                b"".join(shapely.to_wkb(polygon) for polygon in self.polygons),
+                digest_size=16,
+            ).hexdigest()
+        )
+        self.cache = cache or DiskCache(
+            config.data_dir / "cache" / "landmask", max_bytes=256 * 1024 * 1024
+        )
+
+    @classmethod
+    def from_file(cls, path: Path, cache: Optional[DiskCache] = None) -> "LandMask":
+        """
+        Load land polygons from a vector dataset.
+
+        GeoJSON is read directly; other formats (Shapefile, GeoPackage, ...)
+        are read with geopandas and reprojected to WGS84.
+
+        Args:
+            path: Land polygon dataset, e.g. OpenStreetMap land polygons
+            cache: Raster cache (defaults to one under config.data_dir)
+
+        Returns:
+            LandMask over the dataset
+        """
+        path = Path(path)
+        if path.suffix.lower() in (".geojson", ".json"):
+            data = json.loads(path.read_text())
+            features = data.get("features", [data])
+            polygons = [shape(feature.get("geometry", feature)) for feature in features]
+        else:
+            import geopandas
+
+            polygons = list(geopandas.read_file(path).to_crs(4326).geometry)
+
+        return cls(polygons, cache=cache, source=image_fingerprint(path))
+
+    def rasterize(
+        self,
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        buffer_m: float = 0.0,
+    ) -> np.ndarray:
+        """
+        Rasterize the land polygons onto a scene grid.
+
+        Args:
+            bbox: Scene bounding box (min_lon, min_lat, max_lon, max_lat)
+            image_size: Scene dimensions (width, height) in pixels
+            buffer_m: Land within this many meters of the coast counts as
+                water, so tiles holding harbour berths and quays are kept
+
+        Returns:
+            Boolean array (height, width), True on land
+        """
+        key = cache_key(
+            version=_RASTER_VERSION,
+            source=self.source,
+            bbox=[float(coord) for coord in bbox],
+            size=list(image_size),
+            buffer_m=float(buffer_m),
+        )
+        mask = self.cache.get(key)
+        if mask is None:
+            mask = self._rasterize(bbox, image_size, buffer_m)
+            self.cache.put(key, mask)
+        return mask
+
+    def _rasterize(
+        self,
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        buffer_m: float,
+    ) -> np.ndarray:
+        """Draw the polygons intersecting the bbox into a boolean raster."""
+        min_lon, min_lat, max_lon, max_lat = bbox
+        width, height = image_size
+        scene = box(*bbox)
+
+        # Buffer in a frame where one unit is the same distance on both axes
+        lon_scale = math.cos(math.radians((min_lat + max_lat) / 2))
+        shrink = buffer_m / _METERS_PER_DEGREE
+
+        # Split datasets cut land along arbitrary lines, so the pieces are
+        # merged before buffering; otherwise every cut would shrink into a
+        # strip of fake water. The area is grown by twice the buffer so land
+        # just outside the scene still holds the coast in place.
+        margin_lat = 2 * shrink
+        margin_lon = margin_lat / max(lon_scale, 1e-6)
+        area = (
+            min_lon - margin_lon,
+            min_lat - margin_lat,
+            max_lon + margin_lon,
+            max_lat + margin_lat,
+        )
+        hits = self._tree.query(box(*area))
+        if not len(hits):
+            return np.zeros((height, width), dtype=bool)
+        land = shapely.union_all(
+            shapely.clip_by_rect([self.polygons[index] for index in hits], *area)
+        )
+        if shrink > 0:
+            land = affinity.scale(land, lon_scale, 1.0, origin=(0, 0))
+            land = land.buffer(-shrink)
+            land = affinity.scale(land, 1 / lon_scale, 1.0, origin=(0, 0))
+        land = land.intersection(scene)
+
+        raster = Image.new("1", (width, height), 0)
+        for polygon in getattr(land, "geoms", [land]):
+            if not isinstance(polygon, Polygon) or polygon.is_empty:
+                continue
+            rings = []
+            for ring in [polygon.exterior, *polygon.interiors]:
+                lon, lat = np.asarray(ring.coords).T
+                x = (lon - min_lon) / (max_lon - min_lon) * width
+                y = (max_lat - lat) / (max_lat - min_lat) * height
+                rings.append((x, y))
+
+            # Holes only clear their own polygon: each polygon is drawn
+            # on a layer over its pixel extent and merged into the
+            # raster, so an island inside another polygon's lake stays
+            x, y = rings[0]
+            left, top = max(int(x.min()) - 1, 0), max(int(y.min()) - 1, 0)
+            right = min(int(math.ceil(x.max())) + 2, width)
+            bottom = min(int(math.ceil(y.max())) + 2, height)
+            if right <= left or bottom <= top:
+                continue
+            layer = Image.new("1", (right - left, bottom - top), 0)
+            draw = ImageDraw.Draw(layer)
+            for fill, (x, y) in zip([1] + [0] * (len(rings) - 1), rings):
+                draw.polygon(
+                    list(zip((x - left).tolist(), (y - top).tolist())), fill=fill
+                )
+            raster.paste(1, (left, top), mask=layer)
+
+        return np.asarray(raster, dtype=bool)
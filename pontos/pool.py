@@ -0,0 +1,355 @@
+"""Process-pool CPU inference for VesselDetector."""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import torch
+
+from pontos.backends import export_model, limit_threads
+from pontos.config import config
+from pontos.detections import Detections
+from pontos.detector import (
+    TileStats,
+    VesselDetector,
+    _merge_tile_boxes,
+    _skip_masked_tiles,
+    _tile_grid,
+)
+
+# (shared memory name, shape, dtype string) describing an array in shared memory
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+# Per-process state, populated by _init_worker in each pool process
+_detector: Optional[VesselDetector] = None
+_segments: Dict[str, SharedMemory] = {}
+
+
+def _share_array(array: np.ndarray) -> Tuple[SharedMemory, ArraySpec]:
+    """
+    Copy an array into a new shared memory block.
+
+    Args:
+        array: Array to share with worker processes
+
+    Returns:
+        The owning SharedMemory handle and a picklable spec to attach to it
+    """
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _release(shm: SharedMemory) -> None:
+    """Close and unlink a shared memory block owned by this process."""
+    shm.close()
+    shm.unlink()
+
+
+def _attach_array(spec: ArraySpec) -> np.ndarray:
+    """
+    Map an array shared by the parent process without copying it.
+
+    Segments stay mapped while Ultralytics still references the last batch
+    and are closed lazily once a newer segment is requested. Spawned workers
+    share the parent's resource tracker, so attaching does not take
+    ownership and the parent alone unlinks the block.
+
+    Args:
+        spec: Spec returned by _share_array
+
+    Returns:
+        Array view backed by shared memory
+    """
+    name, shape, dtype = spec
+    if name not in _segments:
+        for stale in list(_segments):
+            try:
+                _segments[stale].close()
+            except BufferError:
+                continue
+            del _segments[stale]
+
+        _segments[name] = SharedMemory(name=name)
+
+    # frombuffer holds a buffer export, so close() cannot unmap a live view
+    count = int(np.prod(shape))
+    return np.frombuffer(_segments[name].buf, np.dtype(dtype), count).reshape(shape)
+
+
+def _init_worker(
+    model_path: Optional[Path],
+    confidence_threshold: float,
+    num_threads: int,
+    backend: str = "torch",
+    precision: str = "fp32",
+    calibration_data: Optional[str] = None,
+) -> None:
+    """Limit inference threads and load the model once per worker process."""
+    global _detector
+
+    limit_threads(num_threads)
+    _detector = VesselDetector(
+        model_path=model_path,
+        device="cpu",
+        confidence_threshold=confidence_threshold,
+        backend=backend,
+        precision=precision,
+        calibration_data=calibration_data,
+    )
+    _detector.model  # noqa: B018 - load eagerly so startup errors surface here
+
+
+def _model_names() -> Dict[int, str]:
+    """Return class names of the worker model."""
+    return dict(_detector.model.names)
+
+
+def _detect_tiles_task(
+    spec: ArraySpec,
+    origins: List[Tuple[int, int]],
+    tile_size: int,
+    stride: int,
+    kept: Optional[FrozenSet[Tuple[int, int]]] = None,
+) -> np.ndarray:
+    """Run one batch of tiles of a shared scene in a worker."""
+    image = _attach_array(spec)
+    boxes = _detector._detect_tiles(image, origins, tile_size, stride, kept=kept)
+    return boxes.cpu().numpy()
+
+
+def _detect_batch_task(sources: List[Union[str, ArraySpec]]) -> List[Detections]:
+    """Run one batch of images, given as paths or shared arrays, in a worker."""
+    images = [
+        Path(source) if isinstance(source, str) else _attach_array(source)
+        for source in sources
+    ]
+    return _detector.detect_batch(images, batch_size=len(images))
+
+
+class DetectorPool:
+    """Pool of CPU worker processes, each holding one loaded model."""
+
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        confidence_threshold: float = 0.05,
+        max_workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        backend: Optional[str] = None,
+        precision: Optional[str] = None,
+        calibration_data: Optional[str] = None,
+    ):
+        """
+        Start the worker pool.
+
+        Args:
+            model_path: Path to YOLO model weights (defaults to config.model_path)
+            confidence_threshold: Minimum confidence for detections
+            max_workers: Number of worker processes (defaults to config.max_workers)
+            threads_per_worker: Intra-op threads per worker, for torch, ONNX
+                Runtime and OpenVINO alike (defaults to an even split of the
+                available cores)
+            backend: 'torch', 'onnx' or 'openvino' (defaults to config.backend)
+            precision: Export precision (defaults to config.precision)
+            calibration_data: Dataset YAML calibrating int8 exports
+                (defaults to config.calibration_data)
+        """
+        model_path = model_path or config.model_path
+        backend = backend or config.backend
+        precision = precision or config.precision
+        calibration_data = calibration_data or config.calibration_data
+
+        # Export once here so workers only ever load the cached artifact
+        export_model(
+            model_path,
+            backend,
+            imgsz=config.patch_size,
+            batch=config.batch_size,
+            precision=precision,
+            data=calibration_data,
+        )
+
+        self.max_workers = max_workers or config.max_workers
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.max_workers
+        )
+
+        # Spawn avoids forking a parent whose torch thread pools are running
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                model_path,
+                confidence_threshold,
+                self.threads_per_worker,
+                backend,
+                precision,
+                calibration_data,
+            ),
+        )
+        self._names: Optional[Dict[int, str]] = None
+
+        # Tile counts of the last detect_tiled() call
+        self.tile_stats: Optional[TileStats] = None
+
+    @property
+    def names(self) -> Dict[int, str]:
+        """Class names of the model loaded by the workers."""
+        if self._names is None:
+            self._names = self._executor.submit(_model_names).result()
+        return self._names
+
+    def detect_batch(
+        self,
+        images: Iterable[Union[Path, np.ndarray]],
+        batch_size: Optional[int] = None,
+    ) -> List[Detections]:
+        """
+        Detect vessels in many images across the worker processes.
+
+        Arrays are handed over through shared memory and paths are read by
+        the workers themselves. At most two batches per worker are in flight,
+        so iterators of large scenes are consumed with bounded memory.
+
+        Args:
+            images: Iterable of image paths or RGB uint8 arrays (H, W, 3)
+            batch_size: Number of images per model call (defaults to config.batch_size)
+
+        Returns:
+            One Detections per input image, in input order
+        """
+        batch_size = batch_size or config.batch_size
+        iterator = iter(images)
+
+        pending: Deque[Tuple[List[SharedMemory], Future]] = deque()
+        all_detections = []
+        try:
+            while chunk := list(islice(iterator, batch_size)):
+                segments, sources = [], []
+                for image in chunk:
+                    if isinstance(image, np.ndarray):
+                        shm, spec = _share_array(image)
+                        segments.append(shm)
+                        sources.append(spec)
+                    else:
+                        sources.append(str(image))
+
+                pending.append(
+                    (segments, self._executor.submit(_detect_batch_task, sources))
+                )
+                if len(pending) >= 2 * self.max_workers:
+                    all_detections.extend(self._collect(pending.popleft()))
+
+            while pending:
+                all_detections.extend(self._collect(pending.popleft()))
+        finally:
+            for segments, future in pending:
+                future.cancel()
+                for shm in segments:
+                    _release(shm)
+
+        return all_detections
+
+    def detect_tiled(
+        self,
+        image_path: Union[Path, np.ndarray],
+        tile_size: Optional[int] = None,
+        overlap: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        iou_threshold: float = 0.5,
+        cloud_mask: Optional[np.ndarray] = None,
+        max_cloud_fraction: float = 0.5,
+        land_mask: Optional[np.ndarray] = None,
+    ) -> Detections:
+        """
+        Detect vessels with sliding window tiling spread across the workers.
+
+        The scene is placed in shared memory once, workers slice their tile
+        batches from it, and the boxes are merged with a single NMS pass in
+        this process, exactly as VesselDetector.detect_tiled does.
+
+        Args:
+            image_path: Path to input image or RGB uint8 array (H, W, 3)
+            tile_size: Size of each tile in pixels (defaults to config.patch_size)
+            overlap: Overlap ratio between tiles, 0.0 to 1.0 exclusive
+                (defaults to config.patch_overlap)
+            batch_size: Number of tiles per model call (defaults to config.batch_size)
+            iou_threshold: IoU above which overlapping detections are merged
+            cloud_mask: Cloud probability in [0, 1] or boolean mask (H, W);
+                tiles with more than max_cloud_fraction cloudy pixels are
+                dropped before inference
+            max_cloud_fraction: Largest share of cloudy pixels a tile may
+                have and still be inferred
+            land_mask: Boolean mask (H, W), True on land; tiles without a
+                water pixel are dropped before inference
+
+        Returns:
+            Detections with global coordinates
+        """
+        tile_size = tile_size or config.patch_size
+        overlap = config.patch_overlap if overlap is None else overlap
+        batch_size = batch_size or config.batch_size
+
+        image = VesselDetector._load_image(image_path)
+        origins, stride = _tile_grid(image.shape[:2], tile_size, overlap)
+
+        origins, self.tile_stats = _skip_masked_tiles(
+            origins,
+            image.shape[:2],
+            tile_size,
+            cloud_mask,
+            max_cloud_fraction,
+            land_mask,
+        )
+
+        # Seams next to skipped tiles keep their fragments
+        kept = frozenset(origins) if self.tile_stats.skipped else None
+
+        shm, spec = _share_array(image)
+        try:
+            futures = [
+                self._executor.submit(
+                    _detect_tiles_task,
+                    spec,
+                    origins[start : start + batch_size],
+                    tile_size,
+                    stride,
+                    kept,
+                )
+                for start in range(0, len(origins), batch_size)
+            ]
+            boxes = [torch.from_numpy(future.result()) for future in futures]
+        finally:
+            _release(shm)
+
+        return _merge_tile_boxes(boxes, iou_threshold, self.names)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "DetectorPool":
+        """Use the pool as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut down the pool when leaving the context."""
+        self.close()
+
+    @staticmethod
+    def _collect(entry: Tuple[List[SharedMemory], Future]) -> List[Detections]:
+        """Wait for a batch and free its shared memory."""
+        segments, future = entry
+        try:
+            return future.result()
+        finally:
+            for shm in segments:
+                _release(shm)
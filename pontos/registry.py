@@ -0,0 +1,136 @@
+"""Process-wide registry of loaded models."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class ModelStats:
+    """Load and latency figures for one registered model."""
+
+    load_seconds: float = 0.0
+    cold_latency: Optional[float] = None
+    warm_latency: Optional[float] = None
+    hits: int = 0
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether a warmup pass has been run."""
+        return self.warm_latency is not None
+
+
+class ModelRegistry:
+    """
+    Share loaded models between detector instances of one process.
+
+    Models are loaded on first request and kept until clear() is called.
+    Each key has its own lock, so two threads asking for the same model
+    load it once while different models can load concurrently. YOLO
+    predictors keep per-call state and are not thread-safe, so inference on
+    a shared model is serialized through inference_lock().
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._models: Dict[Hashable, Any] = {}
+        self._stats: Dict[Hashable, ModelStats] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._inference_locks: Dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the model for a key, loading it on first use.
+
+        Args:
+            key: Identity of the model, e.g. (weights path, device, backend)
+            loader: Zero-argument callable loading the model
+
+        Returns:
+            The shared model instance
+        """
+        with self._lock_for(key):
+            if key in self._models:
+                self._stats[key].hits += 1
+                return self._models[key]
+
+            start = time.perf_counter()
+            model = loader()
+            self._stats[key] = ModelStats(load_seconds=time.perf_counter() - start)
+            self._models[key] = model
+            return model
+
+    def warmup(
+        self, key: Hashable, loader: Callable[[], Any], run: Callable[[Any], Any]
+    ) -> ModelStats:
+        """
+        Run one cold and one warm inference pass, once per model.
+
+        The first pass pays one-time kernel selection and allocation costs;
+        the second measures steady-state latency.
+
+        Args:
+            key: Identity of the model
+            loader: Zero-argument callable loading the model if needed
+            run: Callable running a dummy inference on the model
+
+        Returns:
+            Stats of the model including cold and warm latency
+        """
+        model = self.get(key, loader)
+        with self._lock_for(key):
+            stats = self._stats[key]
+            if not stats.is_warm:
+                with self.inference_lock(key):
+                    start = time.perf_counter()
+                    run(model)
+                    stats.cold_latency = time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    run(model)
+                    stats.warm_latency = time.perf_counter() - start
+            return stats
+
+    def inference_lock(self, key: Hashable) -> threading.Lock:
+        """
+        Return the lock serializing inference on one shared model.
+
+        Args:
+            key: Identity of the model
+
+        Returns:
+            Lock to hold for the duration of each model call
+        """
+        with self._guard:
+            return self._inference_locks.setdefault(key, threading.Lock())
+
+    def stats(self, key: Hashable) -> Optional[ModelStats]:
+        """Return stats of a loaded model, or None if it is not loaded."""
+        return self._stats.get(key)
+
+    def clear(self) -> None:
+        """Drop all loaded models."""
+        with self._guard:
+            self._models.clear()
+            self._stats.clear()
+            self._locks.clear()
+            self._inference_locks.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a model is loaded for the key."""
+        return key in self._models
+
+    def __len__(self) -> int:
+        """Number of loaded models."""
+        return len(self._models)
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        """Return the lock guarding one key."""
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+# Global registry instance
+registry = ModelRegistry()
@@ -0,0 +1,126 @@
+"""Persistent record of processed acquisitions for incremental monitoring."""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from pontos.sentinel import Acquisition
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS acquisitions (
+    aoi TEXT NOT NULL,
+    datetime TEXT NOT NULL,
+    cloud_cover REAL NOT NULL,
+    tile_ids TEXT NOT NULL,
+    detections INTEGER NOT NULL,
+    output_path TEXT,
+    processed_at TEXT NOT NULL,
+    PRIMARY KEY (aoi, datetime)
+)
+"""
+
+
+def aoi_key(bbox: Tuple[float, float, float, float]) -> str:
+    """
+    Identify an area of interest by its bounding box.
+
+    Args:
+        bbox: Bounding box as (min_lon, min_lat, max_lon, max_lat) in WGS84
+
+    Returns:
+        Canonical 'min_lon,min_lat,max_lon,max_lat' string
+    """
+    return ",".join(repr(float(coord)) for coord in bbox)
+
+
+class MonitorState:
+    """
+    SQLite store of the acquisitions already scored for each area.
+
+    One row per (area, acquisition) is written once its detections have been
+    exported, so an interrupted run only repeats the unfinished acquisitions.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the state database.
+
+        Args:
+            path: SQLite database file, e.g. config.data_dir / 'monitor.sqlite'
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def processed(self, aoi: str) -> Set[datetime]:
+        """
+        Sensing times of the acquisitions already processed for an area.
+
+        Args:
+            aoi: Area key from aoi_key()
+
+        Returns:
+            Set of naive UTC datetimes
+        """
+        rows = self._conn.execute(
+            "SELECT datetime FROM acquisitions WHERE aoi = ?", (aoi,)
+        )
+        return {datetime.fromisoformat(value) for (value,) in rows}
+
+    def last_processed(self, aoi: str) -> Optional[datetime]:
+        """
+        Sensing time of the latest processed acquisition of an area.
+
+        Args:
+            aoi: Area key from aoi_key()
+
+        Returns:
+            Naive UTC datetime, or None if the area was never processed
+        """
+        processed = self.processed(aoi)
+        return max(processed) if processed else None
+
+    def record(
+        self,
+        aoi: str,
+        acquisition: "Acquisition",
+        detections: int,
+        output_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Mark an acquisition as processed.
+
+        Args:
+            aoi: Area key from aoi_key()
+            acquisition: Processed acquisition
+            detections: Number of vessels detected
+            output_path: Where the detections were exported
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO acquisitions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    aoi,
+                    acquisition.datetime.isoformat(),
+                    acquisition.cloud_cover,
+                    json.dumps(list(acquisition.tile_ids)),
+                    detections,
+                    str(output_path) if output_path is not None else None,
+                    datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "MonitorState":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,468 @@
+"""Persistent, spatially indexed store of detections across runs."""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from pontos.dedup import deduplicate
+from pontos.geo import WGS84, GeoExporter, _columns
+
+if TYPE_CHECKING:
+    from pontos.detections import Detections
+
+TimeBound = Union[str, datetime]
+
+# GeoPackage 1.3 file identification (PRAGMA application_id / user_version)
+_GPKG_APPLICATION_ID = 0x47504B47
+_GPKG_USER_VERSION = 10300
+
+# GeoPackage geometry blob of a WGS84 point: 'GP' header without envelope,
+# then a little-endian WKB Point (29 bytes, packed)
+_GPKG_POINT = np.dtype(
+    [
+        ("magic", "S2"),
+        ("version", "u1"),
+        ("flags", "u1"),
+        ("srs_id", "<i4"),
+        ("byte_order", "u1"),
+        ("type", "<u4"),
+        ("x", "<f8"),
+        ("y", "<f8"),
+    ]
+)
+
+_WGS84_WKT = (
+    'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,'
+    'AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,'
+    'AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,'
+    'AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]'
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gpkg_spatial_ref_sys (
+    srs_name TEXT NOT NULL,
+    srs_id INTEGER PRIMARY KEY,
+    organization TEXT NOT NULL,
+    organization_coordsys_id INTEGER NOT NULL,
+    definition TEXT NOT NULL,
+    description TEXT
+);
+INSERT OR IGNORE INTO gpkg_spatial_ref_sys VALUES
+    ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined', NULL),
+    ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined', NULL);
+CREATE TABLE IF NOT EXISTS gpkg_contents (
+    table_name TEXT NOT NULL PRIMARY KEY,
+    data_type TEXT NOT NULL,
+    identifier TEXT UNIQUE,
+    description TEXT DEFAULT '',
+    last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+    min_x DOUBLE,
+    min_y DOUBLE,
+    max_x DOUBLE,
+    max_y DOUBLE,
+    srs_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS gpkg_geometry_columns (
+    table_name TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    geometry_type_name TEXT NOT NULL,
+    srs_id INTEGER NOT NULL,
+    z TINYINT NOT NULL,
+    m TINYINT NOT NULL,
+    PRIMARY KEY (table_name, column_name)
+);
+CREATE TABLE IF NOT EXISTS gpkg_extensions (
+    table_name TEXT,
+    column_name TEXT,
+    extension_name TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    UNIQUE (table_name, column_name, extension_name)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    aoi TEXT NOT NULL,
+    acquired TEXT NOT NULL,
+    detections INTEGER NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS detections (
+    fid INTEGER PRIMARY KEY AUTOINCREMENT,
+    geom POINT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    aoi TEXT NOT NULL,
+    acquired TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    class TEXT NOT NULL,
+    lon REAL NOT NULL,
+    lat REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS detections_acquired ON detections (acquired);
+CREATE INDEX IF NOT EXISTS detections_aoi ON detections (aoi, acquired);
+CREATE INDEX IF NOT EXISTS detections_confidence ON detections (confidence);
+CREATE VIRTUAL TABLE IF NOT EXISTS rtree_detections_geom
+    USING rtree(id, minx, maxx, miny, maxy);
+INSERT OR IGNORE INTO gpkg_contents (table_name, data_type, identifier, srs_id)
+    VALUES ('detections', 'features', 'detections', 4326);
+INSERT OR IGNORE INTO gpkg_geometry_columns
+    VALUES ('detections', 'geom', 'POINT', 4326, 0, 0);
+INSERT OR IGNORE INTO gpkg_extensions VALUES
+    ('detections', 'geom', 'gpkg_rtree_index',
+     'http://www.geopackage.org/spec120/#extension_rtree', 'write-only');
+"""
+
+# Candidates come from the R-tree, whose float32 boxes are rounded outwards,
+# and are then filtered on the exact coordinates
+_RTREE_FILTER = (
+    "fid IN (SELECT id FROM rtree_detections_geom"
+    " WHERE minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?)"
+)
+
+
+@dataclass(frozen=True)
+class StoredDetection:
+    """
+    One detection read back from a DetectionStore.
+
+    Attributes:
+        id: Row id in the store
+        lon: Longitude of the box center in WGS84
+        lat: Latitude of the box center in WGS84
+        confidence: Detection confidence
+        class_name: Class name, e.g. 'vessel'
+        acquired: Sensing time of the scene, naive UTC
+        aoi: Area key of the run that produced it
+    """
+
+    id: int
+    lon: float
+    lat: float
+    confidence: float
+    class_name: str
+    acquired: datetime
+    aoi: str
+
+
+def _time_bounds(
+    time_range: Tuple[TimeBound, TimeBound],
+) -> Tuple[str, str]:
+    """
+    Turn a time range into half-open ISO bounds.
+
+    A date-only end ('2026-01-31') covers that whole day, as in Sentinel Hub
+    time ranges; any other end, datetime or ISO datetime string, is
+    inclusive.
+    """
+    start, end = time_range
+    if isinstance(start, str):
+        start = datetime.fromisoformat(start)
+    if isinstance(end, str) and len(end) == 10:
+        end = datetime.fromisoformat(end) + timedelta(days=1)
+    else:
+        if isinstance(end, str):
+            end = datetime.fromisoformat(end)
+        end += timedelta(microseconds=1)
+    return start.isoformat(), end.isoformat()
+
+
+def _stored(row: tuple) -> StoredDetection:
+    """StoredDetection from a detections row as selected by the store."""
+    fid, lon, lat, confidence, name, acquired, aoi = row
+    return StoredDetection(
+        fid, lon, lat, confidence, name, datetime.fromisoformat(acquired), aoi
+    )
+
+
+class DetectionStore:
+    """
+    GeoPackage of the detections of every run, indexed in space and time.
+
+    Detections are points in a GeoPackage feature table, so QGIS and GDAL
+    open the file directly, with an R-tree over their positions and B-tree
+    indexes on acquisition time, area and confidence. The R-tree is kept up
+    to date by the store itself rather than by SpatiaLite triggers, so
+    tools writing to the table should go through this class.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: GeoPackage file, e.g. config.data_dir / 'detections.gpkg'
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        with self._conn:
+            self._conn.execute(f"PRAGMA application_id = {_GPKG_APPLICATION_ID}")
+            self._conn.execute(f"PRAGMA user_version = {_GPKG_USER_VERSION}")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO gpkg_spatial_ref_sys"
+                " VALUES ('WGS 84 geodetic', 4326, 'EPSG', 4326, ?, ?)",
+                (_WGS84_WKT, "longitude/latitude coordinates in decimal degrees"),
+            )
+
+    def add(
+        self,
+        detections: Union[List[dict], "Detections"],
+        bbox: Tuple[float, float, float, float],
+        image_size: Tuple[int, int],
+        acquired: datetime,
+        aoi: str,
+        crs: str = WGS84,
+    ) -> int:
+        """
+        Append the detections of one scene in a single transaction.
+
+        Args:
+            detections: Detections, or list of detection dicts with 'center'
+                and 'confidence'
+            bbox: Scene bounding box (min_x, min_y, max_x, max_y) in ``crs``
+            image_size: Image dimensions (width, height) in pixels
+            acquired: Sensing time of the scene, naive UTC
+            aoi: Area key, e.g. from pontos.state.aoi_key()
+            crs: CRS of the scene grid (WGS84 for Sentinel Hub downloads)
+
+        Returns:
+            Id of the run the detections were recorded under
+        """
+        centers, confidences, classes = _columns(detections)
+        coords = GeoExporter.pixels_to_geo(centers, bbox, image_size, crs)
+        count = len(coords)
+
+        geometry = np.empty(count, dtype=_GPKG_POINT)
+        geometry["magic"], geometry["version"], geometry["flags"] = b"GP", 0, 1
+        geometry["srs_id"], geometry["byte_order"], geometry["type"] = 4326, 1, 1
+        geometry["x"], geometry["y"] = coords[:, 0], coords[:, 1]
+        blobs = geometry.tobytes()
+        size = _GPKG_POINT.itemsize
+
+        acquired_iso = acquired.isoformat()
+        created = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        lon, lat = coords[:, 0].tolist(), coords[:, 1].tolist()
+
+        with self._conn:
+            run_id = self._conn.execute(
+                "INSERT INTO runs (aoi, acquired, detections, created)"
+                " VALUES (?, ?, ?, ?)",
+                (aoi, acquired_iso, count, created),
+            ).lastrowid
+            if not count:
+                return run_id
+
+            # Reserve a contiguous id range so the R-tree rows can be written
+            # from the same arrays instead of being read back
+            (last,) = self._conn.execute(
+                "SELECT COALESCE(MAX(fid), 0) FROM detections"
+            ).fetchone()
+            ids = range(last + 1, last + 1 + count)
+
+            self._conn.executemany(
+                "INSERT INTO detections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                zip(
+                    ids,
+                    (blobs[i * size : (i + 1) * size] for i in range(count)),
+                    [run_id] * count,
+                    [aoi] * count,
+                    [acquired_iso] * count,
+                    confidences.astype(np.float64).tolist(),
+                    classes.tolist(),
+                    lon,
+                    lat,
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO rtree_detections_geom VALUES (?, ?, ?, ?, ?)",
+                zip(ids, lon, lon, lat, lat),
+            )
+            self._conn.execute(
+                "UPDATE gpkg_contents SET"
+                " min_x = MIN(COALESCE(min_x, ?1), ?1),"
+                " min_y = MIN(COALESCE(min_y, ?2), ?2),"
+                " max_x = MAX(COALESCE(max_x, ?3), ?3),"
+                " max_y = MAX(COALESCE(max_y, ?4), ?4),"
+                " last_change = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+                " WHERE table_name = 'detections'",
+                (min(lon), min(lat), max(lon), max(lat)),
+            )
+        return run_id
+
+    def query(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        time_range: Optional[Tuple[TimeBound, TimeBound]] = None,
+        aoi: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        merge_distance: Optional[float] = None,
+        merge_window: Optional[timedelta] = None,
+    ) -> List[StoredDetection]:
+        """
+        Find stored detections; every given filter must match.
+
+        Overlapping AOIs and repeated scans store the same vessel more than
+        once; with ``merge_distance`` those duplicates are merged by
+        deduplicate(), keeping the most confident record.
+
+        Args:
+            bbox: WGS84 box (min_lon, min_lat, max_lon, max_lat), edges
+                included
+            time_range: (start, end) as datetimes or ISO strings; a
+                date-only end includes that whole day
+            aoi: Area key the detections were stored under
+            min_confidence: Lowest confidence returned
+            merge_distance: Merge detections closer than this many metres
+            merge_window: Only merge detections acquired at most this far
+                apart (default: regardless of time)
+
+        Returns:
+            Matching detections ordered by acquisition time
+        """
+        rows = self._select(bbox, time_range, aoi, min_confidence).fetchall()
+        if merge_distance is not None and rows:
+            _, lon, lat, confidence, _, acquired, _ = zip(*rows)
+            keep = deduplicate(
+                np.column_stack([lon, lat]),
+                confidence,
+                acquired,
+                merge_distance,
+                merge_window,
+            )
+            rows = [rows[idx] for idx in keep.tolist()]
+        return [_stored(row) for row in rows]
+
+    def iter_query(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        time_range: Optional[Tuple[TimeBound, TimeBound]] = None,
+        aoi: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+    ) -> Iterator[StoredDetection]:
+        """
+        Stream stored detections matching the same filters as query().
+
+        Rows are read from the database cursor as the iterator is consumed,
+        so memory stays flat however many detections match. The store must
+        stay open until the iterator is exhausted.
+
+        Yields:
+            Matching detections ordered by acquisition time
+        """
+        for row in self._select(bbox, time_range, aoi, min_confidence):
+            yield _stored(row)
+
+    def count(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        time_range: Optional[Tuple[TimeBound, TimeBound]] = None,
+        aoi: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+    ) -> int:
+        """
+        Count stored detections matching the same filters as query().
+
+        Returns:
+            Number of matching detections
+        """
+        where, params = self._filters(bbox, time_range, aoi, min_confidence)
+        (count,) = self._conn.execute(
+            f"SELECT COUNT(*) FROM detections{where}", params
+        ).fetchone()
+        return count
+
+    def _select(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]],
+        time_range: Optional[Tuple[TimeBound, TimeBound]],
+        aoi: Optional[str],
+        min_confidence: Optional[float],
+    ) -> sqlite3.Cursor:
+        """Cursor over the matching rows in acquisition order."""
+        where, params = self._filters(bbox, time_range, aoi, min_confidence)
+        return self._conn.execute(
+            "SELECT fid, lon, lat, confidence, class, acquired, aoi"
+            f" FROM detections{where} ORDER BY acquired, fid",
+            params,
+        )
+
+    def _filters(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]],
+        time_range: Optional[Tuple[TimeBound, TimeBound]],
+        aoi: Optional[str],
+        min_confidence: Optional[float],
+    ) -> Tuple[str, list]:
+        """Build the WHERE clause and its parameters."""
+        clauses, params = [], []
+        if time_range is not None:
+            time_range = _time_bounds(time_range)
+            clauses.append("acquired >= ? AND acquired < ?")
+            params += time_range
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = map(float, bbox)
+            clauses.append("lon BETWEEN ? AND ? AND lat BETWEEN ? AND ?")
+            params += [min_lon, max_lon, min_lat, max_lat]
+            # SQLite always drives the query from the R-tree when it is
+            # referenced, which is slow for a wide box over a short window
+            if time_range is None or self._spatial_share(bbox) <= self._temporal_share(
+                time_range
+            ):
+                clauses.append(_RTREE_FILTER)
+                params += [max_lon, min_lon, max_lat, min_lat]
+        if aoi is not None:
+            clauses.append("aoi = ?")
+            params.append(aoi)
+        if min_confidence is not None:
+            clauses.append("confidence >= ?")
+            params.append(float(min_confidence))
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def _spatial_share(self, bbox: Tuple[float, float, float, float]) -> float:
+        """Share of the stored extent covered by a bbox."""
+        extent = self._conn.execute(
+            "SELECT min_x, min_y, max_x, max_y FROM gpkg_contents"
+            " WHERE table_name = 'detections'"
+        ).fetchone()
+        if extent[0] is None:
+            return 0.0
+        share = 1.0
+        for low, high, lower, upper in (
+            (bbox[0], bbox[2], extent[0], extent[2]),
+            (bbox[1], bbox[3], extent[1], extent[3]),
+        ):
+            if upper > lower:
+                share *= max(min(high, upper) - max(low, lower), 0.0) / (upper - lower)
+        return share
+
+    def _temporal_share(self, time_range: Tuple[str, str]) -> float:
+        """Share of the stored time span covered by half-open ISO bounds."""
+        # Separate subqueries let each end be read off the index
+        first, last = self._conn.execute(
+            "SELECT (SELECT MIN(acquired) FROM detections),"
+            " (SELECT MAX(acquired) FROM detections)"
+        ).fetchone()
+        if first is None:
+            return 0.0
+        first, last = datetime.fromisoformat(first), datetime.fromisoformat(last)
+        if last <= first:
+            return 1.0
+        start, end = (datetime.fromisoformat(bound) for bound in time_range)
+        overlap = min(end, last) - max(start, first)
+        return max(overlap / (last - first), 0.0)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "DetectionStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,262 @@
+"""Link detections of successive acquisitions into vessel tracks."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import numpy as np
+import shapely
+
+from pontos.dedup import _distance
+from pontos.geo import _METERS_PER_DEGREE
+
+
+@dataclass(eq=False)
+class Track:
+    """
+    Positions of one vessel over successive acquisitions.
+
+    Attributes:
+        id: Track id, unique within the TrackLinker that built it
+        times: Acquisition time of each position, naive UTC
+        coords: WGS84 positions as (lon, lat)
+        confidence: Detection confidence at each position
+    """
+
+    id: int
+    times: List[datetime] = field(default_factory=list)
+    coords: List[Tuple[float, float]] = field(default_factory=list)
+    confidence: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of positions."""
+        return len(self.times)
+
+    def to_linestring(self) -> shapely.LineString:
+        """Track as a WGS84 LineString (needs at least two positions)."""
+        return shapely.LineString(self.coords)
+
+
+def _assign(
+    rows: np.ndarray, columns: np.ndarray, cost: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy one-to-one matching, cheapest candidate pair first.
+
+    Rather than walking the pairs one by one, each round accepts every pair
+    that is the cheapest remaining one of both its row and its column, which
+    is exactly the set the sequential greedy would accept next, and drops
+    the pairs those use up.
+
+    Args:
+        rows: Row of each candidate pair
+        columns: Column of each candidate pair
+        cost: Cost of each candidate pair
+
+    Returns:
+        (rows, columns) of the accepted pairs
+    """
+    order = np.argsort(cost, kind="stable")
+    rows, columns = rows[order], columns[order]
+    size = len(rows)
+    first_row = np.empty(rows.max() + 1 if size else 0, dtype=np.int64)
+    first_column = np.empty(columns.max() + 1 if size else 0, dtype=np.int64)
+
+    matched_rows, matched_columns = [], []
+    while len(rows):
+        # Position of the cheapest remaining pair of each row and column
+        position = np.arange(len(rows))
+        first_row[rows] = size
+        first_column[columns] = size
+        np.minimum.at(first_row, rows, position)
+        np.minimum.at(first_column, columns, position)
+        best = (first_row[rows] == position) & (first_column[columns] == position)
+        matched_rows.append(rows[best])
+        matched_columns.append(columns[best])
+
+        # Rows and columns matched this round now point at an accepted pair
+        free = ~best[first_row[rows]] & ~best[first_column[columns]]
+        rows, columns = rows[free], columns[free]
+
+    if not matched_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(matched_rows), np.concatenate(matched_columns)
+
+
+class TrackLinker:
+    """
+    Link detection batches arriving in time order into tracks.
+
+    Each batch holds the detections of one acquisition. A detection can
+    extend an active track if it lies within the track's gate: ``distance``
+    plus the ground ``max_speed`` covers in the time since the track was
+    last seen. Candidates come from an STRtree over the batch. Tracks and
+    detections are then matched greedily, pairs closest to the position
+    predicted from the track's last velocity first; detections left over
+    start new tracks.
+
+    Tracks not seen for longer than ``max_gap`` are finished and handed back
+    by update(), so memory is bounded by the vessels currently in view
+    rather than by the length of the stream.
+
+    Example:
+        >>> linker = TrackLinker(max_speed=8.0)
+        >>> for acquired, coords, confidence in batches:
+        ...     writer.write_tracks(linker.update(coords, confidence, acquired))
+        >>> writer.write_tracks(linker.finish())
+    """
+
+    def __init__(
+        self,
+        distance: float = 100.0,
+        max_speed: float = 10.0,
+        max_gap: timedelta = timedelta(days=6),
+        min_points: int = 2,
+    ):
+        """
+        Configure gating.
+
+        Args:
+            distance: Gate radius in metres for simultaneous positions,
+                covering position noise
+            max_speed: Fastest ground speed linked, in metres per second
+                (10 m/s is about 19 knots)
+            max_gap: Tracks not seen for longer than this are finished; the
+                default spans one Sentinel-2 revisit
+            min_points: Finished tracks with fewer positions are dropped
+        """
+        self.distance = distance
+        self.max_speed = max_speed
+        self.max_gap = max_gap
+        self.min_points = min_points
+
+        self._tracks: List[Track] = []
+        self._heads = np.empty((0, 2), dtype=np.float64)
+        self._seen = np.empty(0, dtype="datetime64[us]")
+        self._velocity = np.empty((0, 2), dtype=np.float64)
+        self._last = None
+        self._next_id = 0
+
+    @property
+    def active(self) -> int:
+        """Number of tracks that can still be extended."""
+        return len(self._tracks)
+
+    def update(
+        self, coords: np.ndarray, confidence: np.ndarray, acquired: datetime
+    ) -> List[Track]:
+        """
+        Link the detections of one acquisition.
+
+        Args:
+            coords: WGS84 positions (N, 2) as [longitude, latitude]
+            confidence: Confidence scores (N,)
+            acquired: Acquisition time, naive UTC; not earlier than the
+                previous batch
+
+        Returns:
+            Tracks finished because they went unseen for over ``max_gap``
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        confidence = np.asarray(confidence, dtype=np.float64).reshape(-1)
+        if len(confidence) != len(coords):
+            raise ValueError(
+                f"coords and confidence must have the same length, got "
+                f"{len(coords)} and {len(confidence)}"
+            )
+        if self._last is not None and acquired < self._last:
+            raise ValueError(
+                f"Batches must arrive in time order, got {acquired} after "
+                f"{self._last}"
+            )
+        self._last = acquired
+        now = np.datetime64(acquired, "us")
+
+        finished = self._retire(now - self._seen > np.timedelta64(self.max_gap))
+        tracks, detections = self._link(coords, now)
+
+        lon, lat = coords[:, 0].tolist(), coords[:, 1].tolist()
+        scores = confidence.tolist()
+        for track, idx in zip(tracks.tolist(), detections.tolist()):
+            track = self._tracks[track]
+            track.times.append(acquired)
+            track.coords.append((lon[idx], lat[idx]))
+            track.confidence.append(scores[idx])
+        # Velocity over the last step, in degrees per second
+        elapsed = (now - self._seen[tracks]) / np.timedelta64(1, "s")
+        step = coords[detections] - self._heads[tracks]
+        step[:, 0] = (step[:, 0] + 180.0) % 360.0 - 180.0
+        moving = elapsed > 0
+        self._velocity[tracks[moving]] = step[moving] / elapsed[moving, None]
+        self._heads[tracks] = coords[detections]
+        self._seen[tracks] = now
+
+        unmatched = np.ones(len(coords), dtype=bool)
+        unmatched[detections] = False
+        new = np.flatnonzero(unmatched)
+        for idx in new.tolist():
+            self._tracks.append(
+                Track(self._next_id, [acquired], [(lon[idx], lat[idx])], [scores[idx]])
+            )
+            self._next_id += 1
+        self._heads = np.concatenate([self._heads, coords[new]])
+        self._seen = np.concatenate([self._seen, np.full(len(new), now)])
+        self._velocity = np.concatenate([self._velocity, np.zeros((len(new), 2))])
+
+        return finished
+
+    def finish(self) -> List[Track]:
+        """
+        End the stream and finish every active track.
+
+        Returns:
+            Remaining tracks with at least ``min_points`` positions
+        """
+        return self._retire(np.ones(len(self._tracks), dtype=bool))
+
+    def _link(
+        self, coords: np.ndarray, now: np.datetime64
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Match active tracks with detections; returns index arrays."""
+        if not len(self._tracks) or not len(coords):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        elapsed = (now - self._seen) / np.timedelta64(1, "s")
+        gate = self.distance + self.max_speed * elapsed
+
+        # A degree of longitude is shortest at the highest latitude involved,
+        # so boxes sized for it cover every gate
+        latitude = max(np.abs(coords[:, 1]).max(), np.abs(self._heads[:, 1]).max())
+        shortest = max(np.cos(np.radians(latitude)), 1e-6) * _METERS_PER_DEGREE
+        # Plain envelope queries are much cheaper than a distance predicate,
+        # and distances are checked exactly below anyway
+        d_lon, d_lat = gate / shortest, gate / _METERS_PER_DEGREE
+        tree = shapely.STRtree(shapely.points(coords))
+        tracks, detections = tree.query(
+            shapely.box(
+                self._heads[:, 0] - d_lon,
+                self._heads[:, 1] - d_lat,
+                self._heads[:, 0] + d_lon,
+                self._heads[:, 1] + d_lat,
+            )
+        )
+
+        gated = _distance(self._heads[tracks], coords[detections]) <= gate[tracks]
+        tracks, detections = tracks[gated], detections[gated]
+
+        # Rank candidates by how far they are from where the track's last
+        # velocity puts it now, which tells crossing vessels apart
+        predicted = self._heads[tracks] + self._velocity[tracks] * elapsed[tracks, None]
+        cost = _distance(predicted, coords[detections])
+        return _assign(tracks, detections, cost)
+
+    def _retire(self, mask: np.ndarray) -> List[Track]:
+        """Remove the masked tracks; returns those long enough to keep."""
+        if not mask.any():
+            return []
+        flags = mask.tolist()
+        finished = [track for track, done in zip(self._tracks, flags) if done]
+        self._tracks = [track for track, done in zip(self._tracks, flags) if not done]
+        self._heads, self._seen = self._heads[~mask], self._seen[~mask]
+        self._velocity = self._velocity[~mask]
+        return [track for track in finished if len(track) >= self.min_points]
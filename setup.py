@@ -9,7 +9,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.12",
     install_requires=[
-        "ultralytics>=8.3.0",
+        "ultralytics>=8.4.176",
         "sentinelhub>=3.9.0",
         "numpy",
         "pillow",
@@ -17,6 +17,12 @@ setup(
         "shapely",
         "python-dotenv",
     ],
+    extras_require={
+        "onnx": ["onnx", "onnxruntime"],
+        "openvino": ["openvino"],
+        "flatgeobuf": ["pyogrio"],
+        "geoparquet": ["pyarrow"],
+    },
     entry_points={
         "console_scripts": [
             "pontos=pontos.cli:cli",
@@ -34,6 +34,16 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("MODEL_PATH", "models/yolo11s_tci.pt")
 
 
+@pytest.fixture(autouse=True)
+def clear_model_registry():
+    """Start every test without models shared from previous tests."""
+    from pontos.registry import registry
+
+    registry.clear()
+    yield
+    registry.clear()
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Test data directory."""
@@ -116,3 +126,242 @@ def create_toulon_symlink():
 def toulon_image(create_toulon_symlink):
     """Real Toulon image if available."""
     return create_toulon_symlink
+
+
+class FakeYOLO:
+    """Stand-in for ultralytics.YOLO that detects bright blobs.
+
+    Each input image yields one box around the pixels brighter than 200,
+    which makes detections predictable without loading real weights.
+    """
+
+    names = {0: "vessel"}
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def __call__(self, source, **kwargs):
+        import torch
+        from ultralytics.engine.results import Results
+
+        images = source if isinstance(source, list) else [source]
+        images = [
+            (
+                image
+                if isinstance(image, np.ndarray)
+                else np.asarray(Image.open(image).convert("RGB"))
+            )
+            for image in images
+        ]
+        self.calls.append({"batch": len(images), "source": source, **kwargs})
+
+        results = []
+        for image in images:
+            ys, xs = np.nonzero(image.max(axis=2) > 200)
+            boxes = torch.zeros((0, 6))
+            if len(xs):
+                boxes = torch.tensor(
+                    [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, 0.9, 0]],
+                    dtype=torch.float32,
+                )
+            results.append(Results(image, path="", names=self.names, boxes=boxes))
+        return results
+
+
+@pytest.fixture
+def fake_yolo(monkeypatch):
+    """Replace the YOLO loader with FakeYOLO and return the model class."""
+    monkeypatch.setattr("pontos.detector.YOLO", FakeYOLO)
+    return FakeYOLO
+
+
+@pytest.fixture
+def runtime_threads(monkeypatch):
+    """Restore torch threads and runtime classes patched by limit_threads()."""
+    import importlib
+    import importlib.util
+
+    import torch
+
+    threads = torch.get_num_threads()
+    for module, name in (("onnxruntime", "InferenceSession"), ("openvino", "Core")):
+        if importlib.util.find_spec(module) is not None:
+            runtime = importlib.import_module(module)
+            monkeypatch.setattr(runtime, name, getattr(runtime, name))
+    yield
+    torch.set_num_threads(threads)
+
+
+@pytest.fixture
+def blob_scene():
+    """Dark 1024x1024 scene with a single bright 20x12 vessel."""
+    scene = np.zeros((1024, 1024, 3), dtype=np.uint8)
+    scene[500:512, 470:490] = 255
+    return scene
+
+
+class FakeSentinelHub:
+    """Local HTTP stand-in for the Sentinel Hub OAuth and Process API.
+
+    Process requests return a uint8 TIFF filled with the integer part of the
+    bbox minimum longitude, after an optional delay; multi-temporal requests
+    get one 3-band group per day, offset by the day index, and a trailing
+    cloud band is filled with ``cloud``. Catalog searches return
+    the features of ``catalog`` whose datetime falls in the searched window.
+    The next ``throttle`` process requests are answered 429 (with a
+    ``retry_after`` header in milliseconds if set) and the ``errors`` after
+    them 503. The server records token requests, searches, client
+    connections, response statuses and peak concurrency.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        import threading
+        from http.server import ThreadingHTTPServer
+
+        self.delay = delay
+        self.tokens = 0
+        self.catalog = []
+        self.searches = 0
+        self.cloud = 0
+        self.throttle = 0
+        self.retry_after = None
+        self.errors = 0
+        self.statuses = []
+        self.requests = []
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def connect(self, sentinel, monkeypatch):
+        """Point a SentinelDataSource and the L1C collection at this server."""
+        from types import SimpleNamespace
+
+        from sentinelhub import DataCollection
+
+        sentinel.sh_config.sh_base_url = self.url
+        sentinel.sh_config.sh_token_url = f"{self.url}/oauth/token"
+        collection = DataCollection.SENTINEL2_L1C.define_from(
+            f"LOCAL_L1C_{self.httpd.server_port}", service_url=self.url
+        )
+        monkeypatch.setattr(
+            "pontos.sentinel.DataCollection", SimpleNamespace(SENTINEL2_L1C=collection)
+        )
+        monkeypatch.setenv("OAUTHLIB_INSECURE_TRANSPORT", "1")
+
+    def close(self):
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        import io
+        import json
+        import re
+        import time
+        from http.server import BaseHTTPRequestHandler
+
+        import tifffile
+
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path == "/oauth/token":
+                    with hub.lock:
+                        hub.tokens += 1
+                    token = {
+                        "access_token": "fake-token",
+                        "token_type": "Bearer",
+                        "expires_in": 3600,
+                    }
+                    self._send(json.dumps(token).encode(), "application/json")
+                    return
+
+                payload = json.loads(body)
+                if self.path == "/api/v1/catalog/1.0.0/search":
+                    start, end = payload["datetime"].split("/")
+                    features = [
+                        feature
+                        for feature in hub.catalog
+                        if start <= feature["properties"]["datetime"] <= end
+                    ]
+                    with hub.lock:
+                        hub.searches += 1
+                    results = {"features": features, "context": {"next": None}}
+                    self._send(json.dumps(results).encode(), "application/json")
+                    return
+
+                with hub.lock:
+                    hub.requests.append((payload, self.headers["Authorization"]))
+                    hub.connections.add(self.client_address)
+                    hub.in_flight += 1
+                    hub.max_in_flight = max(hub.max_in_flight, hub.in_flight)
+                    status = 200
+                    if hub.throttle:
+                        hub.throttle, status = hub.throttle - 1, 429
+                    elif hub.errors:
+                        hub.errors, status = hub.errors - 1, 503
+                    hub.statuses.append(status)
+                time.sleep(hub.delay)
+                with hub.lock:
+                    hub.in_flight -= 1
+
+                if status != 200:
+                    headers = {}
+                    if status == 429 and hub.retry_after is not None:
+                        headers["Retry-After"] = str(hub.retry_after)
+                    error = {"error": {"status": status, "reason": "Injected"}}
+                    self._send(
+                        json.dumps(error).encode(),
+                        "application/json",
+                        status,
+                        headers,
+                    )
+                    return
+
+                width, height = payload["output"]["width"], payload["output"]["height"]
+                value = int(payload["input"]["bounds"]["bbox"][0])
+                bands = re.search(r"bands: (\d+)", payload["evalscript"])
+                groups, extra = divmod(int(bands.group(1)), 3) if bands else (1, 0)
+                image = np.repeat(value + np.arange(groups, dtype=np.uint8), 3)
+                image = np.append(image, [hub.cloud] * extra).astype(np.uint8)
+                buffer = io.BytesIO()
+                tifffile.imwrite(
+                    buffer, np.broadcast_to(image, (height, width, len(image)))
+                )
+                self._send(buffer.getvalue(), "image/tiff")
+
+            def _send(self, content, content_type, status=200, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def sentinel_hub_server():
+    """Running FakeSentinelHub, stopped after the test."""
+    from sentinelhub import SentinelHubDownloadClient
+
+    server = FakeSentinelHub()
+    yield server
+    server.close()
+    SentinelHubDownloadClient.clear_cache()
@@ -0,0 +1,218 @@
+"""Tests for exported inference backends."""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pontos import backends
+from pontos.detections import Detections
+from pontos.detector import VesselDetector
+
+
+class FakeExporter:
+    """Stand-in for ultralytics.YOLO that records exports."""
+
+    exports = []
+
+    def __init__(self, weights, *args, **kwargs):
+        self.weights = Path(weights)
+
+    def export(self, format, **kwargs):
+        FakeExporter.exports.append({"format": format, **kwargs})
+        if format == "onnx":
+            target = self.weights.with_suffix(".onnx")
+            target.write_bytes(b"onnx")
+        else:
+            target = self.weights.with_name(f"{self.weights.stem}_openvino_model")
+            target.mkdir()
+            (target / "model.xml").write_text("<xml/>")
+        return str(target)
+
+
+@pytest.fixture
+def weights(tmp_path):
+    """Small fake weights file."""
+    path = tmp_path / "vessels.pt"
+    path.write_bytes(b"weights-v1")
+    return path
+
+
+@pytest.fixture
+def fake_exporter(monkeypatch):
+    """Replace the YOLO exporter and reset recorded exports."""
+    FakeExporter.exports = []
+    monkeypatch.setattr(backends, "YOLO", FakeExporter)
+    return FakeExporter
+
+
+def test_artifact_path_keyed_by_weights(weights):
+    """Test artifact names change when the weights change."""
+    first = backends.artifact_path(weights, "onnx", 320, 8, "fp32")
+    assert first.parent == weights.parent
+    assert first.name.startswith("vessels-")
+    assert first.name.endswith("-320-b8-fp32.onnx")
+
+    weights.write_bytes(b"weights-v2-retrained")
+    second = backends.artifact_path(weights, "onnx", 320, 8, "fp32")
+    assert second != first
+
+    openvino = backends.artifact_path(weights, "openvino", 320, 8, "int8")
+    assert openvino.name.endswith("-int8_openvino_model")
+
+
+def test_export_model_cached(weights, fake_exporter):
+    """Test weights are exported once with a static shape, then reused."""
+    first = backends.export_model(weights, "onnx", 320, 8, "fp16")
+    second = backends.export_model(weights, "onnx", 320, 8, "fp16")
+
+    assert first == second
+    assert first.read_bytes() == b"onnx"
+    assert len(fake_exporter.exports) == 1
+    export = fake_exporter.exports[0]
+    assert export["imgsz"] == 320
+    assert export["batch"] == 8
+    assert export["dynamic"] is False
+    assert export["quantize"] == "fp16"
+    assert "half" not in export and "int8" not in export
+    # Scratch directory and staged weights are cleaned up
+    assert sorted(p.name for p in weights.parent.iterdir()) == sorted(
+        [weights.name, first.name]
+    )
+
+
+def test_export_model_openvino_directory(weights, fake_exporter):
+    """Test OpenVINO model directories are cached like files."""
+    target = backends.export_model(
+        weights, "openvino", 320, 8, "int8", data="calibration.yaml"
+    )
+
+    assert target.is_dir()
+    assert (target / "model.xml").exists()
+    assert fake_exporter.exports[0]["quantize"] == "int8"
+    assert fake_exporter.exports[0]["data"] == "calibration.yaml"
+
+
+def test_export_model_torch_passthrough(weights, fake_exporter):
+    """Test the torch backend uses the weights without exporting."""
+    assert backends.export_model(weights, "torch", 320, 8) == weights
+    assert fake_exporter.exports == []
+
+
+def test_export_model_invalid_options(weights):
+    """Test unknown backends and precisions are rejected."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        backends.export_model(weights, "tensorrt", 320, 8)
+
+    with pytest.raises(ValueError, match="Unknown precision"):
+        backends.export_model(weights, "onnx", 320, 8, "int4")
+
+
+def test_export_model_int8_needs_calibration_data(weights, fake_exporter):
+    """Test int8 exports fail instead of calibrating on a downloaded dataset."""
+    with pytest.raises(ValueError, match="calibration data"):
+        backends.export_model(weights, "onnx", 320, 8, "int8")
+
+    assert fake_exporter.exports == []
+
+
+def test_detector_loads_exported_backend(weights, fake_exporter, monkeypatch):
+    """Test the detector loads the cached artifact for exported backends."""
+    loaded = []
+    monkeypatch.setattr(
+        "pontos.detector.YOLO", lambda path, **kwargs: loaded.append(path)
+    )
+
+    detector = VesselDetector(model_path=weights, backend="onnx")
+    assert loaded == []
+
+    _ = detector.model
+    assert detector.backend == "onnx"
+    assert loaded == [str(backends.artifact_path(weights, "onnx", 320, 8))]
+
+
+def test_detector_passes_calibration_data(weights, fake_exporter, monkeypatch):
+    """Test int8 detectors calibrate on the configured dataset."""
+    monkeypatch.setattr("pontos.detector.YOLO", lambda path, **kwargs: path)
+    monkeypatch.setattr(
+        "pontos.detector.config.calibration_data", "data/calibration.yaml"
+    )
+
+    detector = VesselDetector(model_path=weights, backend="onnx", precision="int8")
+    _ = detector.model
+
+    assert fake_exporter.exports[0]["data"] == "data/calibration.yaml"
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("onnxruntime") is None
+    or importlib.util.find_spec("onnx") is None,
+    reason="onnxruntime or onnx not available",
+)
+def test_limit_threads_onnx_sessions(tmp_path, runtime_threads):
+    """Test ONNX Runtime sessions pick up the worker thread count."""
+    import onnx
+    import onnxruntime
+    import torch
+    from onnx import TensorProto, helper
+
+    graph = helper.make_graph(
+        [helper.make_node("Relu", ["x"], ["y"])],
+        "relu",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, [1])],
+        [helper.make_tensor_value_info("y", TensorProto.FLOAT, [1])],
+    )
+    path = tmp_path / "relu.onnx"
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 7
+    onnx.save(model, path)
+
+    backends.limit_threads(2)
+    backends.limit_threads(3)
+    session = onnxruntime.InferenceSession(str(path))
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = 1
+    explicit = onnxruntime.InferenceSession(str(path), options)
+
+    assert torch.get_num_threads() == 3
+    assert session.get_session_options().intra_op_num_threads == 3
+    assert explicit.get_session_options().intra_op_num_threads == 1
+    assert isinstance(session, onnxruntime.InferenceSession._base)
+    assert session.run(None, {"x": np.array([-1.0], np.float32)})[0] == 0
+
+
+def test_parity_identical_and_shifted():
+    """Test parity scores for identical and disjoint detections."""
+    reference = Detections.from_data(
+        np.array([[0, 0, 10, 10, 0.9, 0], [50, 50, 60, 60, 0.4, 0]])
+    )
+
+    same = backends.parity(reference, reference)
+    assert same["recall"] == 1.0
+    assert same["precision"] == 1.0
+    assert same["max_conf_diff"] == 0.0
+
+    shifted = backends.parity(reference, reference[:1])
+    assert shifted["recall"] == 0.5
+    assert shifted["precision"] == 1.0
+
+    assert backends.parity(Detections.empty(), Detections.empty())["recall"] == 1.0
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not Path("tests/test_data/toulon_test.png").exists()
+    or importlib.util.find_spec("onnxruntime") is None,
+    reason="Toulon test image or onnxruntime not available",
+)
+def test_onnx_parity_toulon():
+    """Test ONNX Runtime matches PyTorch detections on the Toulon scene."""
+    image = Path("tests/test_data/toulon_test.png")
+    reference = VesselDetector(device="cpu").detect_tiled(image)
+    candidate = VesselDetector(device="cpu", backend="onnx").detect_tiled(image)
+
+    scores = backends.parity(reference, candidate)
+    assert scores["recall"] >= 0.95
+    assert scores["precision"] >= 0.95
+    assert scores["max_conf_diff"] < 0.02
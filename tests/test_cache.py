@@ -0,0 +1,97 @@
+"""Tests for the on-disk array cache."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pontos.cache import DiskCache, cache_key
+
+
+def _entry(fill: int, size: int = 100) -> np.ndarray:
+    """Create a uint8 array of roughly size bytes."""
+    return np.full(size, fill, dtype=np.uint8)
+
+
+def test_cache_key_is_order_independent():
+    """Test keys depend on parameter values, not keyword order."""
+    assert cache_key(a=1, b=[2, 3]) == cache_key(b=[2, 3], a=1)
+    assert cache_key(a=1, b=[2, 3]) != cache_key(a=1, b=[2, 4])
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test stored arrays come back unchanged and count as hits."""
+    cache = DiskCache(tmp_path, max_bytes=1 << 20)
+    array = np.random.randint(0, 255, (16, 16, 3), dtype=np.uint8)
+
+    assert cache.get("scene") is None
+    cache.put("scene", array)
+
+    assert "scene" in cache
+    assert np.array_equal(cache.get("scene"), array)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test eviction removes the entry accessed longest ago."""
+    entry_bytes = DiskCache(tmp_path / "probe", 1 << 20).put("x", _entry(0)).stat()
+    cache = DiskCache(tmp_path / "cache", max_bytes=2 * entry_bytes.st_size)
+
+    cache.put("a", _entry(1))
+    cache.put("b", _entry(2))
+    os.utime(cache._path("a"), ns=(0, 0))
+    os.utime(cache._path("b"), ns=(1, 1))
+
+    cache.get("a")  # a becomes the most recently used entry
+    cache.put("c", _entry(3))
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats.evictions == 1
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_cache_concurrent_writers(tmp_path):
+    """Test concurrent writers of one key never expose a partial entry."""
+    cache = DiskCache(tmp_path, max_bytes=1 << 30)
+    array = np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: cache.put("scene", array), range(16)))
+        reads = list(executor.map(lambda _: cache.get("scene"), range(16)))
+
+    assert all(np.array_equal(read, array) for read in reads)
+    assert [path.name for path in tmp_path.iterdir()] == ["scene.npy"]
+
+
+def test_result_cache_memory_eviction():
+    """Test the memory tier keeps only the most recently used entries."""
+    from pontos.cache import ResultCache
+    from pontos.detections import Detections
+
+    cache = ResultCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, Detections.empty())
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_image_fingerprint_matches_path_and_content(tmp_path):
+    """Test fingerprints follow pixel content, shape and dtype."""
+    from pontos.cache import image_fingerprint
+
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+    changed = image.copy()
+    changed[0, 0, 0] = 1
+
+    assert image_fingerprint(image) == image_fingerprint(image.copy())
+    assert image_fingerprint(image) != image_fingerprint(changed)
+    assert image_fingerprint(image) != image_fingerprint(image.reshape(8, 24))
+
+    path = tmp_path / "image.bin"
+    path.write_bytes(b"scene")
+    assert image_fingerprint(path) == image_fingerprint(path)
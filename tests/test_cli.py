@@ -1,5 +1,6 @@
 """Tests for command-line interface."""
 
+import numpy as np
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
@@ -30,18 +31,18 @@ def test_scan_help(cli_runner):
     assert "date" in result.output.lower()
 
 
-@patch("pontos.cli.SentinelDataSource")
-@patch("pontos.cli.VesselDetector")
-@patch("pontos.cli.GeoExporter")
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+@patch("pontos.geo.GeoExporter")
 def test_scan_command_success(
     mock_exporter, mock_detector, mock_sentinel, cli_runner, tmp_path
 ):
     """Test successful scan command."""
     # Mock Sentinel download
     mock_sentinel_instance = MagicMock()
-    scene_path = tmp_path / "test_scene.png"
-    scene_path.touch()
-    mock_sentinel_instance.get_scene.return_value = scene_path
+    mock_sentinel_instance.get_scene_array.return_value = np.zeros(
+        (1024, 1024, 3), dtype=np.uint8
+    )
     mock_sentinel.return_value = mock_sentinel_instance
 
     # Mock detector
@@ -53,7 +54,7 @@ def test_scan_command_success(
 
     # Mock exporter
     output_path = tmp_path / "output.geojson"
-    mock_exporter.detections_to_geojson.return_value = output_path
+    mock_exporter.export.return_value = output_path
 
     result = cli_runner.invoke(
         cli,
@@ -102,15 +103,15 @@ def test_scan_missing_required_args(cli_runner):
     assert "Missing option" in result.output or "required" in result.output.lower()
 
 
-@patch("pontos.cli.SentinelDataSource")
-@patch("pontos.cli.VesselDetector")
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
 def test_scan_custom_confidence(mock_detector, mock_sentinel, cli_runner, tmp_path):
     """Test scan with custom confidence threshold."""
     # Mock setup
     mock_sentinel_instance = MagicMock()
-    scene_path = tmp_path / "test_scene.png"
-    scene_path.touch()
-    mock_sentinel_instance.get_scene.return_value = scene_path
+    mock_sentinel_instance.get_scene_array.return_value = np.zeros(
+        (1024, 1024, 3), dtype=np.uint8
+    )
     mock_sentinel.return_value = mock_sentinel_instance
 
     mock_detector_instance = MagicMock()
@@ -135,3 +136,435 @@ def test_scan_custom_confidence(mock_detector, mock_sentinel, cli_runner, tmp_pa
     # Verify detector was called with custom threshold
     mock_detector.assert_called_with(confidence_threshold=0.25)
     assert result.exit_code == 0
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+def test_scan_save_scene(mock_detector, mock_sentinel, cli_runner, tmp_path):
+    """Test scan persists the scene only when --save-scene is given."""
+    scene = np.zeros((512, 256, 3), dtype=np.uint8)
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_array.return_value = scene
+    mock_sentinel.return_value = mock_sentinel_instance
+
+    mock_detector_instance = MagicMock()
+    mock_detector_instance.detect.return_value = []
+    mock_detector.return_value = mock_detector_instance
+
+    scene_path = tmp_path / "scene.png"
+    result = cli_runner.invoke(
+        cli,
+        [
+            "scan",
+            "--bbox",
+            "5.85,43.08,6.05,43.18",
+            "--date-start",
+            "2026-01-01",
+            "--date-end",
+            "2026-01-31",
+            "--output",
+            str(tmp_path / "vessels.geojson"),
+            "--save-scene",
+            str(scene_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    call_kwargs = mock_sentinel_instance.get_scene_array.call_args[1]
+    assert call_kwargs["output_path"] == scene_path
+    mock_sentinel_instance.wait_for_writes.assert_called_once()
+    mock_detector_instance.detect.assert_called_once_with(scene)
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+@patch("pontos.geo.GeoExporter")
+def test_scan_resolution_mosaic(
+    mock_exporter, mock_detector, mock_sentinel, cli_runner, tmp_path
+):
+    """Test --resolution downloads a mosaic and detects with tiling."""
+    mosaic = np.zeros((1167, 1591, 3), dtype=np.uint8)
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_mosaic.return_value = mosaic
+    mock_sentinel.return_value = mock_sentinel_instance
+
+    mock_detector_instance = MagicMock()
+    mock_detector_instance.detect_tiled.return_value = []
+    mock_detector.return_value = mock_detector_instance
+
+    output_path = tmp_path / "vessels.geojson"
+    result = cli_runner.invoke(
+        cli,
+        [
+            "scan",
+            "--bbox",
+            "5.8,43.0,6.0,43.1",
+            "--date-start",
+            "2026-01-01",
+            "--date-end",
+            "2026-01-31",
+            "--output",
+            str(output_path),
+            "--resolution",
+            "10",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "1591x1167" in result.output
+    assert mock_sentinel_instance.get_scene_mosaic.call_args[1]["resolution"] == 10.0
+    mock_sentinel_instance.get_scene_array.assert_not_called()
+    mock_detector_instance.detect_tiled.assert_called_once_with(mosaic)
+    image_size = mock_exporter.export.call_args[0][2]
+    assert image_size == (1591, 1167)
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+def test_monitor_processes_only_new_acquisitions(
+    mock_detector, mock_sentinel, cli_runner, tmp_path
+):
+    """Test a second monitor run only scores acquisitions newer than the first."""
+    import json
+    from datetime import datetime
+
+    from pontos.sentinel import Acquisition, SceneRequest
+
+    bbox = (5.85, 43.08, 6.05, 43.18)
+
+    def planned(*days):
+        plan = []
+        for day in days:
+            acquisition = Acquisition(datetime(2026, 1, day, 10, 27), 0.1, ("T",))
+            plan.append(
+                (acquisition, SceneRequest(bbox, acquisition.time_range, 64, 0.2))
+            )
+        return plan
+
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scenes.side_effect = lambda plan: (
+        (scene, np.zeros((64, 64, 3), dtype=np.uint8)) for scene in plan
+    )
+    mock_sentinel.return_value = mock_sentinel_instance
+
+    mock_detector_instance = MagicMock()
+    mock_detector_instance.detect.return_value = [
+        {"bbox": [10, 10, 20, 20], "confidence": 0.8, "center": [15, 15]}
+    ]
+    mock_detector.return_value = mock_detector_instance
+
+    args = [
+        "monitor",
+        "--bbox",
+        "5.85,43.08,6.05,43.18",
+        "--since",
+        "2026-01-01",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--state",
+        str(tmp_path / "monitor.sqlite"),
+    ]
+
+    mock_sentinel_instance.plan_scenes.return_value = planned(5, 10)
+    first = cli_runner.invoke(cli, args)
+
+    mock_sentinel_instance.plan_scenes.return_value = planned(10, 15)
+    second = cli_runner.invoke(cli, args)
+
+    mock_sentinel_instance.plan_scenes.return_value = planned(10, 15)
+    third = cli_runner.invoke(cli, args)
+
+    assert first.exit_code == 0, first.output
+    assert "2 new acquisitions" in first.output
+    assert mock_sentinel_instance.plan_scenes.call_args_list[0][0][1][0] == (
+        "2026-01-01"
+    )
+
+    # The second run resumes at the last processed acquisition
+    assert second.exit_code == 0, second.output
+    assert "1 new acquisitions" in second.output
+    assert mock_sentinel_instance.plan_scenes.call_args_list[1][0][1][0] == (
+        "2026-01-10"
+    )
+    assert "No new acquisitions" in third.output
+    assert mock_detector_instance.detect.call_count == 3
+
+    outputs = sorted(p.name for p in (tmp_path / "out").iterdir())
+    assert outputs == [
+        "vessels_20260105T102700.geojson",
+        "vessels_20260110T102700.geojson",
+        "vessels_20260115T102700.geojson",
+    ]
+    geojson = json.loads((tmp_path / "out" / outputs[-1]).read_text())
+    assert len(geojson["features"]) == 1
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+@patch("pontos.geo.GeoExporter")
+def test_scan_cloud_mask(
+    mock_exporter, mock_detector, mock_sentinel, cli_runner, tmp_path
+):
+    """Test --cloud-mask fetches clouds and skips cloudy tiles."""
+    from pontos.detector import TileStats
+
+    scene = np.zeros((1024, 1024, 3), dtype=np.uint8)
+    clouds = np.zeros((1024, 1024), dtype=np.float32)
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_with_clouds.return_value = (scene, clouds)
+    mock_sentinel.return_value = mock_sentinel_instance
+
+    mock_detector_instance = MagicMock()
+    mock_detector_instance.detect_tiled.return_value = []
+    mock_detector_instance.tile_stats = TileStats(tiles=36, cloudy=9)
+    mock_detector.return_value = mock_detector_instance
+
+    args = [
+        "scan",
+        "--bbox",
+        "5.85,43.08,6.05,43.18",
+        "--date-start",
+        "2026-01-01",
+        "--date-end",
+        "2026-01-31",
+        "--output",
+        str(tmp_path / "vessels.geojson"),
+        "--cloud-mask",
+        "--max-tile-cloud",
+        "0.3",
+    ]
+    result = cli_runner.invoke(cli, args)
+
+    assert result.exit_code == 0, result.output
+    assert "Skipped 9/36 tiles (9 cloudy, 0 land; 25% of inference)" in result.output
+    mock_sentinel_instance.get_scene_array.assert_not_called()
+    call = mock_detector_instance.detect_tiled.call_args
+    assert call[0][0] is scene
+    assert call[1]["cloud_mask"] is clouds
+    assert call[1]["max_cloud_fraction"] == 0.3
+
+    rejected = cli_runner.invoke(cli, args + ["--resolution", "10"])
+    assert rejected.exit_code != 0
+    assert "--cloud-mask cannot be combined" in rejected.output
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+@patch("pontos.geo.GeoExporter")
+def test_scan_land_mask(
+    mock_exporter, mock_detector, mock_sentinel, cli_runner, tmp_path
+):
+    """Test --land-mask rasterizes the land onto the scene grid for tiling."""
+    import json
+
+    from pontos.detector import TileStats
+
+    land = tmp_path / "land.geojson"
+    land.write_text(
+        json.dumps(
+            {
+                "type": "Polygon",
+                "coordinates": [[[5, 43.13], [7, 43.13], [7, 44], [5, 44], [5, 43.13]]],
+            }
+        )
+    )
+
+    scene = np.zeros((100, 200, 3), dtype=np.uint8)
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_array.return_value = scene
+    mock_sentinel.return_value = mock_sentinel_instance
+
+    mock_detector_instance = MagicMock()
+    mock_detector_instance.detect_tiled.return_value = []
+    mock_detector_instance.tile_stats = TileStats(tiles=36, land=12)
+    mock_detector.return_value = mock_detector_instance
+
+    with patch("pontos.landmask.config.data_dir", tmp_path):
+        result = cli_runner.invoke(
+            cli,
+            [
+                "scan",
+                "--bbox",
+                "5.85,43.08,6.05,43.18",
+                "--date-start",
+                "2026-01-01",
+                "--date-end",
+                "2026-01-31",
+                "--output",
+                str(tmp_path / "vessels.geojson"),
+                "--land-mask",
+                str(land),
+                "--coast-buffer",
+                "0",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Skipped 12/36 tiles (0 cloudy, 12 land; 33% of inference)" in result.output
+    mock_detector_instance.detect.assert_not_called()
+    mask = mock_detector_instance.detect_tiled.call_args[1]["land_mask"]
+    assert mask.shape == (100, 200)
+    assert mask[:45].all() and not mask[55:].any()
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+@patch("pontos.geo.GeoExporter")
+def test_scan_export_format(
+    mock_exporter, mock_detector, mock_sentinel, cli_runner, tmp_path
+):
+    """Test --format and --gzip pick the exporter and output suffix."""
+    from pontos import cli as cli_module
+    from pontos import geo
+
+    assert cli_module.EXPORT_FORMATS == geo.EXPORT_FORMATS
+
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_array.return_value = np.zeros(
+        (64, 64, 3), dtype=np.uint8
+    )
+    mock_sentinel.return_value = mock_sentinel_instance
+    mock_detector.return_value.detect.return_value = []
+
+    args = [
+        "scan",
+        "--bbox",
+        "5.85,43.08,6.05,43.18",
+        "--date-start",
+        "2026-01-01",
+        "--date-end",
+        "2026-01-31",
+        "--output",
+        str(tmp_path / "vessels"),
+    ]
+    result = cli_runner.invoke(cli, args + ["--format", "geojsonseq", "--gzip"])
+
+    assert result.exit_code == 0, result.output
+    path, export_format = mock_exporter.export.call_args[0][3:5]
+    assert path == tmp_path / "vessels.geojsons.gz"
+    assert export_format == "geojsonseq"
+
+    result = cli_runner.invoke(cli, args + ["--format", "geoparquet"])
+    assert mock_exporter.export.call_args[0][3] == tmp_path / "vessels.parquet"
+
+    rejected = cli_runner.invoke(cli, args + ["--format", "flatgeobuf", "--gzip"])
+    assert rejected.exit_code != 0
+    assert "--gzip only applies" in rejected.output
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+def test_scan_store(mock_detector, mock_sentinel, cli_runner, tmp_path):
+    """Test --store appends the scan's detections to the detection store."""
+    from datetime import datetime
+
+    from pontos.store import DetectionStore
+
+    mock_sentinel_instance = MagicMock()
+    mock_sentinel_instance.get_scene_array.return_value = np.zeros(
+        (1024, 1024, 3), dtype=np.uint8
+    )
+    mock_sentinel.return_value = mock_sentinel_instance
+    mock_detector.return_value.detect.return_value = [
+        {"bbox": [10, 10, 20, 20], "confidence": 0.8, "center": [15, 15]}
+    ]
+
+    args = [
+        "scan",
+        "--bbox",
+        "5.85,43.08,6.05,43.18",
+        "--date-start",
+        "2026-01-01",
+        "--date-end",
+        "2026-01-31",
+        "--output",
+        str(tmp_path / "vessels.geojson"),
+        "--store",
+        str(tmp_path / "detections.gpkg"),
+    ]
+    assert cli_runner.invoke(cli, args).exit_code == 0
+    result = cli_runner.invoke(cli, args)
+
+    assert result.exit_code == 0, result.output
+    assert "Stored:" in result.output
+    with DetectionStore(tmp_path / "detections.gpkg") as store:
+        found = store.query(
+            bbox=(5.85, 43.17, 5.86, 43.18), aoi="5.85,43.08,6.05,43.18"
+        )
+    assert len(found) == 2
+    assert found[0].acquired == datetime(2026, 1, 31)
+
+
+@patch("pontos.sentinel.SentinelDataSource")
+@patch("pontos.detector.VesselDetector")
+def test_scan_merge_distance(mock_detector, mock_sentinel, cli_runner, tmp_path):
+    """Test --merge-distance drops repeated detections before export."""
+    import json
+
+    mock_sentinel.return_value.get_scene_array.return_value = np.zeros(
+        (1024, 1024, 3), dtype=np.uint8
+    )
+    mock_detector.return_value.detect.return_value = [
+        {"bbox": [10, 10, 20, 20], "confidence": 0.6, "center": [15, 15]},
+        {"bbox": [11, 10, 21, 20], "confidence": 0.8, "center": [16, 15]},
+        {"bbox": [500, 500, 510, 510], "confidence": 0.5, "center": [505, 505]},
+    ]
+    output = tmp_path / "vessels.geojson"
+
+    result = cli_runner.invoke(
+        cli,
+        [
+            "scan",
+            "--bbox",
+            "5.85,43.08,6.05,43.18",
+            "--date-start",
+            "2026-01-01",
+            "--date-end",
+            "2026-01-31",
+            "--output",
+            str(output),
+            "--merge-distance",
+            "30",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Merged 1 duplicate detections" in result.output
+    assert "Found 2 vessels" in result.output
+    features = json.loads(output.read_text())["features"]
+    assert [f["properties"]["confidence"] for f in features] == [0.8, 0.5]
+
+
+def test_tracks_command(cli_runner, tmp_path):
+    """Test stored detections are linked into a GeoJSON of tracks."""
+    import json
+    from datetime import datetime
+
+    from pontos.detections import Detections
+    from pontos.store import DetectionStore
+
+    bbox, size = (5.0, 43.0, 6.0, 44.0), (1000, 1000)
+    with DetectionStore(tmp_path / "detections.gpkg") as store:
+        for day, x in ((5, 500), (10, 501), (15, 502)):
+            detections = Detections([[x - 5, 495, x + 5, 505]], [0.8], [0])
+            store.add(detections, bbox, size, datetime(2026, 1, day), "toulon")
+
+    output = tmp_path / "tracks"
+    result = cli_runner.invoke(
+        cli,
+        [
+            "tracks",
+            "--store",
+            str(tmp_path / "detections.gpkg"),
+            "--output",
+            str(output),
+            "--max-speed",
+            "1.0",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Saved 1 tracks" in result.output
+    features = json.loads(output.with_suffix(".geojson").read_text())["features"]
+    assert len(features[0]["geometry"]["coordinates"]) == 3
+    assert features[0]["properties"]["start"] == "2026-01-05T00:00:00"
@@ -91,3 +91,29 @@ def test_config_validation_success(monkeypatch):
     # Should not raise if model exists and credentials set
     if config.model_path.exists():
         config.validate()  # Should pass
+
+
+def test_config_backend_from_env(monkeypatch):
+    """Test inference backend and precision are read from environment."""
+    monkeypatch.setenv("BACKEND", "openvino")
+    monkeypatch.setenv("PRECISION", "int8")
+    monkeypatch.setenv("CALIBRATION_DATA", "data/calibration.yaml")
+
+    config = PontosConfig()
+
+    assert config.backend == "openvino"
+    assert config.precision == "int8"
+    assert config.calibration_data == "data/calibration.yaml"
+
+
+def test_config_backend_defaults(monkeypatch):
+    """Test PyTorch fp32 inference is the default."""
+    monkeypatch.delenv("BACKEND", raising=False)
+    monkeypatch.delenv("PRECISION", raising=False)
+    monkeypatch.delenv("CALIBRATION_DATA", raising=False)
+
+    config = PontosConfig()
+
+    assert config.backend == "torch"
+    assert config.precision == "fp32"
+    assert config.calibration_data is None
@@ -0,0 +1,93 @@
+"""Tests for duplicate detection merging."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pontos.dedup import deduplicate
+
+# One metre in degrees of latitude
+METRE = 1 / 111_195
+
+
+def test_merges_nearby_keeping_most_confident():
+    """Test duplicates within the distance collapse onto the best record."""
+    coords = [
+        [5.9, 43.1],
+        [5.9, 43.1 + 10 * METRE],
+        [5.9, 43.1 + 100 * METRE],
+        [6.5, 43.5],
+    ]
+    keep = deduplicate(coords, [0.4, 0.8, 0.6, 0.3], distance=30.0)
+    assert keep.tolist() == [1, 2, 3]
+
+
+def test_greedy_chain_keeps_far_ends():
+    """Test a chain of duplicates is resolved like NMS, not by transitivity."""
+    # Each point is 20 m from the next; the ends are 40 m apart
+    coords = [[5.9, 43.1 + step * 20 * METRE] for step in range(3)]
+    keep = deduplicate(coords, [0.9, 0.5, 0.8], distance=30.0)
+    assert keep.tolist() == [0, 2]
+
+
+def test_equal_confidence_keeps_first():
+    """Test ties go to the earlier detection."""
+    keep = deduplicate([[5.9, 43.1], [5.9, 43.1]], [0.5, 0.5], distance=30.0)
+    assert keep.tolist() == [0]
+
+
+def test_time_tolerance():
+    """Test only detections acquired close in time are merged."""
+    coords = [[5.9, 43.1]] * 3
+    times = [
+        datetime(2026, 1, 5, 10, 27),
+        datetime(2026, 1, 5, 10, 28),
+        datetime(2026, 1, 10, 10, 27),
+    ]
+    keep = deduplicate(
+        coords, [0.5, 0.6, 0.4], times, time_tolerance=timedelta(hours=1)
+    )
+    assert keep.tolist() == [1, 2]
+    assert deduplicate(coords, [0.5, 0.6, 0.4], times).tolist() == [1]
+
+
+def test_merges_across_antimeridian():
+    """Test cells wrap around at 180 degrees."""
+    keep = deduplicate([[179.99995, -17.0], [-179.99995, -17.0]], [0.5, 0.7])
+    assert keep.tolist() == [1]
+
+
+def test_high_latitude_longitude_spacing():
+    """Test longitude distances shrink with latitude."""
+    # 0.0004 deg of longitude is about 44 m at the equator, 14 m at 71N
+    coords = [[25.0, 71.0], [25.0004, 71.0], [25.0, 0.0], [25.0004, 0.0]]
+    keep = deduplicate(coords, [0.5, 0.4, 0.5, 0.4], distance=30.0)
+    assert keep.tolist() == [0, 2, 3]
+
+
+def test_matches_pairwise_reference():
+    """Test the grid hash finds the same duplicates as comparing every pair."""
+    rng = np.random.default_rng(0)
+    coords = np.array([5.9, 43.1]) + rng.normal(scale=0.002, size=(400, 2))
+    confidence = rng.integers(0, 5, 400) / 5
+
+    scale = np.array([np.cos(np.radians(43.1)), 1.0]) / METRE
+    order, kept = np.argsort(-confidence, kind="stable"), []
+    for idx in order:
+        offsets = (coords[kept] - coords[idx]) * scale
+        if not len(kept) or np.hypot(*offsets.T).min() > 50.0:
+            kept.append(idx)
+
+    keep = deduplicate(coords, confidence, distance=50.0)
+    assert keep.tolist() == sorted(kept)
+
+
+def test_empty_and_invalid():
+    """Test edge cases and argument validation."""
+    assert deduplicate(np.empty((0, 2)), []).tolist() == []
+    assert deduplicate([[5.9, 43.1]], [0.5]).tolist() == [0]
+    with pytest.raises(ValueError, match="same length"):
+        deduplicate([[5.9, 43.1]], [0.5, 0.6])
+    with pytest.raises(ValueError, match="distance"):
+        deduplicate([[5.9, 43.1]], [0.5], distance=0)
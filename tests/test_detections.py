@@ -0,0 +1,87 @@
+"""Tests for the columnar detections container."""
+
+import numpy as np
+import pytest
+
+from pontos.detections import Detections
+
+
+@pytest.fixture
+def raw_rows():
+    """Raw model rows [x1, y1, x2, y2, conf, class_id]."""
+    return np.array(
+        [
+            [100.0, 200.0, 150.0, 250.0, 0.58, 0],
+            [300.0, 400.0, 350.0, 450.0, 0.41, 0],
+            [10.0, 20.0, 30.0, 60.0, 0.12, 1],
+        ],
+        dtype=np.float32,
+    )
+
+
+def test_from_data_columns(raw_rows):
+    """Test rows are split into contiguous typed columns."""
+    detections = Detections.from_data(raw_rows, {0: "vessel", 1: "buoy"})
+
+    assert len(detections) == 3
+    assert detections.xyxy.shape == (3, 4)
+    assert detections.xyxy.flags["C_CONTIGUOUS"]
+    assert detections.conf.dtype == np.float32
+    assert detections.class_id.tolist() == [0, 0, 1]
+    np.testing.assert_array_equal(detections.centers[0], [125.0, 225.0])
+
+
+def test_dict_view_matches_legacy_format(raw_rows, sample_detections):
+    """Test integer indexing and iteration yield classic detection dicts."""
+    detections = Detections.from_data(raw_rows[:2])
+
+    records = detections.to_dicts()
+    assert [r["bbox"] for r in records] == [d["bbox"] for d in sample_detections]
+    assert [r["center"] for r in records] == [d["center"] for d in sample_detections]
+    assert records[0]["confidence"] == pytest.approx(0.58)
+    assert detections[-1]["class"] == "vessel"
+    assert [d["bbox"] for d in detections] == [r["bbox"] for r in records]
+
+
+def test_subset_indexing(raw_rows):
+    """Test masks and slices return Detections subsets."""
+    detections = Detections.from_data(raw_rows, {0: "vessel", 1: "buoy"})
+
+    confident = detections[detections.conf > 0.3]
+    assert isinstance(confident, Detections)
+    assert len(confident) == 2
+    assert len(detections[:1]) == 1
+    assert confident.names == detections.names
+
+
+def test_index_out_of_range(raw_rows):
+    """Test out-of-range integer index raises IndexError."""
+    detections = Detections.from_data(raw_rows)
+
+    with pytest.raises(IndexError):
+        detections[3]
+
+
+def test_empty():
+    """Test empty detections behave like an empty list."""
+    detections = Detections.empty()
+
+    assert len(detections) == 0
+    assert not detections
+    assert detections.to_dicts() == []
+    assert detections.centers.shape == (0, 2)
+
+
+def test_from_dicts_roundtrip(sample_detections):
+    """Test building from legacy dicts keeps boxes and class names."""
+    detections = Detections.from_dicts(sample_detections)
+
+    assert detections.to_dicts()[1]["bbox"] == sample_detections[1]["bbox"]
+    assert detections[0]["class"] == "vessel"
+    assert Detections.from_dicts(detections) is detections
+
+
+def test_mismatched_lengths():
+    """Test columns of different lengths are rejected."""
+    with pytest.raises(ValueError, match="same length"):
+        Detections(np.zeros((2, 4)), np.zeros(3), np.zeros(2))
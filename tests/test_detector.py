@@ -4,6 +4,7 @@ import pytest
 import torch
 from pathlib import Path
 from unittest.mock import patch
+from pontos.detections import Detections
 from pontos.detector import VesselDetector
 
 
@@ -45,7 +46,7 @@ def test_detect_sample_image(sample_image):
     detector = VesselDetector(confidence_threshold=0.01)
     detections = detector.detect(sample_image)
 
-    assert isinstance(detections, list)
+    assert isinstance(detections, Detections)
     for det in detections:
         assert "bbox" in det
         assert "confidence" in det
@@ -84,7 +85,7 @@ def test_detect_with_visualization(sample_image, tmp_path):
         sample_image, save_visualization=True, output_dir=tmp_path / "test_results"
     )
 
-    assert isinstance(detections, list)
+    assert isinstance(detections, Detections)
     # Check that output directory was created
     assert (tmp_path / "test_results").exists()
 
@@ -115,7 +116,7 @@ def test_detect_no_detections(tmp_path):
     detections = detector.detect(blank_img)
 
     # Might have 0 detections
-    assert isinstance(detections, list)
+    assert isinstance(detections, Detections)
 
 
 def test_detector_model_path_custom(tmp_path):
@@ -168,3 +169,309 @@ def test_detect_visualization_output_dir(sample_image, tmp_path):
 
     # Check output directory was created
     assert output_dir.exists()
+
+
+def test_tile_origins_cover_image():
+    """Test tile grid covers the image with the last tile on the border."""
+    from pontos.detector import _tile_origins
+
+    origins = _tile_origins(1024, 1024, 320, 160)
+    xs = sorted({x for x, _ in origins})
+
+    assert xs == [0, 160, 320, 480, 640, 704]
+    assert len(origins) == len(xs) ** 2
+    assert _tile_origins(200, 300, 320, 160) == [(0, 0)]
+
+
+def test_detect_tiled_merges_overlaps(fake_yolo, blob_scene):
+    """Test a vessel seen in several tiles is reported once in scene coords."""
+    detector = VesselDetector()
+    detections = detector.detect_tiled(blob_scene, tile_size=320, overlap=0.5)
+
+    assert len(detections) == 1
+    assert detections[0]["bbox"] == [470.0, 500.0, 490.0, 512.0]
+    assert detections[0]["center"] == [480.0, 506.0]
+    assert detections[0]["class"] == "vessel"
+
+
+def test_detect_tiled_batches_tiles(fake_yolo, blob_scene):
+    """Test tiles are sent to the model in batches of batch_size."""
+    detector = VesselDetector()
+    detector.detect_tiled(blob_scene, tile_size=320, overlap=0.5, batch_size=8)
+
+    batches = [call["batch"] for call in detector.model.calls]
+    assert batches == [8, 8, 8, 8, 4]
+    assert all(call["imgsz"] == 320 for call in detector.model.calls)
+
+
+def test_detect_tiled_from_path(fake_yolo, blob_scene, tmp_path):
+    """Test tiled detection reads images from disk."""
+    from PIL import Image
+
+    image_path = tmp_path / "scene.png"
+    Image.fromarray(blob_scene).save(image_path)
+
+    detector = VesselDetector()
+    detections = detector.detect_tiled(image_path)
+
+    assert len(detections) == 1
+
+
+def test_detect_tiled_invalid_overlap(fake_yolo, blob_scene):
+    """Test overlap outside [0, 1) is rejected."""
+    detector = VesselDetector()
+
+    with pytest.raises(ValueError, match="Overlap"):
+        detector.detect_tiled(blob_scene, overlap=1.0)
+
+
+def test_detect_batch_preserves_order(fake_yolo, tmp_path):
+    """Test batch detection returns one result per image in input order."""
+    import numpy as np
+    from PIL import Image
+
+    images = []
+    for i in range(10):
+        scene = np.zeros((256, 256, 3), dtype=np.uint8)
+        scene[10 * i : 10 * i + 8, 20:30] = 255
+        if i % 2:
+            path = tmp_path / f"scene_{i}.png"
+            Image.fromarray(scene).save(path)
+            images.append(path)
+        else:
+            images.append(scene)
+
+    detector = VesselDetector()
+    results = detector.detect_batch(iter(images), batch_size=4)
+
+    assert len(results) == 10
+    assert [call["batch"] for call in detector.model.calls] == [4, 4, 2]
+    for i, detections in enumerate(results):
+        assert len(detections) == 1
+        assert detections[0]["bbox"][1] == 10.0 * i
+
+
+def test_detect_batch_empty(fake_yolo):
+    """Test batch detection on no images makes no model calls."""
+    detector = VesselDetector()
+
+    assert detector.detect_batch([]) == []
+    assert detector.model.calls == []
+
+
+def test_detect_array_without_copy(fake_yolo, blob_scene):
+    """Test in-memory scenes reach the model as a view, not a copy."""
+    import numpy as np
+
+    detector = VesselDetector()
+    detections = detector.detect(blob_scene)
+
+    source = detector.model.calls[0]["source"]
+    assert np.shares_memory(source, blob_scene)
+    assert len(detections) == 1
+    assert detections[0]["bbox"] == [470.0, 500.0, 490.0, 512.0]
+
+
+def test_result_cache_answers_higher_thresholds(fake_yolo, blob_scene):
+    """Test cached raw predictions serve any threshold above the floor."""
+    from pontos.cache import ResultCache
+
+    cache = ResultCache(floor=0.01)
+    loose = VesselDetector(confidence_threshold=0.5, result_cache=cache)
+    strict = VesselDetector(confidence_threshold=0.95, result_cache=cache)
+
+    assert len(loose.detect(blob_scene)) == 1
+    assert len(strict.detect(blob_scene)) == 0
+    assert len(loose.detect(blob_scene.copy())) == 1
+
+    calls = loose.model.calls
+    assert len(calls) == 1
+    assert calls[0]["conf"] == 0.01
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_result_cache_disk_tier_skips_model(fake_yolo, blob_scene, tmp_path):
+    """Test a fresh process answers from disk without loading the model."""
+    from pontos.cache import ResultCache
+    from pontos.registry import registry
+
+    detector = VesselDetector(result_cache=ResultCache(tmp_path))
+    expected = detector.detect_tiled(blob_scene)
+    registry.clear()
+
+    detector = VesselDetector(result_cache=ResultCache(tmp_path))
+    detections = detector.detect_tiled(blob_scene)
+
+    assert len(registry) == 0
+    assert detections.to_dicts() == expected.to_dicts()
+    assert detections.names == {0: "vessel"}
+
+
+def test_result_cache_keys_inference_parameters(fake_yolo, blob_scene):
+    """Test different tiling parameters and thresholds below the floor miss."""
+    from pontos.cache import ResultCache
+
+    cache = ResultCache(floor=0.01)
+    detector = VesselDetector(result_cache=cache)
+    detector.detect_tiled(blob_scene, tile_size=320)
+    detector.detect_tiled(blob_scene, tile_size=512)
+
+    below_floor = VesselDetector(confidence_threshold=0.001, result_cache=cache)
+    below_floor.detect(blob_scene)
+
+    assert cache.stats.hits == 0
+    assert len(cache) == 2
+    assert detector.model.calls[-1]["conf"] == 0.001
+
+
+def test_detect_batch_scene_stack(fake_yolo):
+    """Test a (T, H, W, 3) stack is detected as T images."""
+    import numpy as np
+
+    stack = np.zeros((3, 256, 256, 3), dtype=np.uint8)
+    stack[1, 100:108, 20:30] = 255
+
+    detector = VesselDetector()
+    results = detector.detect_batch(stack, batch_size=8)
+
+    assert [len(detections) for detections in results] == [0, 1, 0]
+    assert [call["batch"] for call in detector.model.calls] == [3]
+
+
+def test_detect_incremental_skips_unchanged_tiles(fake_yolo, blob_scene):
+    """Test only tiles that changed since the previous pass are re-inferred."""
+    import numpy as np
+
+    detector = VesselDetector()
+    first, memory = detector.detect_incremental(blob_scene, tile_size=320, overlap=0.5)
+    assert memory.tiles == 36 and memory.skipped == 0
+    np.testing.assert_array_equal(
+        first.xyxy, detector.detect_tiled(blob_scene, tile_size=320, overlap=0.5).xyxy
+    )
+
+    # Identical pass: nothing is re-inferred
+    calls = len(detector.model.calls)
+    same, memory = detector.detect_incremental(
+        blob_scene, memory, tile_size=320, overlap=0.5
+    )
+    assert len(detector.model.calls) == calls
+    assert memory.skip_ratio == 1.0
+    np.testing.assert_array_equal(same.xyxy, first.xyxy)
+
+    # The vessel moves: only tiles covering its old or new position change
+    moved = np.zeros_like(blob_scene)
+    moved[100:112, 100:120] = 255
+    detections, memory = detector.detect_incremental(
+        moved, memory, tile_size=320, overlap=0.5
+    )
+    full = detector.detect_tiled(moved, tile_size=320, overlap=0.5)
+    assert 0 < memory.skipped < memory.tiles
+    np.testing.assert_array_equal(detections.xyxy, full.xyxy)
+    np.testing.assert_array_equal(detections.xyxy, [[100, 100, 120, 112]])
+
+
+def test_detect_incremental_tolerance_and_settings(fake_yolo, blob_scene):
+    """Test noise within tolerance is skipped and other settings reset memory."""
+    detector = VesselDetector()
+    _, memory = detector.detect_incremental(blob_scene, tile_size=320, overlap=0.5)
+
+    noisy = blob_scene.copy()
+    noisy[noisy == 0] = 3
+    _, within = detector.detect_incremental(noisy, memory, tile_size=320, overlap=0.5)
+    _, strict = detector.detect_incremental(
+        noisy, memory, tolerance=0.5, tile_size=320, overlap=0.5
+    )
+    _, resized = detector.detect_incremental(noisy, memory, tile_size=256)
+
+    assert within.skip_ratio == 1.0
+    assert strict.skipped == 0
+    assert resized.skipped == 0
+
+
+def test_detect_tiled_skips_cloudy_tiles(fake_yolo, blob_scene):
+    """Test tiles above the cloud fraction are dropped before inference."""
+    import numpy as np
+
+    clouds = np.zeros(blob_scene.shape[:2], dtype=np.float32)
+    clouds[:, 512:] = 0.9
+
+    detector = VesselDetector()
+    clear = detector.detect_tiled(blob_scene, tile_size=320, overlap=0.5)
+    assert detector.tile_stats.tiles == 36 and detector.tile_stats.cloudy == 0
+
+    masked = detector.detect_tiled(
+        blob_scene, tile_size=320, overlap=0.5, batch_size=36, cloud_mask=clouds
+    )
+
+    # Columns starting at x >= 320 are more than half under the cloud
+    assert detector.tile_stats.cloudy == 18
+    assert detector.tile_stats.saved == 0.5
+    assert detector.model.calls[-1]["batch"] == 18
+    np.testing.assert_array_equal(masked.xyxy, clear.xyxy)
+
+    detector.detect_tiled(
+        blob_scene, tile_size=320, overlap=0.5, cloud_mask=np.ones_like(clouds)
+    )
+    assert detector.tile_stats.inferred == 0
+
+
+def test_detect_tiled_keeps_fragments_next_to_skipped_tiles(fake_yolo):
+    """Test a seam is not cut when the tile across it is skipped as cloudy."""
+    import numpy as np
+
+    # Only the middle tile (x=160) sees the whole vessel at x=300-340
+    scene = np.zeros((640, 640, 3), dtype=np.uint8)
+    scene[100:112, 300:340] = 255
+    clouds = np.zeros((640, 640), dtype=np.float32)
+    clouds[:, 160:] = 0.9
+    clouds[80:130, 280:360] = 0.0
+
+    detector = VesselDetector()
+    clear = detector.detect_tiled(scene, tile_size=320, overlap=0.5)
+    masked = detector.detect_tiled(scene, tile_size=320, overlap=0.5, cloud_mask=clouds)
+
+    assert len(clear) == 1
+    assert detector.tile_stats.cloudy == 6
+    # The left column's fragment is now the only copy of the vessel
+    assert len(masked) == 1
+    np.testing.assert_array_equal(masked.xyxy, [[300, 100, 320, 112]])
+
+
+def test_detect_tiled_cloud_mask_shape_mismatch(fake_yolo, blob_scene):
+    """Test a cloud mask of another size is rejected."""
+    import numpy as np
+
+    detector = VesselDetector()
+    with pytest.raises(ValueError, match="Cloud mask shape"):
+        detector.detect_tiled(blob_scene, cloud_mask=np.zeros((10, 10), dtype=bool))
+
+
+def test_detect_tiled_skips_land_tiles(fake_yolo, blob_scene):
+    """Test tiles without a water pixel are dropped and counted as land."""
+    import numpy as np
+
+    land = np.zeros(blob_scene.shape[:2], dtype=bool)
+    land[:, 640:] = True
+
+    detector = VesselDetector()
+    clear = detector.detect_tiled(blob_scene, tile_size=320, overlap=0.5)
+
+    clouds = np.zeros(blob_scene.shape[:2], dtype=np.float32)
+    clouds[:200] = 1.0
+    masked = detector.detect_tiled(
+        blob_scene,
+        tile_size=320,
+        overlap=0.5,
+        batch_size=36,
+        cloud_mask=clouds,
+        land_mask=land,
+    )
+
+    # Columns starting at x >= 640 are all land, the top row is all cloud
+    stats = detector.tile_stats
+    assert (stats.tiles, stats.cloudy, stats.land) == (36, 6, 10)
+    assert stats.inferred == detector.model.calls[-1]["batch"] == 20
+    np.testing.assert_array_equal(masked.xyxy, clear.xyxy)
+
+    with pytest.raises(ValueError, match="Land mask shape"):
+        detector.detect_tiled(blob_scene, land_mask=land[:10])
@@ -1,7 +1,15 @@
 """Tests for geospatial utilities."""
 
+import gzip
+import importlib.util
 import json
-from pontos.geo import GeoExporter
+
+import numpy as np
+import pytest
+from pyproj import Transformer
+
+from pontos.detections import Detections
+from pontos.geo import FeatureWriter, GeoExporter, _transformer, utm_crs
 
 
 def test_pixel_to_geo_center(toulon_bbox):
@@ -79,3 +87,251 @@ def test_geojson_coordinates_in_bbox(sample_detections, toulon_bbox, tmp_path):
 
         assert toulon_bbox[0] <= lon <= toulon_bbox[2], f"Longitude {lon} out of bbox"
         assert toulon_bbox[1] <= lat <= toulon_bbox[3], f"Latitude {lat} out of bbox"
+
+
+def test_pixels_to_geo_matches_linear_path(toulon_bbox):
+    """Test the array transform reproduces _pixel_to_geo on a WGS84 grid."""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 1024, size=(1000, 2))
+
+    coords = GeoExporter.pixels_to_geo(points, toulon_bbox, (1024, 768))
+    expected = [
+        GeoExporter._pixel_to_geo(x, y, toulon_bbox, (1024, 768)) for x, y in points
+    ]
+
+    assert coords.shape == (1000, 2)
+    np.testing.assert_allclose(coords, expected, rtol=0, atol=1e-12)
+
+
+def test_pixels_to_geo_utm_grid(toulon_bbox):
+    """Test pixels of a UTM scene land where the UTM grid puts them."""
+    crs = utm_crs(toulon_bbox)
+    assert crs == "EPSG:32631"
+    assert utm_crs((-70.0, -33.5, -70.5, -33.0)) == "EPSG:32719"
+
+    to_utm = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    min_x, min_y = to_utm.transform(toulon_bbox[0], toulon_bbox[1])
+    max_x, max_y = to_utm.transform(toulon_bbox[2], toulon_bbox[3])
+    bbox = (min_x, min_y, max_x, max_y)
+
+    # 10 m pixels: pixel centers round-trip through the scene grid
+    size = (round((max_x - min_x) / 10), round((max_y - min_y) / 10))
+    lon, lat = 5.9537, 43.1012
+    x, y = to_utm.transform(lon, lat)
+    pixel = [
+        (x - min_x) / (max_x - min_x) * size[0],
+        (max_y - y) / (max_y - min_y) * size[1],
+    ]
+    coords = GeoExporter.pixels_to_geo([pixel], bbox, size, crs)
+    np.testing.assert_allclose(coords[0], [lon, lat], atol=1e-9)
+
+    # Grid corners map back to the WGS84 corners they were projected from
+    corners = GeoExporter.pixels_to_geo([[0, size[1]], [size[0], 0]], bbox, size, crs)
+    np.testing.assert_allclose(corners.ravel(), toulon_bbox, atol=1e-9)
+    assert _transformer(crs) is _transformer(crs)
+
+
+def test_detections_to_geojson_columnar(sample_detections, toulon_bbox, tmp_path):
+    """Test columnar and dict detections export the same features."""
+    from_dicts = GeoExporter.detections_to_geojson(
+        sample_detections, toulon_bbox, (1024, 1024), tmp_path / "dicts.geojson"
+    )
+    from_columns = GeoExporter.detections_to_geojson(
+        Detections.from_dicts(sample_detections),
+        toulon_bbox,
+        (1024, 1024),
+        tmp_path / "columns.geojson",
+    )
+
+    dicts = json.loads(from_dicts.read_text())["features"]
+    columns = json.loads(from_columns.read_text())["features"]
+    for left, right in zip(dicts, columns):
+        assert left["properties"]["class"] == right["properties"]["class"]
+        np.testing.assert_allclose(
+            left["geometry"]["coordinates"], right["geometry"]["coordinates"]
+        )
+        assert (
+            abs(left["properties"]["confidence"] - right["properties"]["confidence"])
+            < 1e-6
+        )
+
+
+def _many_detections(count, seed=0):
+    """Random detections over a 1024x1024 scene, with two classes."""
+    rng = np.random.default_rng(seed)
+    corners = rng.uniform(0, 1000, size=(count, 2))
+    return Detections(
+        np.hstack([corners, corners + 20]),
+        rng.uniform(0.05, 1.0, count),
+        rng.integers(0, 2, count),
+        {0: "vessel", 1: "tanker"},
+    )
+
+
+def test_feature_writer_streams_collection(toulon_bbox, tmp_path):
+    """Test batches written in chunks form one FeatureCollection with running ids."""
+    path = tmp_path / "out" / "vessels.geojson"
+    first, second = _many_detections(7), _many_detections(5, seed=1)
+
+    with FeatureWriter(path, chunk_size=3) as writer:
+        writer.write(first, toulon_bbox, (1024, 1024))
+        writer.write(Detections.empty(), toulon_bbox, (1024, 1024))
+        writer.write(second, toulon_bbox, (1024, 1024), properties={"pass": "b"})
+
+    features = json.loads(path.read_text())["features"]
+    assert [f["properties"]["id"] for f in features] == list(range(12))
+    assert features[-1]["properties"]["pass"] == "b"
+    assert "pass" not in features[0]["properties"]
+    assert features[0]["properties"]["class"] == first.names[int(first.class_id[0])]
+    assert features[0]["properties"]["confidence"] == pytest.approx(
+        float(first.conf[0]), abs=1e-6
+    )
+
+    expected = GeoExporter.pixels_to_geo(first.centers, toulon_bbox, (1024, 1024))
+    np.testing.assert_allclose(
+        [f["geometry"]["coordinates"] for f in features[:7]], expected
+    )
+
+
+def test_feature_writer_sequence_gzip(toulon_bbox, tmp_path):
+    """Test GeoJSONSeq output is one feature per line, gzipped by suffix."""
+    path = tmp_path / "vessels.geojsons.gz"
+    detections = _many_detections(10)
+
+    with FeatureWriter(path, sequence=True, chunk_size=4) as writer:
+        writer.write(detections, toulon_bbox, (1024, 1024))
+        writer.write(detections[:2], toulon_bbox, (1024, 1024))
+
+    with gzip.open(path, "rt") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 12
+    assert [json.loads(line)["properties"]["id"] for line in lines] == list(range(12))
+
+    empty = tmp_path / "empty.geojson"
+    FeatureWriter(empty).close()
+    assert json.loads(empty.read_text()) == {
+        "type": "FeatureCollection",
+        "features": [],
+    }
+
+
+def test_feature_writer_tracks(tmp_path):
+    """Test tracks are written as LineString features."""
+    from datetime import datetime
+
+    from pontos.tracking import Track
+
+    times = [datetime(2026, 1, 5, 10, 27), datetime(2026, 1, 10, 10, 27)]
+    track = Track(3, times, [(5.9, 43.1), (5.95, 43.12)], [0.5, 0.7])
+    path = tmp_path / "tracks.geojson"
+    with FeatureWriter(path) as writer:
+        assert writer.write_tracks([track, track]) == 2
+
+    features = json.loads(path.read_text())["features"]
+    assert len(features) == 2
+    assert features[0]["geometry"] == {
+        "type": "LineString",
+        "coordinates": [[5.9, 43.1], [5.95, 43.12]],
+    }
+    assert features[0]["properties"]["id"] == 3
+    assert features[0]["properties"]["end"] == "2026-01-10T10:27:00"
+    assert features[0]["properties"]["confidence"] == pytest.approx(0.6)
+
+
+def test_merge_duplicates(toulon_bbox, tmp_path):
+    """Test detections closer than the merge distance keep the most confident."""
+    # Pixels are about 16 m wide here, so the first two are 32 m apart
+    detections = Detections(
+        np.array(
+            [[100, 100, 110, 110], [102, 100, 112, 110], [600, 600, 610, 610]],
+            dtype=np.float32,
+        ),
+        np.array([0.4, 0.9, 0.5], dtype=np.float32),
+        np.zeros(3, dtype=np.int64),
+    )
+
+    merged = GeoExporter.merge_duplicates(detections, toulon_bbox, (1024, 1024), 50.0)
+    assert isinstance(merged, Detections)
+    assert merged.conf.tolist() == pytest.approx([0.9, 0.5])
+    kept = GeoExporter.merge_duplicates(detections, toulon_bbox, (1024, 1024), 20.0)
+    assert len(kept) == 3
+
+    dicts = GeoExporter.merge_duplicates(
+        detections.to_dicts(), toulon_bbox, (1024, 1024), 50.0
+    )
+    assert [det["confidence"] for det in dicts] == pytest.approx([0.9, 0.5])
+
+    output = GeoExporter.export(
+        detections,
+        toulon_bbox,
+        (1024, 1024),
+        tmp_path / "vessels.geojson",
+        merge_distance=50.0,
+    )
+    assert len(json.loads(output.read_text())["features"]) == 2
+
+
+def test_export_unknown_format(sample_detections, toulon_bbox, tmp_path):
+    """Test an unsupported format is rejected."""
+    with pytest.raises(ValueError, match="Unknown export format 'kml'"):
+        GeoExporter.export(
+            sample_detections, toulon_bbox, (1024, 1024), tmp_path / "v.kml", "kml"
+        )
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"
+)
+def test_export_geoparquet(toulon_bbox, tmp_path):
+    """Test GeoParquet columns and metadata match the GeoJSON export."""
+    import pyarrow.parquet as pq
+    import shapely
+
+    detections = _many_detections(50)
+    path = GeoExporter.export(
+        detections, toulon_bbox, (1024, 1024), tmp_path / "v.parquet", "geoparquet"
+    )
+
+    table = pq.read_table(path)
+    geo = json.loads(table.schema.metadata[b"geo"])
+    assert geo["primary_column"] == "geometry"
+    assert geo["columns"]["geometry"]["encoding"] == "WKB"
+
+    points = shapely.from_wkb(table.column("geometry").to_numpy(zero_copy_only=False))
+    expected = GeoExporter.pixels_to_geo(detections.centers, toulon_bbox, (1024, 1024))
+    np.testing.assert_allclose(shapely.get_coordinates(points), expected)
+    np.testing.assert_array_equal(
+        table.column("confidence").to_numpy(), detections.conf
+    )
+    assert table.column("class").to_pylist()[:3] == [
+        detections.names[int(idx)] for idx in detections.class_id[:3]
+    ]
+    np.testing.assert_allclose(
+        geo["columns"]["geometry"]["bbox"],
+        [*expected.min(axis=0), *expected.max(axis=0)],
+    )
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyogrio") is None, reason="pyogrio not installed"
+)
+def test_export_flatgeobuf(toulon_bbox, tmp_path):
+    """Test FlatGeobuf points round-trip with their attributes."""
+    import shapely
+    from pyogrio.raw import read
+
+    detections = _many_detections(50)
+    path = GeoExporter.export(
+        detections, toulon_bbox, (1024, 1024), tmp_path / "v.fgb", "flatgeobuf"
+    )
+
+    meta, _, geometry, fields = read(path)
+    assert meta["geometry_type"] == "Point"
+    assert list(meta["fields"]) == ["id", "confidence", "class"]
+    expected = GeoExporter.pixels_to_geo(detections.centers, toulon_bbox, (1024, 1024))
+    # Features come back in spatial index order
+    order = np.argsort(fields[0])
+    np.testing.assert_allclose(
+        shapely.get_coordinates(shapely.from_wkb(geometry))[order], expected
+    )
+    np.testing.assert_allclose(fields[1][order], detections.conf)
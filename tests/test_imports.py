@@ -0,0 +1,85 @@
+"""Import-time budget tests for the package and CLI."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pontos
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import budget for `import pontos` and `pontos --help`
+IMPORT_BUDGET_SECONDS = 0.5
+
+# Modules that must only load when a command actually needs them
+HEAVY_MODULES = ("torch", "ultralytics", "sentinelhub", "cv2")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)")
+
+
+def import_times(*args: str) -> dict:
+    """
+    Run Python with -X importtime and parse the report.
+
+    Returns:
+        Mapping of imported module name to cumulative seconds
+    """
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative, module = match.groups()
+            times[module] = int(cumulative) / 1e6
+    return times
+
+
+def assert_light(times: dict) -> None:
+    """Check no heavy module was imported and the budget holds."""
+    loaded = sorted(m for m in times if m.split(".")[0] in HEAVY_MODULES)
+    assert loaded == [], f"Heavy modules imported eagerly: {loaded[:5]}"
+    # Cumulative times nest, so the largest entry is the whole run
+    assert max(times.values()) < IMPORT_BUDGET_SECONDS
+
+
+def test_import_pontos_is_light():
+    """Test `import pontos` stays within the import budget."""
+    times = import_times("-c", "import pontos")
+
+    assert "pontos" in times
+    assert times["pontos"] < IMPORT_BUDGET_SECONDS
+    assert_light(times)
+
+
+def test_cli_help_is_light():
+    """Test `pontos --help` does not import the detection stack."""
+    assert_light(import_times("-m", "pontos.cli", "--help"))
+    assert_light(import_times("-m", "pontos.cli", "scan", "--help"))
+
+
+def test_lazy_attributes_resolve():
+    """Test lazy package attributes resolve to the real classes."""
+    from pontos.geo import GeoExporter
+
+    assert pontos.GeoExporter is GeoExporter
+    assert "VesselDetector" in dir(pontos)
+    assert pontos.config.patch_size > 0
+
+
+def test_unknown_attribute():
+    """Test unknown package attributes still raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        _ = pontos.Missing
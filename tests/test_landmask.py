@@ -0,0 +1,113 @@
+"""Tests for land mask rasterization."""
+
+import json
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon, box
+
+from pontos.cache import DiskCache
+from pontos.landmask import LandMask
+
+BBOX = (5.0, 43.0, 6.0, 44.0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty raster cache."""
+    return DiskCache(tmp_path / "landmask", max_bytes=1 << 24)
+
+
+def test_rasterize_orientation(cache):
+    """Test land north of 43.5 fills the top half of the raster."""
+    mask = LandMask([box(4.0, 43.5, 7.0, 45.0)], cache=cache).rasterize(
+        BBOX, (200, 100)
+    )
+
+    assert mask.shape == (100, 200) and mask.dtype == bool
+    assert mask[:49].all()
+    assert not mask[51:].any()
+
+
+def test_rasterize_keeps_holes_and_skips_far_polygons(cache):
+    """Test lakes stay water and polygons outside the bbox are ignored."""
+    island = Polygon(
+        [(5.0, 43.0), (6.0, 43.0), (6.0, 44.0), (5.0, 44.0)],
+        holes=[[(5.4, 43.4), (5.6, 43.4), (5.6, 43.6), (5.4, 43.6)]],
+    )
+    land = LandMask([island, box(20.0, 50.0, 21.0, 51.0)], cache=cache)
+    mask = land.rasterize(BBOX, (100, 100))
+
+    assert not mask[45:55, 45:55].any()
+    assert mask[:30].all()
+
+
+def test_rasterize_keeps_islands_inside_lakes(tmp_path):
+    """Test a lake hole does not erase an island polygon inside it."""
+    lake_island = box(5.45, 43.45, 5.55, 43.55)
+    shore = Polygon(
+        [(5.0, 43.0), (6.0, 43.0), (6.0, 44.0), (5.0, 44.0)],
+        holes=[[(5.3, 43.3), (5.7, 43.3), (5.7, 43.7), (5.3, 43.7)]],
+    )
+
+    for order, polygons in enumerate([[lake_island, shore], [shore, lake_island]]):
+        cache = DiskCache(tmp_path / str(order), max_bytes=1 << 24)
+        mask = LandMask(polygons, cache=cache).rasterize(BBOX, (100, 100))
+
+        assert mask[47:53, 47:53].all()
+        assert not mask[33:43, 33:43].any()
+        assert mask[:25].all()
+
+
+def test_coast_buffer_shrinks_land(cache):
+    """Test the buffer gives back a strip of coastal land as water."""
+    land = LandMask([box(4.0, 43.5, 7.0, 45.0)], cache=cache)
+    exact = land.rasterize(BBOX, (100, 1000))
+    buffered = land.rasterize(BBOX, (100, 1000), buffer_m=1112)
+
+    # 1112 m is 0.01 degree of latitude, 10 rows at 1000 rows per degree
+    assert exact.sum(axis=0)[50] - buffered.sum(axis=0)[50] == pytest.approx(10, abs=1)
+
+
+def test_coast_buffer_ignores_dataset_splits(cache):
+    """Test land split into adjacent polygons is buffered as one coast."""
+    # OSM-style split land: one landmass cut at lon 5.5, coast at lat 43.5
+    split = [box(4.0, 42.0, 5.5, 43.5), box(5.5, 42.0, 7.0, 43.5)]
+    mask = LandMask(split, cache=cache).rasterize(BBOX, (200, 100), buffer_m=5000)
+    whole = LandMask([box(4.0, 42.0, 7.0, 43.5)], cache=cache).rasterize(
+        BBOX, (200, 100), buffer_m=5000
+    )
+
+    # 5 km of coast is water, but no strip opens along the cut
+    assert mask[60:].all()
+    assert not mask[:54].any()
+    np.testing.assert_array_equal(mask, whole)
+
+
+def test_rasterize_is_cached(cache):
+    """Test a second rasterization of the same grid is read from disk."""
+    land = LandMask([box(4.0, 43.5, 7.0, 45.0)], cache=cache)
+    first = land.rasterize(BBOX, (64, 64))
+    second = LandMask([box(4.0, 43.5, 7.0, 45.0)], cache=cache).rasterize(
+        BBOX, (64, 64)
+    )
+
+    np.testing.assert_array_equal(first, second)
+    assert cache.stats.hits == 1
+    land.rasterize(BBOX, (32, 32))
+    assert cache.stats.misses == 2
+
+
+def test_from_geojson(tmp_path, cache):
+    """Test a GeoJSON FeatureCollection is loaded without geopandas."""
+    path = tmp_path / "land.geojson"
+    feature = {
+        "type": "Feature",
+        "geometry": box(4.0, 43.5, 7.0, 45.0).__geo_interface__,
+        "properties": {},
+    }
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": [feature]}))
+
+    mask = LandMask.from_file(path, cache=cache).rasterize(BBOX, (10, 10))
+
+    assert mask[:4].all() and not mask[6:].any()
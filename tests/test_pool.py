@@ -0,0 +1,123 @@
+"""Tests for process-pool CPU inference."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+from pontos import pool
+from pontos.detector import VesselDetector
+from pontos.pool import DetectorPool
+
+
+@pytest.fixture
+def worker(fake_yolo, runtime_threads):
+    """Initialize worker state in this process, restoring runtime threads."""
+    pool._init_worker(None, 0.05, 1)
+    yield pool._detector
+
+    # FakeYOLO keeps its inputs; drop them so the segments can be unmapped
+    pool._detector.model.calls.clear()
+    pool._detector = None
+    for name in list(pool._segments):
+        pool._segments.pop(name).close()
+
+
+def test_share_array_roundtrip(blob_scene):
+    """Test arrays survive a trip through shared memory."""
+    shm, spec = pool._share_array(blob_scene)
+    try:
+        name, shape, dtype = spec
+        assert shape == blob_scene.shape
+        attached = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf)
+        assert np.array_equal(attached, blob_scene)
+        del attached
+    finally:
+        pool._release(shm)
+
+
+def test_init_worker_limits_threads(worker):
+    """Test worker initialization loads the model with split threads."""
+    assert torch.get_num_threads() == 1
+    assert worker.device == "cpu"
+    assert pool._model_names() == {0: "vessel"}
+
+
+def test_detect_tiles_task_matches_detector(worker, blob_scene):
+    """Test workers produce the same tile boxes from shared memory."""
+    from pontos.detector import _merge_tile_boxes, _tile_grid
+
+    origins, stride = _tile_grid(blob_scene.shape[:2], 320, 0.5)
+    shm, spec = pool._share_array(blob_scene)
+    try:
+        boxes = [
+            torch.from_numpy(
+                pool._detect_tiles_task(spec, origins[i : i + 8], 320, stride)
+            )
+            for i in range(0, len(origins), 8)
+        ]
+    finally:
+        pool._release(shm)
+
+    merged = _merge_tile_boxes(boxes, 0.5, pool._model_names())
+    expected = worker.detect_tiled(blob_scene, tile_size=320, overlap=0.5)
+    np.testing.assert_array_equal(merged.xyxy, expected.xyxy)
+
+
+def test_detect_tiles_task_keeps_seams_of_skipped_neighbours(worker):
+    """Test workers only cut seams towards tiles that are inferred."""
+    scene = np.zeros((640, 640, 3), dtype=np.uint8)
+    scene[100:112, 300:340] = 255
+    shm, spec = pool._share_array(scene)
+    try:
+        cut = pool._detect_tiles_task(spec, [(0, 0)], 320, 160)
+        kept = pool._detect_tiles_task(
+            spec, [(0, 0)], 320, 160, frozenset({(0, 0), (0, 160)})
+        )
+    finally:
+        pool._release(shm)
+
+    assert len(cut) == 0
+    np.testing.assert_array_equal(kept[:, :4], [[300, 100, 320, 112]])
+
+
+def test_detect_batch_task_mixed_sources(worker, blob_scene, tmp_path):
+    """Test worker batches accept both paths and shared arrays."""
+    from PIL import Image
+
+    image_path = tmp_path / "scene.png"
+    Image.fromarray(blob_scene).save(image_path)
+    shm, spec = pool._share_array(blob_scene)
+    try:
+        results = pool._detect_batch_task([str(image_path), spec])
+    finally:
+        pool._release(shm)
+
+    assert [len(r) for r in results] == [1, 1]
+    assert worker.model.calls[0]["batch"] == 2
+
+
+def test_threads_split_across_workers(monkeypatch):
+    """Test default torch threads are an even split of the cores."""
+    monkeypatch.setattr(pool.os, "cpu_count", lambda: 32)
+
+    with DetectorPool(max_workers=4) as detector_pool:
+        assert detector_pool.threads_per_worker == 8
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not Path("models/yolo11s_tci.pt").exists(), reason="YOLO model not found"
+)
+def test_pool_matches_single_process(sample_image):
+    """Test pooled tiled detection matches the single-process detector."""
+    detector = VesselDetector(device="cpu", confidence_threshold=0.05)
+    expected = detector.detect_tiled(sample_image)
+
+    with DetectorPool(confidence_threshold=0.05, max_workers=2) as detector_pool:
+        detections = detector_pool.detect_tiled(sample_image)
+        batch = detector_pool.detect_batch([sample_image, sample_image])
+
+    np.testing.assert_allclose(detections.xyxy, expected.xyxy, atol=1e-3)
+    assert len(batch) == 2
@@ -0,0 +1,146 @@
+"""Tests for the process-wide model registry."""
+
+import threading
+import time
+
+import pytest
+
+from pontos.detector import VesselDetector
+from pontos.registry import ModelRegistry
+
+
+def test_registry_loads_once():
+    """Test a key is loaded once and then shared."""
+    registry = ModelRegistry()
+    loads = []
+
+    first = registry.get("model", lambda: loads.append(1) or object())
+    second = registry.get("model", lambda: loads.append(1) or object())
+
+    assert first is second
+    assert loads == [1]
+    assert registry.stats("model").hits == 1
+    assert "model" in registry
+    assert len(registry) == 1
+
+
+def test_registry_concurrent_get_loads_once():
+    """Test concurrent first requests do not load the model twice."""
+    registry = ModelRegistry()
+    loads = []
+
+    def slow_loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return object()
+
+    threads = [
+        threading.Thread(target=registry.get, args=("model", slow_loader))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [1]
+
+
+def test_registry_warmup_runs_once():
+    """Test warmup records cold and warm latency a single time."""
+    registry = ModelRegistry()
+    runs = []
+
+    stats = registry.warmup("model", object, runs.append)
+    again = registry.warmup("model", object, runs.append)
+
+    assert len(runs) == 2
+    assert stats is again
+    assert stats.is_warm
+    assert stats.cold_latency >= 0
+    assert stats.warm_latency >= 0
+
+
+def test_registry_clear():
+    """Test clearing drops models and stats."""
+    registry = ModelRegistry()
+    registry.get("model", object)
+
+    registry.clear()
+
+    assert "model" not in registry
+    assert registry.stats("model") is None
+
+
+def test_detectors_share_model(fake_yolo):
+    """Test detectors with the same weights and device share one model."""
+    first = VesselDetector(device="cpu")
+    second = VesselDetector(device="cpu", confidence_threshold=0.5)
+
+    assert first.model_stats is None
+    assert first.model is second.model
+    assert first.model_stats.hits == 1
+
+
+def test_detector_backend_separates_models(fake_yolo, monkeypatch):
+    """Test the backend is part of the registry key."""
+    monkeypatch.setattr(
+        "pontos.detector.export_model", lambda path, *args, **kwargs: path
+    )
+
+    torch_detector = VesselDetector(device="cpu")
+    onnx_detector = VesselDetector(device="cpu", backend="onnx")
+
+    assert torch_detector.model is not onnx_detector.model
+
+
+def test_detector_warmup(fake_yolo):
+    """Test warmup runs dummy tile batches and reports latencies."""
+    detector = VesselDetector(device="cpu")
+
+    stats = detector.warmup(batch_size=4)
+
+    assert stats.is_warm
+    assert stats.load_seconds >= 0
+    assert [call["batch"] for call in detector.model.calls] == [4, 4]
+    assert detector.model.calls[0]["imgsz"] == 320
+    assert VesselDetector(device="cpu").warmup() is stats
+
+
+def test_detectors_serialize_shared_model_calls(fake_yolo, blob_scene, monkeypatch):
+    """Test threads sharing a model never call it concurrently."""
+    active, peak = [], []
+    predict = fake_yolo.__call__
+
+    def tracked(self, source, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.01)
+        try:
+            return predict(self, source, **kwargs)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(fake_yolo, "__call__", tracked)
+    detectors = [VesselDetector(device="cpu") for _ in range(4)]
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda d=detector: results.append(d.detect_batch([blob_scene] * 2))
+        )
+        for detector in detectors
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert all(len(batch[0]) == 1 for batch in results)
+    assert max(peak) == 1
+
+
+def test_detector_missing_weights(tmp_path):
+    """Test missing weights fail at construction, before lazy loading."""
+    with pytest.raises(FileNotFoundError, match="Model not found"):
+        VesselDetector(model_path=tmp_path / "missing.pt")
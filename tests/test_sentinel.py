@@ -1,5 +1,6 @@
 """Tests for Sentinel Hub data acquisition."""
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 from pontos.sentinel import SentinelDataSource
@@ -39,12 +40,15 @@ def test_sentinel_custom_credentials():
     assert sentinel.sh_config.sh_client_secret == "custom-secret"
 
 
+@patch("pontos.sentinel._PooledDownloadClient")
 @patch("pontos.sentinel.SentinelHubRequest")
-def test_get_scene_parameters(mock_request, toulon_bbox, mock_sentinel_response):
+def test_get_scene_parameters(
+    mock_request, mock_client, toulon_bbox, mock_sentinel_response
+):
     """Test scene download with correct parameters."""
     # Mock the request
     mock_instance = MagicMock()
-    mock_instance.get_data.return_value = [mock_sentinel_response]
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
     mock_request.return_value = mock_instance
 
     sentinel = SentinelDataSource(client_id="test-id", client_secret="test-secret")
@@ -83,9 +87,15 @@ def test_sentinel_only_client_secret():
     assert sentinel.sh_config.sh_client_secret == "only-secret"
 
 
+@patch("pontos.sentinel._PooledDownloadClient")
 @patch("pontos.sentinel.SentinelHubRequest")
 def test_get_scene_default_output_path(
-    mock_request, toulon_bbox, mock_sentinel_response, tmp_path, monkeypatch
+    mock_request,
+    mock_client,
+    toulon_bbox,
+    mock_sentinel_response,
+    tmp_path,
+    monkeypatch,
 ):
     """Test scene download with default output path."""
     # Change to temp dir
@@ -96,7 +106,7 @@ def test_get_scene_default_output_path(
 
     # Mock request
     mock_instance = MagicMock()
-    mock_instance.get_data.return_value = [mock_sentinel_response]
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
     mock_request.return_value = mock_instance
 
     sentinel = SentinelDataSource(client_id="test", client_secret="test")
@@ -112,11 +122,14 @@ def test_get_scene_default_output_path(
     assert scene_path.suffix == ".png"
 
 
+@patch("pontos.sentinel._PooledDownloadClient")
 @patch("pontos.sentinel.SentinelHubRequest")
-def test_get_scene_custom_size(mock_request, toulon_bbox, mock_sentinel_response):
+def test_get_scene_custom_size(
+    mock_request, mock_client, toulon_bbox, mock_sentinel_response
+):
     """Test scene download with custom size."""
     mock_instance = MagicMock()
-    mock_instance.get_data.return_value = [mock_sentinel_response]
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
     mock_request.return_value = mock_instance
 
     sentinel = SentinelDataSource(client_id="test", client_secret="test")
@@ -130,3 +143,774 @@ def test_get_scene_custom_size(mock_request, toulon_bbox, mock_sentinel_response
     # Verify request was called with correct size
     call_kwargs = mock_request.call_args[1]
     assert call_kwargs["size"] == [512, 512]
+
+
+@patch("pontos.sentinel._PooledDownloadClient")
+@patch("pontos.sentinel.SentinelHubRequest")
+def test_get_scene_array_in_memory(
+    mock_request,
+    mock_client,
+    toulon_bbox,
+    mock_sentinel_response,
+    tmp_path,
+    monkeypatch,
+):
+    """Test in-memory download returns the array without touching disk."""
+    monkeypatch.chdir(tmp_path)
+    mock_instance = MagicMock()
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
+    mock_request.return_value = mock_instance
+
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    scene = sentinel.get_scene_array(
+        bbox=toulon_bbox, time_range=("2026-01-01", "2026-01-31")
+    )
+
+    assert scene.dtype == np.uint8
+    assert np.shares_memory(scene, mock_sentinel_response)
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("pontos.sentinel._PooledDownloadClient")
+@patch("pontos.sentinel.SentinelHubRequest")
+def test_get_scene_array_async_save(
+    mock_request, mock_client, toulon_bbox, mock_sentinel_response, tmp_path
+):
+    """Test optional background persistence of in-memory scenes."""
+    from PIL import Image
+
+    mock_instance = MagicMock()
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
+    mock_request.return_value = mock_instance
+
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    output_path = tmp_path / "scenes" / "scene.png"
+    scene = sentinel.get_scene_array(
+        bbox=toulon_bbox,
+        time_range=("2026-01-01", "2026-01-31"),
+        output_path=output_path,
+    )
+
+    assert sentinel.wait_for_writes() == [output_path]
+    assert np.array_equal(np.asarray(Image.open(output_path)), scene)
+    assert sentinel.wait_for_writes() == []
+
+
+@patch("pontos.sentinel._PooledDownloadClient")
+@patch("pontos.sentinel.SentinelHubRequest")
+def test_get_scene_array_cache(
+    mock_request, mock_client, toulon_bbox, mock_sentinel_response, tmp_path
+):
+    """Test repeated requests are served from the scene cache."""
+    from pontos.cache import DiskCache
+
+    mock_instance = MagicMock()
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
+    mock_request.return_value = mock_instance
+
+    cache = DiskCache(tmp_path / "cache", max_bytes=1 << 30)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test", cache=cache)
+    time_range = ("2026-01-01", "2026-01-31")
+
+    first = sentinel.get_scene_array(bbox=toulon_bbox, time_range=time_range)
+    second = sentinel.get_scene_array(bbox=toulon_bbox, time_range=time_range)
+    sentinel.get_scene_array(bbox=toulon_bbox, time_range=time_range, size=512)
+
+    assert mock_request.call_count == 2
+    assert np.array_equal(first, second)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_open_window_scenes_not_cached(sentinel_hub_server, monkeypatch, tmp_path):
+    """Test scenes of windows reaching into the present are downloaded again."""
+    from datetime import date, timedelta
+
+    from pontos.cache import DiskCache
+
+    cache = DiskCache(tmp_path / "cache", max_bytes=1 << 30)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test", cache=cache)
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    bbox = (5.0, 43.0, 5.1, 43.1)
+    window = (str(date.today() - timedelta(days=5)), str(date.today()))
+
+    for _ in range(2):
+        sentinel.get_scene_array(bbox, window, size=32, response_format="tiff")
+        sentinel.get_scene_with_clouds(bbox, window, size=32)
+
+    assert len(sentinel_hub_server.statuses) == 4
+    assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 0
+
+
+def test_scene_cache_from_config(tmp_path, monkeypatch):
+    """Test SCENE_CACHE_MB enables a cache under the data directory."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    monkeypatch.setattr(config, "scene_cache_mb", 64)
+
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+
+    assert sentinel.cache.directory == tmp_path / "cache" / "scenes"
+    assert sentinel.cache.max_bytes == 64 * 1024 * 1024
+
+
+def test_plan_mosaic_tiles_raster_exactly():
+    """Test sub-requests respect the size limit and stay pixel aligned."""
+    from pontos.sentinel import _plan_mosaic
+
+    bbox = (5.0, 43.0, 6.0, 43.5)
+    plan = _plan_mosaic(bbox, (5001, 2600), max_size=2500)
+
+    assert len(plan) == 3 * 2
+    covered = np.zeros((2600, 5001), dtype=int)
+    for (min_lon, min_lat, max_lon, max_lat), (x0, y0, x1, y1) in plan:
+        assert x1 - x0 <= 2500 and y1 - y0 <= 2500
+        covered[y0:y1, x0:x1] += 1
+        # Same linear pixel -> lon/lat mapping as the full raster
+        assert min_lon == pytest.approx(5.0 + x0 / 5001)
+        assert max_lat == pytest.approx(43.5 - y0 / 2600 * 0.5)
+        assert (max_lon - min_lon) / (x1 - x0) == pytest.approx(1.0 / 5001)
+    assert (covered == 1).all()
+
+
+@patch("pontos.sentinel._PooledDownloadClient")
+@patch("pontos.sentinel.SentinelHubRequest")
+def test_get_scene_mosaic(mock_request, mock_client, monkeypatch):
+    """Test large areas are split, downloaded concurrently and stitched."""
+    monkeypatch.setattr("pontos.sentinel.MAX_REQUEST_SIZE", 100)
+
+    def build_request(**kwargs):
+        request = MagicMock()
+        request.download_list = [kwargs]
+        return request
+
+    def download(download_requests, max_threads):
+        return [
+            np.full((req["size"][1], req["size"][0], 3), idx, dtype=np.uint8)
+            for idx, req in enumerate(download_requests)
+        ]
+
+    mock_request.side_effect = build_request
+    mock_client.return_value.download.side_effect = download
+
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    mosaic = sentinel.get_scene_mosaic(
+        bbox=(5.8, 43.0, 6.0, 43.1),
+        time_range=("2026-01-01", "2026-01-31"),
+        resolution=60.0,
+        max_threads=3,
+    )
+
+    sizes = [call.kwargs["size"] for call in mock_request.call_args_list]
+    assert mosaic.shape == (194, 265, 3)
+    assert sizes[0] == [88, 97]
+    assert all(w <= 100 and h <= 100 for w, h in sizes)
+    assert mock_client.return_value.download.call_args.kwargs["max_threads"] == 3
+    # Tiles land in row-major order: 3 columns, 2 rows
+    assert mosaic[0, 0, 0] == 0 and mosaic[0, -1, 0] == 2
+    assert mosaic[-1, 0, 0] == 3 and mosaic[-1, -1, 0] == 5
+
+
+@patch("pontos.sentinel._PooledDownloadClient")
+@patch("pontos.sentinel.SentinelHubRequest")
+def test_get_scene_array_tiff_format(
+    mock_request, mock_client, toulon_bbox, mock_sentinel_response, tmp_path
+):
+    """Test the raw TIFF format requests uint8 samples and keys the cache."""
+    from sentinelhub import MimeType
+
+    from pontos.cache import DiskCache
+
+    mock_client.return_value.fetch_request.return_value = mock_sentinel_response
+    mock_request.output_response.side_effect = lambda name, mime: mime
+
+    cache = DiskCache(tmp_path, max_bytes=1 << 30)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test", cache=cache)
+    time_range = ("2026-01-01", "2026-01-31")
+
+    sentinel.get_scene_array(toulon_bbox, time_range, response_format="png")
+    scene = sentinel.get_scene_array(toulon_bbox, time_range, response_format="tiff")
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["responses"] == [MimeType.TIFF]
+    assert 'sampleType: "UINT8"' in kwargs["evalscript"]
+    assert mock_request.call_count == 2
+    assert scene.dtype == np.uint8
+
+
+def test_get_scene_array_unknown_format(toulon_bbox):
+    """Test unsupported response formats are rejected."""
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+
+    with pytest.raises(ValueError, match="Unknown response format"):
+        sentinel.get_scene_array(
+            toulon_bbox, ("2026-01-01", "2026-01-31"), response_format="jpeg"
+        )
+
+
+def _scene_requests(count, size=64):
+    """Scene requests whose stand-in responses are filled with their index."""
+    from pontos.sentinel import SceneRequest
+
+    return [
+        SceneRequest(
+            (lon, 43.0, lon + 0.1, 43.1),
+            ("2026-01-01", "2026-01-31"),
+            size,
+            response_format="tiff",
+        )
+        for lon in range(count)
+    ]
+
+
+def test_get_scenes_shares_session_and_bounds_concurrency(
+    sentinel_hub_server, monkeypatch
+):
+    """Test batch downloads reuse one token and connection pool in parallel."""
+    # Long enough for all three downloads to overlap
+    sentinel_hub_server.delay = 0.3
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    results = dict(sentinel.get_scenes(_scene_requests(6), max_concurrency=3))
+
+    assert len(results) == 6
+    for scene, image in results.items():
+        assert image.shape == (64, 64, 3)
+        assert (image == scene.bbox[0]).all()
+    assert sentinel_hub_server.tokens == 1
+    assert sentinel_hub_server.max_in_flight == 3
+    assert len(sentinel_hub_server.connections) <= 3
+    assert {auth for _, auth in sentinel_hub_server.requests} == {"Bearer fake-token"}
+
+
+def test_pooled_client_grows_for_wider_batches(
+    sentinel_hub_server, monkeypatch, tmp_path
+):
+    """Test a batch wider than the first download gets a pool of its size."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    monkeypatch.setattr(config, "download_threads", 1)
+    sentinel_hub_server.delay = 0.3
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    sentinel.get_scene_array((1.0, 43.0, 1.1, 43.1), ("2026-01-01", "2026-01-31"))
+    client = sentinel._pooled_client(1)
+    results = dict(sentinel.get_scenes(_scene_requests(6), max_concurrency=3))
+
+    assert len(results) == 6
+    assert sentinel._pooled_client(2) is client
+    assert client.pool_size == 3
+    assert sentinel_hub_server.max_in_flight == 3
+    # One connection from the single download, then three kept alive
+    assert len(sentinel_hub_server.connections) <= 4
+
+
+def test_get_scenes_yields_cached_scenes_first(
+    sentinel_hub_server, monkeypatch, tmp_path
+):
+    """Test results arrive in completion order, cache hits without requests."""
+    from pontos.cache import DiskCache
+
+    sentinel_hub_server.delay = 0.05
+    sentinel = SentinelDataSource(
+        client_id="test",
+        client_secret="test",
+        cache=DiskCache(tmp_path, max_bytes=1 << 30),
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    scenes = _scene_requests(4)
+
+    list(sentinel.get_scenes(scenes[2:]))
+    order = [scene for scene, _ in sentinel.get_scenes(scenes, max_concurrency=4)]
+
+    assert set(order[:2]) == set(scenes[2:])
+    assert set(order[2:]) == set(scenes[:2])
+    assert len(sentinel_hub_server.requests) == 4
+
+
+def test_get_scenes_async(sentinel_hub_server, monkeypatch):
+    """Test the asyncio variant bounds concurrency and returns every scene."""
+    import asyncio
+
+    sentinel_hub_server.delay = 0.2
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    async def collect():
+        return [
+            item
+            async for item in sentinel.get_scenes_async(
+                _scene_requests(6), max_concurrency=2
+            )
+        ]
+
+    results = asyncio.run(collect())
+
+    assert sorted(scene.bbox[0] for scene, _ in results) == list(range(6))
+    assert all((image == scene.bbox[0]).all() for scene, image in results)
+    assert sentinel_hub_server.max_in_flight == 2
+    assert sentinel_hub_server.tokens == 1
+
+
+def _catalog_tile(tile_id, when, cloud_cover):
+    """Catalog feature of one L1C tile."""
+    return {
+        "id": tile_id,
+        "properties": {"datetime": when, "eo:cloud_cover": cloud_cover},
+    }
+
+
+@pytest.fixture
+def toulon_catalog(sentinel_hub_server):
+    """Three passes over Toulon: clear, cloudy, and clear over two tiles."""
+    sentinel_hub_server.catalog = [
+        _catalog_tile("T31TGH_0105", "2026-01-05T10:27:31Z", 5.0),
+        _catalog_tile("T31TGH_0110", "2026-01-10T10:27:29Z", 90.0),
+        _catalog_tile("T31TGH_0115", "2026-01-15T10:27:35Z", 10.0),
+        _catalog_tile("T32TLP_0115", "2026-01-15T10:27:38Z", 20.0),
+    ]
+    return sentinel_hub_server
+
+
+def test_search_acquisitions_groups_passes(
+    toulon_catalog, toulon_bbox, monkeypatch, tmp_path
+):
+    """Test tiles of one pass merge and cloud cover is filtered as a ratio."""
+    from datetime import datetime
+
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    toulon_catalog.connect(sentinel, monkeypatch)
+
+    window = ("2026-01-01", "2026-01-31")
+    acquisitions = sentinel.search_acquisitions(toulon_bbox, window)
+    clear = sentinel.search_acquisitions(toulon_bbox, window, max_cloud_coverage=0.2)
+
+    assert [a.datetime.day for a in acquisitions] == [5, 10, 15]
+    assert acquisitions[0].datetime == datetime(2026, 1, 5, 10, 27, 31)
+    assert acquisitions[2].tile_ids == ("T31TGH_0115", "T32TLP_0115")
+    assert acquisitions[2].cloud_cover == pytest.approx(0.15)
+    assert [a.datetime.day for a in clear] == [5, 15]
+    # Settled windows are answered from the local metadata cache
+    assert toulon_catalog.searches == 1
+
+
+def test_search_acquisitions_open_window_not_cached(
+    sentinel_hub_server, toulon_bbox, monkeypatch, tmp_path
+):
+    """Test windows reaching into the present are always searched again."""
+    from datetime import date, timedelta
+
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    window = (str(date.today() - timedelta(days=5)), str(date.today()))
+    sentinel.search_acquisitions(toulon_bbox, window)
+    sentinel.search_acquisitions(toulon_bbox, window)
+
+    assert sentinel_hub_server.searches == 2
+
+
+def test_get_time_series_downloads_clear_acquisitions(
+    toulon_catalog, monkeypatch, tmp_path
+):
+    """Test only acquisitions passing the cloud filter are requested."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    toulon_catalog.connect(sentinel, monkeypatch)
+
+    series = list(
+        sentinel.get_time_series(
+            (5.85, 43.08, 6.05, 43.18),
+            ("2026-01-01", "2026-01-31"),
+            size=32,
+            response_format="tiff",
+        )
+    )
+
+    assert sorted(a.datetime.day for a, _ in series) == [5, 15]
+    assert all(image.shape == (32, 32, 3) for _, image in series)
+    windows = sorted(
+        payload["input"]["data"][0]["dataFilter"]["timeRange"]["from"]
+        for payload, _ in toulon_catalog.requests
+    )
+    assert windows == ["2026-01-05T09:57:31Z", "2026-01-15T09:57:35Z"]
+
+
+def test_get_scene_stack_single_request(toulon_catalog, monkeypatch, tmp_path):
+    """Test clear acquisitions come back as one (T, H, W, 3) stack."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    toulon_catalog.connect(sentinel, monkeypatch)
+
+    acquisitions, stack = sentinel.get_scene_stack(
+        (5.85, 43.08, 6.05, 43.18), ("2026-01-01", "2026-01-31"), size=32
+    )
+
+    assert [a.datetime.day for a in acquisitions] == [5, 15]
+    assert stack.shape == (2, 32, 32, 3)
+    assert stack.dtype == np.uint8
+    assert (stack[0] == 5).all() and (stack[1] == 6).all()
+
+    assert len(toulon_catalog.requests) == 1
+    payload, _ = toulon_catalog.requests[0]
+    assert '["2026-01-05", "2026-01-15"]' in payload["evalscript"]
+    assert payload["input"]["data"][0]["dataFilter"]["timeRange"] == {
+        "from": "2026-01-05T09:57:31Z",
+        "to": "2026-01-15T10:57:35Z",
+    }
+
+
+def test_get_scene_stack_latest_and_empty(toulon_catalog, monkeypatch, tmp_path):
+    """Test max_acquisitions keeps the latest and empty windows skip the request."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    toulon_catalog.connect(sentinel, monkeypatch)
+    bbox = (5.85, 43.08, 6.05, 43.18)
+
+    latest, stack = sentinel.get_scene_stack(
+        bbox, ("2026-01-01", "2026-01-31"), size=16, max_acquisitions=1
+    )
+    none, empty = sentinel.get_scene_stack(bbox, ("2026-02-01", "2026-02-28"), size=16)
+
+    assert [a.datetime.day for a in latest] == [15]
+    assert stack.shape == (1, 16, 16, 3)
+    assert none == [] and empty.shape == (0, 16, 16, 3)
+    assert len(toulon_catalog.requests) == 1
+
+    # More than available keeps every acquisition
+    more, stack = sentinel.get_scene_stack(
+        bbox, ("2026-01-01", "2026-01-31"), size=16, max_acquisitions=5
+    )
+    assert [a.datetime.day for a in more] == [5, 15]
+    assert stack.shape == (2, 16, 16, 3)
+    with pytest.raises(ValueError, match="max_acquisitions"):
+        sentinel.get_scene_stack(bbox, ("2026-01-01", "2026-01-31"), max_acquisitions=0)
+
+
+def test_get_scene_stack_one_frame_per_day(sentinel_hub_server, monkeypatch, tmp_path):
+    """Test two passes on one day share a frame and frames match orbit dates."""
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    sentinel_hub_server.catalog = [
+        _catalog_tile("T31TGH_0105", "2026-01-05T10:27:31Z", 5.0),
+        _catalog_tile("T31TGH_0115a", "2026-01-15T10:27:35Z", 10.0),
+        _catalog_tile("T31TGH_0115b", "2026-01-15T13:40:02Z", 10.0),
+    ]
+
+    acquisitions, stack = sentinel.get_scene_stack(
+        (5.85, 43.08, 6.05, 43.18), ("2026-01-01", "2026-01-31"), size=16
+    )
+
+    assert [a.datetime.hour for a in acquisitions] == [10, 13]
+    assert stack.shape == (2, 16, 16, 3)
+    ((payload, _),) = sentinel_hub_server.requests
+    evalscript = payload["evalscript"]
+    assert 'var DAYS = ["2026-01-05", "2026-01-15"];' in evalscript
+    assert "bands: 6" in evalscript
+    # ORBIT mosaicking exposes per-orbit dates as scenes.orbits[i].dateFrom
+    assert "DAYS.indexOf(scenes.orbits[i].dateFrom.slice(0, 10))" in evalscript
+    assert "scenes[i].date" not in evalscript
+    # Pixels outside the second pass keep the first pass of the day
+    assert '"dataMask"]' in evalscript
+    assert "if (t >= 0 && samples[i].dataMask)" in evalscript
+
+
+def test_get_scene_stack_cache(toulon_catalog, monkeypatch, tmp_path):
+    """Test a repeated stack is read from the scene cache."""
+    from pontos.cache import DiskCache
+    from pontos.config import config
+
+    monkeypatch.setattr(config, "data_dir", tmp_path)
+    cache = DiskCache(tmp_path / "scenes", max_bytes=1 << 20)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test", cache=cache)
+    toulon_catalog.connect(sentinel, monkeypatch)
+    args = ((5.85, 43.08, 6.05, 43.18), ("2026-01-01", "2026-01-31"))
+
+    _, first = sentinel.get_scene_stack(*args, size=16)
+    _, second = sentinel.get_scene_stack(*args, size=16)
+
+    np.testing.assert_array_equal(first, second)
+    assert len(toulon_catalog.requests) == 1
+    assert cache.stats.hits == 1
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_estimate_processing_units():
+    """Test PU estimates follow size, bands, samples and sample type."""
+    from pontos.sentinel import estimate_processing_units
+
+    assert estimate_processing_units(512, 512) == 1.0
+    assert estimate_processing_units(1024, 1024) == 4.0
+    assert estimate_processing_units(1024, 1024, samples=3) == 12.0
+    assert estimate_processing_units(512, 512, bands=6, float32=True) == 4.0
+    assert estimate_processing_units(10, 10) == 0.01
+
+
+def test_request_units_from_payload(sentinel_hub_server, monkeypatch):
+    """Test request costs are read from the Process API payload."""
+    from pontos.sentinel import (
+        EVALSCRIPT_TCI_STACK,
+        _request_units,
+    )
+
+    sentinel = SentinelDataSource(client_id="test", client_secret="test")
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    request = sentinel._scene_request(
+        (5.0, 43.0, 5.1, 43.1), ("2026-01-01", "2026-01-31"), (1024, 512), 0.2, "png"
+    )
+    download = request.download_list[0]
+    assert _request_units(download) == 2.0
+
+    download.post_values["evalscript"] = EVALSCRIPT_TCI_STACK % {
+        "days": '["2026-01-05", "2026-01-15"]',
+        "bands": 6,
+    }
+    assert _request_units(download) == 4.0
+
+
+def test_scheduler_token_bucket_paces_requests():
+    """Test requests beyond the burst wait for the bucket to refill."""
+    from pontos.sentinel import RequestScheduler
+
+    clock = FakeClock()
+    scheduler = RequestScheduler(
+        units_per_minute=60, burst=2, clock=clock, sleep=clock.sleep
+    )
+
+    starts = []
+    for _ in range(5):
+        scheduler.acquire(1)
+        starts.append(clock.now)
+        scheduler.release(1, spent=1)
+
+    # Two requests from the full bucket, then one unit per second
+    assert starts == pytest.approx([0, 0, 1, 2, 3])
+    assert scheduler.stats.requests == 5
+    assert scheduler.stats.units == 5
+
+
+def test_scheduler_reconciles_spent_units_and_large_requests():
+    """Test reported costs correct the bucket and oversized requests pass."""
+    from pontos.sentinel import RequestScheduler
+
+    clock = FakeClock()
+    scheduler = RequestScheduler(
+        units_per_minute=60, burst=4, clock=clock, sleep=clock.sleep
+    )
+
+    # Estimated 4 but charged 1: three units return to the bucket
+    scheduler.acquire(4)
+    scheduler.release(4, spent=1)
+    scheduler.acquire(3)
+    assert clock.now == 0
+    scheduler.release(3, spent=3)
+
+    # Larger than the bucket: waits for a full bucket, then goes into debt
+    scheduler.acquire(10)
+    assert clock.now == pytest.approx(4)
+    scheduler.release(10, spent=10)
+    scheduler.acquire(1)
+    assert clock.now == pytest.approx(11)
+
+
+def test_scheduler_refunds_failed_requests():
+    """Test a failed request returns its estimate to the bucket."""
+    from pontos.sentinel import RequestScheduler
+
+    clock = FakeClock()
+    scheduler = RequestScheduler(
+        units_per_minute=60, burst=4, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(3):
+        scheduler.acquire(4)
+        scheduler.release(4)
+
+    # Failures neither drain the bucket nor count as requests
+    assert clock.now == 0
+    assert scheduler.stats.requests == 0
+    assert scheduler.stats.units == 0
+
+
+def test_scheduler_throttling_pauses_all_requests():
+    """Test a 429 pauses every request and empties the bucket."""
+    from pontos.sentinel import RequestScheduler
+
+    clock = FakeClock()
+    scheduler = RequestScheduler(
+        units_per_minute=60, burst=5, backoff=0.0, clock=clock, sleep=clock.sleep
+    )
+
+    delay = scheduler.retry_delay(0, throttled=True, retry_after=2.0)
+    scheduler.acquire(1)
+
+    assert delay == 2.0
+    # Paused for Retry-After, then one second to earn a unit
+    assert clock.now == pytest.approx(3.0)
+    assert scheduler.stats.throttled == 1
+
+    # Server errors delay only the failed request, with bounded jitter
+    before = clock.now
+    delays = [scheduler.retry_delay(attempt, throttled=False) for attempt in range(8)]
+    assert all(0 <= d <= scheduler.max_backoff for d in delays)
+    assert clock.now == before
+
+
+def test_scheduler_bounds_concurrency(sentinel_hub_server, monkeypatch):
+    """Test the scheduler caps requests in flight below the thread count."""
+    from pontos.sentinel import RequestScheduler
+
+    sentinel_hub_server.delay = 0.2
+    sentinel = SentinelDataSource(
+        client_id="test",
+        client_secret="test",
+        scheduler=RequestScheduler(max_concurrency=2),
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    results = list(sentinel.get_scenes(_scene_requests(6), max_concurrency=6))
+
+    assert len(results) == 6
+    assert sentinel_hub_server.max_in_flight == 2
+
+
+def test_get_scenes_retries_throttling_and_server_errors(
+    sentinel_hub_server, monkeypatch
+):
+    """Test 429 and 5xx responses are retried until the downloads succeed."""
+    from pontos.sentinel import RequestScheduler
+
+    sentinel_hub_server.throttle = 2
+    sentinel_hub_server.retry_after = 50
+    sentinel_hub_server.errors = 1
+    scheduler = RequestScheduler(backoff=0.01)
+    sentinel = SentinelDataSource(
+        client_id="test", client_secret="test", scheduler=scheduler
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    results = dict(sentinel.get_scenes(_scene_requests(3), max_concurrency=1))
+
+    assert all((image == scene.bbox[0]).all() for scene, image in results.items())
+    assert sentinel_hub_server.statuses == [429, 429, 503, 200, 200, 200]
+    assert scheduler.stats.throttled == 2
+    assert scheduler.stats.retries == 3
+    assert scheduler.stats.requests == 3
+
+
+def test_server_error_retries_use_scheduler_sleep(sentinel_hub_server, monkeypatch):
+    """Test backoff after server errors sleeps through the scheduler."""
+    from pontos.sentinel import RequestScheduler
+
+    clock = FakeClock()
+    sentinel_hub_server.errors = 2
+    scheduler = RequestScheduler(backoff=5.0, clock=clock, sleep=clock.sleep)
+    sentinel = SentinelDataSource(
+        client_id="test", client_secret="test", scheduler=scheduler
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    monkeypatch.setattr("pontos.sentinel.random.uniform", lambda low, high: high)
+
+    results = list(sentinel.get_scenes(_scene_requests(1), max_concurrency=1))
+
+    assert len(results) == 1
+    assert sentinel_hub_server.statuses == [503, 503, 200]
+    # Full backoff of the first and second attempts
+    assert clock.now == pytest.approx(5.0 + 10.0)
+
+
+def test_single_scene_paths_use_scheduler(sentinel_hub_server, monkeypatch):
+    """Test single-scene and cloud-mask downloads are paced and retried."""
+    from pontos.sentinel import RequestScheduler
+
+    sentinel_hub_server.throttle = 2
+    sentinel_hub_server.retry_after = 50
+    scheduler = RequestScheduler(units_per_minute=600, backoff=0.01)
+    sentinel = SentinelDataSource(
+        client_id="test", client_secret="test", scheduler=scheduler
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    args = ((5.0, 43.0, 5.1, 43.1), ("2026-01-01", "2026-01-31"))
+
+    scene = sentinel.get_scene_array(*args, size=32, response_format="tiff")
+    sentinel.get_scene_with_clouds(*args, size=32)
+
+    assert (scene == 5).all()
+    assert sentinel_hub_server.statuses == [429, 429, 200, 200]
+    assert scheduler.stats.throttled == 2
+    assert scheduler.stats.requests == 2
+
+
+def test_get_scenes_gives_up_after_max_retries(sentinel_hub_server, monkeypatch):
+    """Test persistent server errors fail after the retry budget."""
+    import requests
+
+    from pontos.sentinel import RequestScheduler
+
+    sentinel_hub_server.errors = 10
+    sentinel = SentinelDataSource(
+        client_id="test",
+        client_secret="test",
+        scheduler=RequestScheduler(max_retries=2, backoff=0.01),
+    )
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+
+    with pytest.raises(requests.HTTPError, match="503"):
+        list(sentinel.get_scenes(_scene_requests(1)))
+    assert sentinel_hub_server.statuses == [503, 503, 503]
+
+
+def test_get_scene_with_clouds(sentinel_hub_server, monkeypatch, tmp_path):
+    """Test RGB and cloud probability come from one cached request."""
+    from pontos.cache import DiskCache
+
+    sentinel_hub_server.cloud = 204
+    cache = DiskCache(tmp_path / "scenes", max_bytes=1 << 20)
+    sentinel = SentinelDataSource(client_id="test", client_secret="test", cache=cache)
+    sentinel_hub_server.connect(sentinel, monkeypatch)
+    args = ((5.0, 43.0, 5.1, 43.1), ("2026-01-01", "2026-01-31"))
+
+    scene, clouds = sentinel.get_scene_with_clouds(*args, size=32)
+    again, _ = sentinel.get_scene_with_clouds(*args, size=32)
+
+    assert scene.shape == (32, 32, 3) and scene.dtype == np.uint8
+    assert (scene == 5).all()
+    assert clouds.shape == (32, 32) and clouds.dtype == np.float32
+    np.testing.assert_allclose(clouds, 0.8)
+    np.testing.assert_array_equal(again, scene)
+
+    assert len(sentinel_hub_server.requests) == 1
+    payload, _ = sentinel_hub_server.requests[0]
+    assert '"CLP"' in payload["evalscript"]
+    assert payload["output"]["responses"][0]["format"]["type"] == "image/tiff"
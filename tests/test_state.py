@@ -0,0 +1,45 @@
+"""Tests for the incremental monitoring state store."""
+
+from datetime import datetime
+
+from pontos.sentinel import Acquisition
+from pontos.state import MonitorState, aoi_key
+
+
+def _acquisition(day, hour=10):
+    return Acquisition(datetime(2026, 1, day, hour, 27, 31), 0.1, ("T31TGH",))
+
+
+def test_aoi_key_is_canonical():
+    """Test equal bboxes map to the same key regardless of number types."""
+    assert aoi_key((5.85, 43.08, 6.05, 43.18)) == "5.85,43.08,6.05,43.18"
+    assert aoi_key((5, 43, 6, 44)) == aoi_key((5.0, 43.0, 6.0, 44.0))
+
+
+def test_record_and_query(tmp_path):
+    """Test processed acquisitions are tracked per area."""
+    with MonitorState(tmp_path / "state" / "monitor.sqlite") as state:
+        assert state.last_processed("toulon") is None
+
+        state.record("toulon", _acquisition(15), 3, tmp_path / "a.geojson")
+        state.record("toulon", _acquisition(5), 0)
+        state.record("brest", _acquisition(20), 1)
+
+        assert state.processed("toulon") == {
+            datetime(2026, 1, 5, 10, 27, 31),
+            datetime(2026, 1, 15, 10, 27, 31),
+        }
+        assert state.last_processed("toulon") == datetime(2026, 1, 15, 10, 27, 31)
+
+
+def test_state_persists_and_record_is_idempotent(tmp_path):
+    """Test state survives reopening and re-recording does not duplicate."""
+    path = tmp_path / "monitor.sqlite"
+    with MonitorState(path) as state:
+        state.record("toulon", _acquisition(5), 2)
+
+    with MonitorState(path) as state:
+        state.record("toulon", _acquisition(5), 4)
+        rows = state._conn.execute("SELECT detections FROM acquisitions").fetchall()
+
+    assert rows == [(4,)]
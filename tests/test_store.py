@@ -0,0 +1,167 @@
+"""Tests for the spatial detection store."""
+
+import importlib.util
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pontos.detections import Detections
+from pontos.geo import GeoExporter
+from pontos.store import DetectionStore
+
+BBOX = (5.0, 43.0, 6.0, 44.0)
+SIZE = (1000, 1000)
+
+
+def _detections(centers, conf=0.5):
+    """Detections with 10 px boxes around the given pixel centers."""
+    centers = np.asarray(centers, dtype=np.float32)
+    return Detections(
+        np.hstack([centers - 5, centers + 5]),
+        np.full(len(centers), conf),
+        np.zeros(len(centers)),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store holding three passes over the same area."""
+    with DetectionStore(tmp_path / "detections.gpkg") as store:
+        # Pixel (100, 100) is (5.1, 43.9), pixel (900, 900) is (5.9, 43.1)
+        store.add(
+            _detections([[100, 100], [900, 900]]),
+            BBOX,
+            SIZE,
+            datetime(2026, 1, 5, 10, 27),
+            "toulon",
+        )
+        store.add(
+            _detections([[100, 100]], conf=0.9),
+            BBOX,
+            SIZE,
+            datetime(2026, 1, 10, 10, 27),
+            "toulon",
+        )
+        store.add(
+            _detections([[600, 600]]),
+            BBOX,
+            SIZE,
+            datetime(2026, 1, 15, 10, 27),
+            "brest",
+        )
+        yield store
+
+
+def test_query_filters(store):
+    """Test bbox, time range, area and confidence filters combine."""
+    north_west = (5.0, 43.5, 5.5, 44.0)
+
+    assert store.count() == 4
+    found = store.query(bbox=north_west)
+    assert [d.acquired.day for d in found] == [5, 10]
+    assert found[0].lon == pytest.approx(5.1) and found[0].lat == pytest.approx(43.9)
+    assert found[0].class_name == "vessel" and found[0].aoi == "toulon"
+
+    assert store.count(bbox=north_west, time_range=("2026-01-06", "2026-01-31")) == 1
+    assert store.count(min_confidence=0.8) == 1
+    assert store.count(aoi="brest") == 1
+    assert store.count(bbox=(7.0, 43.0, 8.0, 44.0)) == 0
+
+
+def test_iter_query_streams_matches(store):
+    """Test the iterator yields the same detections as query()."""
+    found = store.iter_query(time_range=("2026-01-01", "2026-01-10"))
+
+    assert not isinstance(found, list)
+    assert list(found) == store.query(time_range=("2026-01-01", "2026-01-10"))
+    assert [d.acquired.day for d in store.iter_query(aoi="brest")] == [15]
+
+
+def test_query_merges_duplicates(store):
+    """Test repeated detections of a vessel merge onto the most confident."""
+    merged = store.query(merge_distance=50.0)
+    assert len(merged) == 3
+    assert [d.confidence for d in merged] == [0.5, pytest.approx(0.9), 0.5]
+    assert [d.acquired.day for d in merged] == [5, 10, 15]
+
+    # The two passes over (5.1, 43.9) are five days apart
+    assert len(store.query(merge_distance=50.0, merge_window=timedelta(days=1))) == 4
+
+
+def test_query_time_bounds(store):
+    """Test a date-only end includes its day and datetime ends are inclusive."""
+    assert store.count(time_range=("2026-01-01", "2026-01-10")) == 3
+    assert store.count(time_range=("2026-01-11", "2026-01-14")) == 0
+    end = datetime(2026, 1, 10, 10, 27)
+    assert store.count(time_range=(datetime(2026, 1, 10), end)) == 1
+    assert store.count(time_range=("2026-01-10", end.isoformat())) == 1
+    assert store.count(time_range=("2026-01-10", "2026-01-10T10:26:59")) == 0
+
+
+def test_wide_bbox_matches_rtree_path(store):
+    """Test the time-index plan for wide boxes returns the same rows."""
+    window = ("2026-01-05", "2026-01-05")
+    wide = store.query(bbox=(0.0, 40.0, 10.0, 50.0), time_range=window)
+    narrow = store.query(bbox=(5.8, 43.0, 6.0, 43.2), time_range=window)
+
+    assert len(wide) == 2
+    assert [d.id for d in narrow] == [wide[1].id]
+
+
+def test_add_is_one_transaction_and_persists(store, tmp_path):
+    """Test runs are recorded, empty runs are fine and data survives reopening."""
+    run_id = store.add(Detections.empty(), BBOX, SIZE, datetime(2026, 2, 1), "x")
+    assert run_id == 4
+    store.close()
+
+    with DetectionStore(tmp_path / "detections.gpkg") as reopened:
+        assert reopened.count() == 4
+        (runs,) = reopened._conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+        assert runs == 4
+
+
+def test_geopackage_layout(store):
+    """Test the file identifies as a GeoPackage with an R-tree indexed layer."""
+    conn = store._conn
+    assert conn.execute("PRAGMA application_id").fetchone()[0] == 0x47504B47
+    assert conn.execute(
+        "SELECT min_x, min_y, max_x, max_y FROM gpkg_contents"
+    ).fetchone() == pytest.approx((5.1, 43.1, 5.9, 43.9))
+    (rtree,) = conn.execute("SELECT COUNT(*) FROM rtree_detections_geom").fetchone()
+    assert rtree == 4
+
+    # GeoPackage blob: 'GP' header then the WKB point
+    (blob,) = conn.execute("SELECT geom FROM detections LIMIT 1").fetchone()
+    assert blob[:2] == b"GP" and len(blob) == 29
+    assert np.frombuffer(blob[13:], "<f8") == pytest.approx([5.1, 43.9])
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyogrio") is None, reason="pyogrio not installed"
+)
+def test_gdal_reads_store(store):
+    """Test GDAL opens the store as a point layer."""
+    from pyogrio import read_info
+
+    info = read_info(store.path, layer="detections")
+    assert info["geometry_type"] == "Point"
+    assert info["features"] == 4
+    assert "EPSG:4326" in info["crs"]
+
+
+def test_dict_detections(tmp_path):
+    """Test classic detection dictionaries are stored with their class."""
+    centers = GeoExporter.pixels_to_geo([[250, 250]], BBOX, SIZE)
+    with DetectionStore(tmp_path / "d.gpkg") as store:
+        store.add(
+            [{"center": [250, 250], "confidence": 0.7, "class": "tanker"}],
+            BBOX,
+            SIZE,
+            datetime(2026, 1, 1),
+            "toulon",
+        )
+        (found,) = store.query()
+
+    assert found.class_name == "tanker"
+    assert (found.lon, found.lat) == pytest.approx(tuple(centers[0]))
@@ -0,0 +1,122 @@
+"""Tests for linking detections into vessel tracks."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pontos.tracking import Track, TrackLinker, _assign
+
+# One metre in degrees of latitude
+METRE = 1 / 111_195
+
+START = datetime(2026, 1, 5, 10, 27)
+
+
+def test_links_moving_vessels():
+    """Test vessels are followed across acquisitions by position."""
+    linker = TrackLinker(distance=100.0, max_speed=10.0)
+    # Two vessels sailing north at 5 m/s, observed every 10 minutes
+    for step in range(4):
+        north = step * 3000 * METRE
+        coords = [[5.9, 43.1 + north], [5.95, 43.1 + north]]
+        if step % 2:
+            coords = coords[::-1]
+        assert (
+            linker.update(coords, [0.5, 0.6], START + step * timedelta(minutes=10))
+            == []
+        )
+
+    tracks = linker.finish()
+    assert [len(track) for track in tracks] == [4, 4]
+    assert [lon for lon, _ in tracks[0].coords] == [5.9] * 4
+    assert tracks[0].times[-1] == START + timedelta(minutes=30)
+    assert linker.active == 0
+
+
+def test_gate_grows_with_time():
+    """Test a detection is only linked if reachable at max_speed."""
+    linker = TrackLinker(distance=100.0, max_speed=5.0, min_points=1)
+    linker.update([[5.9, 43.1]], [0.5], START)
+    # 5 km in 10 minutes needs 8.3 m/s
+    linker.update([[5.9, 43.1 + 5000 * METRE]], [0.5], START + timedelta(minutes=10))
+    assert linker.active == 2
+    # 5 km on from there in 20 minutes needs 4.2 m/s
+    linker.update([[5.9, 43.1 + 10000 * METRE]], [0.5], START + timedelta(minutes=30))
+
+    assert sorted(len(track) for track in linker.finish()) == [1, 2]
+
+
+def test_closest_pairs_win():
+    """Test contested detections go to the nearest track."""
+    linker = TrackLinker(distance=500.0, max_speed=0.0)
+    linker.update([[5.9, 43.1], [5.9, 43.1 + 400 * METRE]], [0.5, 0.5], START)
+    linker.update(
+        [[5.9, 43.1 + 350 * METRE], [5.9, 43.1 + 50 * METRE]],
+        [0.7, 0.8],
+        START + timedelta(days=1),
+    )
+
+    first, second = linker.finish()
+    assert first.coords[1][1] == pytest.approx(43.1 + 50 * METRE)
+    assert second.coords[1][1] == pytest.approx(43.1 + 350 * METRE)
+    assert first.confidence == [0.5, 0.8]
+
+
+def test_prediction_separates_crossing_vessels():
+    """Test vessels passing each other keep their tracks."""
+    linker = TrackLinker(distance=100.0, max_speed=10.0)
+    # East- and westbound at 2 km per 10 minutes, passing between the last
+    # two acquisitions, when each is nearer the other's previous position
+    for step, (east, west) in enumerate([(-2000, 5000), (0, 3000), (2000, 1000)]):
+        coords = [[5.9, 43.1 + east * METRE], [5.9, 43.1 + west * METRE]]
+        linker.update(coords, [0.5, 0.5], START + step * timedelta(minutes=10))
+
+    eastbound, westbound = linker.finish()
+    assert [lat for _, lat in eastbound.coords] == pytest.approx(
+        [43.1 + north * METRE for north in (-2000, 0, 2000)]
+    )
+    assert westbound.coords[-1][1] == pytest.approx(43.1 + 1000 * METRE)
+
+
+def test_max_gap_finishes_tracks():
+    """Test tracks unseen for too long are handed back and dropped if short."""
+    linker = TrackLinker(max_gap=timedelta(days=2))
+    linker.update([[5.9, 43.1], [6.5, 43.5]], [0.5, 0.5], START)
+    linker.update([[5.9, 43.1]], [0.5], START + timedelta(days=1))
+
+    finished = linker.update([], [], START + timedelta(days=4))
+    assert [len(track) for track in finished] == [2]
+    assert finished[0].to_linestring().length == 0.0
+    assert linker.active == 0
+
+
+def test_rejects_out_of_order_batches():
+    """Test batches must arrive in time order."""
+    linker = TrackLinker()
+    linker.update([[5.9, 43.1]], [0.5], START)
+    with pytest.raises(ValueError, match="time order"):
+        linker.update([[5.9, 43.1]], [0.5], START - timedelta(hours=1))
+
+
+def test_track_linestring():
+    """Test tracks convert to LineStrings."""
+    track = Track(7, [START, START], [(5.9, 43.1), (5.95, 43.1)], [0.5, 0.6])
+    assert track.to_linestring().coords[:] == [(5.9, 43.1), (5.95, 43.1)]
+
+
+def test_assign_matches_sequential_greedy():
+    """Test the round-based solver accepts what one-by-one greedy does."""
+    rng = np.random.default_rng(0)
+    rows, columns = rng.integers(0, 40, 300), rng.integers(0, 40, 300)
+    cost = rng.integers(0, 50, 300).astype(float)
+
+    used_rows, used_columns, expected = set(), set(), set()
+    for idx in np.argsort(cost, kind="stable"):
+        if rows[idx] not in used_rows and columns[idx] not in used_columns:
+            used_rows.add(rows[idx])
+            used_columns.add(columns[idx])
+            expected.add((int(rows[idx]), int(columns[idx])))
+
+    matched_rows, matched_columns = _assign(rows, columns, cost)
+    assert set(zip(matched_rows.tolist(), matched_columns.tolist())) == expected